@@ -44,10 +44,16 @@ class Settings:
     mysql_user: str = os.getenv("MYSQL_USER", "root")
     mysql_password: str = os.getenv("MYSQL_PASSWORD", "")
     mysql_db: str = os.getenv("MYSQL_DB", "unigo_db")
+    # 전체 SQLAlchemy URL 직접 지정 (예: sqlite:///backend/data/unigo.db). 설정 시 MYSQL_* 무시
+    database_url_override: str = os.getenv("DATABASE_URL", "")
+    # Major JSON 컬럼 저장 형식: json(LONGTEXT) | packed(zstd + msgpack, json_packed 컬럼)
+    major_json_storage: str = os.getenv("MAJOR_JSON_STORAGE", "json")
 
     @property
     def database_url(self) -> str:
         """SQLAlchemy용 Database Connection URL 생성"""
+        if self.database_url_override:
+            return self.database_url_override
         # 패스워드가 있는 경우와 없는 경우 처리
         if self.mysql_password:
             return f"mysql+pymysql://{self.mysql_user}:{self.mysql_password}@{self.mysql_host}:{self.mysql_port}/{self.mysql_db}"
@@ -56,8 +62,31 @@ class Settings:
     # LLM 설정
     llm_provider: str = os.getenv(
         "LLM_PROVIDER", "openai"
-    )  # LLM 제공자: openai, ollama, huggingface
+    )  # LLM 제공자: openai, ollama, huggingface, scripted(부하 테스트용)
     model_name: str = os.getenv("MODEL_NAME", "gpt-4o-mini")  # 사용할 모델 이름
+    llm_input_cost_per_1m: float = float(
+        os.getenv("LLM_INPUT_COST_PER_1M", "0") or "0"
+    )  # 입력 토큰 100만 개당 비용 (USD, 0이면 비용을 계산하지 않음)
+    llm_output_cost_per_1m: float = float(
+        os.getenv("LLM_OUTPUT_COST_PER_1M", "0") or "0"
+    )  # 출력 토큰 100만 개당 비용 (USD)
+
+    # 스크립트 기반 가짜 LLM 설정 (LLM_PROVIDER=scripted, 부하 테스트용)
+    scripted_llm_script: str = os.getenv(
+        "SCRIPTED_LLM_SCRIPT", ""
+    )  # 턴 스크립트 JSON 경로 (비우면 아래 값으로 "툴 1회 호출 → 답변" 스크립트 생성)
+    scripted_llm_tool: str = os.getenv(
+        "SCRIPTED_LLM_TOOL", "get_search_help"
+    )  # 첫 턴에 호출할 툴 이름 (비우면 툴 호출 없이 바로 답변)
+    scripted_llm_answer_tokens: int = int(
+        os.getenv("SCRIPTED_LLM_ANSWER_TOKENS", "150")
+    )  # 답변 토큰 수
+    scripted_llm_first_token_ms: float = float(
+        os.getenv("SCRIPTED_LLM_FIRST_TOKEN_MS", "300")
+    )  # 호출마다 첫 토큰(또는 tool_call)까지의 지연 (ms)
+    scripted_llm_token_ms: float = float(
+        os.getenv("SCRIPTED_LLM_TOKEN_MS", "20")
+    )  # 토큰 간 지연 (ms)
 
     # 임베딩 설정
     embedding_model_name: str = os.getenv(
@@ -76,6 +105,76 @@ class Settings:
     pinecone_namespace: str = os.getenv("PINECONE_NAMESPACE", "majors")
     pinecone_dimension: int = int(os.getenv("PINECONE_DIMENSION", "0") or "0")
 
+    # 벡터 검색 백엔드: pinecone(기본) | local (snapshot 파일을 mmap으로 읽어 로컬에서 검색)
+    vector_backend: str = os.getenv("VECTOR_BACKEND", "pinecone")
+    vector_snapshot_path: str = os.getenv(
+        "VECTOR_SNAPSHOT_PATH", ""
+    )  # 사용할 snapshot 디렉토리 (비우면 {VECTORSTORE_DIR}/snapshots의 최신 버전)
+
+    # 임베딩/업서트 파이프라인 설정 (벡터 인덱싱 스크립트용)
+    ingest_batch_size: int = int(
+        os.getenv("INGEST_BATCH_SIZE", "100")
+    )  # 한 번에 임베딩/업서트할 문서 수
+    ingest_max_workers: int = int(
+        os.getenv("INGEST_MAX_WORKERS", "4")
+    )  # 동시에 처리할 배치 수 (스레드 풀 크기)
+    ingest_max_retries: int = int(
+        os.getenv("INGEST_MAX_RETRIES", "5")
+    )  # 일시적 오류(429, 5xx, 네트워크) 재시도 횟수
+
+    # LLM 호출 스케줄러 설정 (프로세스 단위 동시 실행 제한)
+    llm_max_concurrency: int = int(
+        os.getenv("LLM_MAX_CONCURRENCY", "8")
+    )  # 동시에 실행 가능한 LLM 호출 수
+    llm_per_user_concurrency: int = int(
+        os.getenv("LLM_PER_USER_CONCURRENCY", "2")
+    )  # 사용자 한 명이 동시에 실행할 수 있는 LLM 호출 수 (같은 수만큼 추가 대기 가능)
+    llm_queue_size: int = int(
+        os.getenv("LLM_QUEUE_SIZE", "32")
+    )  # 우선순위 클래스별 최대 대기열 길이 (초과 시 즉시 거절)
+    llm_queue_timeout: float = float(
+        os.getenv("LLM_QUEUE_TIMEOUT", "30")
+    )  # 대기열에서 기다리는 최대 시간 (초)
+
+    # 로깅 파이프라인 설정 (backend/log_pipeline.py, backend/db/connection.py)
+    log_queue_size: int = int(
+        os.getenv("LOG_QUEUE_SIZE", "10000")
+    )  # 백그라운드 기록 대기 레코드 수 (가득 차면 버림)
+    backend_log_sample_rate: float = float(
+        os.getenv("BACKEND_LOG_SAMPLE_RATE", "1.0")
+    )  # backend 로거(툴 로그 등) INFO 이하 레코드 기록 비율 (WARNING 이상은 항상 기록)
+    sql_log_mode: str = os.getenv(
+        "SQL_LOG_MODE", "slow"
+    )  # SQL 로그: off | slow (SQL_LOG_SLOW_MS 이상만) | all (느린 쿼리 + 나머지는 샘플링)
+    sql_log_slow_ms: float = float(
+        os.getenv("SQL_LOG_SLOW_MS", "200")
+    )  # 느린 쿼리 기준 (ms)
+    sql_log_sample_rate: float = float(
+        os.getenv("SQL_LOG_SAMPLE_RATE", "1.0")
+    )  # all 모드에서 기준보다 빠른 쿼리의 기록 비율 (0~1)
+    sql_log_params: bool = (
+        os.getenv("SQL_LOG_PARAMS", "False") == "True"
+    )  # 쿼리 파라미터도 기록할지 여부
+
+    # 요청 단위 트레이싱 설정 (backend/tracing.py)
+    trace_export_path: str = os.getenv(
+        "TRACE_EXPORT_PATH", ""
+    )  # span을 JSON Lines로 기록할 파일 경로 (비우면 비활성화)
+    trace_sample_rate: float = float(
+        os.getenv("TRACE_SAMPLE_RATE", "1.0")
+    )  # 기록할 채팅 턴의 비율 (0~1)
+
+    # 워커 워밍업 설정 (backend/warmup.py, unigo/gunicorn.conf.py)
+    warmup_on_boot: bool = (
+        os.getenv("WARMUP_ON_BOOT", "True") == "True"
+    )  # gunicorn 워커가 요청을 받기 전에 워밍업 실행
+    warmup_query: str = os.getenv(
+        "WARMUP_QUERY", "컴퓨터공학과"
+    )  # 워밍업 마지막 단계에서 끝까지 실행할 검색 질의 (list_departments)
+    warmup_skip: str = os.getenv(
+        "WARMUP_SKIP", ""
+    )  # 건너뛸 워밍업 단계 (쉼표 구분, 예: query)
+
 
 def get_settings() -> Settings:
     """
@@ -97,14 +196,25 @@ def get_llm():
       - openai: OpenAI API 또는 호환 서버 (vLLM, Together AI 등)
       - ollama: 로컬 Ollama 서버
       - huggingface: Hugging Face Inference API
+      - scripted: 스크립트대로 tool_calls/토큰을 내보내는 가짜 모델 (부하 테스트용, 네트워크 불필요)
 
     Returns:
-        LangChain ChatModel 인스턴스 (ChatOpenAI, ChatOllama, ChatHuggingFace 중 하나)
+        LangChain ChatModel 인스턴스 (ChatOpenAI, ChatOllama, ChatHuggingFace, ScriptedChatModel 중 하나)
 
     Raises:
         ValueError: 지원하지 않는 LLM_PROVIDER가 설정된 경우
     """
+    from backend.llm_metrics import LLMMetricsCallback
+
     settings = get_settings()
+    llm = _create_llm(settings)
+    # 호출 시간/토큰 지표 수집 (/metrics). bind_tools()로 감싼 모델에도 그대로 적용됨
+    llm.callbacks = [*(llm.callbacks or []), LLMMetricsCallback(settings.model_name)]
+    return llm
+
+
+def _create_llm(settings: Settings):
+    """LLM_PROVIDER에 맞는 ChatModel 인스턴스를 생성합니다."""
     provider = settings.llm_provider.lower()
 
     if provider == "openai":
@@ -122,12 +232,15 @@ def get_llm():
                 base_url=base_url,  # OpenAI 호환 API 서버 주소
                 api_key=settings.openai_api_key,
                 temperature=0.1,  # 툴 호출 신뢰성을 위해 낮은 온도 사용
+                # base_url을 지정하면 stream_usage 기본값이 None이라 스트리밍 응답에 사용량이 없음 (UsageTracker)
+                stream_usage=True,
             )
         else:
             # 공식 OpenAI API 사용
             return ChatOpenAI(
                 model=settings.model_name,
                 temperature=0.1,  # 툴 호출 신뢰성을 위해 낮은 온도 사용
+                stream_usage=True,  # 스트리밍 응답에도 usage_metadata 포함 (UsageTracker)
             )
 
     elif provider == "ollama":
@@ -164,11 +277,17 @@ def get_llm():
         )
         return ChatHuggingFace(llm=endpoint)
 
+    elif provider == "scripted":
+        # 부하 테스트용: SCRIPTED_LLM_* 설정(또는 스크립트 파일)대로 지연을 두고 응답
+        from backend.scripted_llm import ScriptedChatModel
+
+        return ScriptedChatModel.from_settings(settings)
+
     else:
         # 지원하지 않는 제공자
         raise ValueError(
             f"Unsupported LLM_PROVIDER: {settings.llm_provider}. "
-            "Use one of ['openai', 'ollama', 'huggingface']."
+            "Use one of ['openai', 'ollama', 'huggingface', 'scripted']."
         )
 
 
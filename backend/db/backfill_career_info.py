@@ -0,0 +1,98 @@
+"""
+majors.career_info 백필 스크립트
+
+원본 major_detail.json 없이, 이미 적재된 majors 행에서 진로 정보 문서(career_info)를 계산하여 채웁니다.
+(seed_majors.py를 다시 실행해도 같은 값이 채워지므로 원본 JSON이 있다면 그쪽을 사용해도 됩니다)
+
+1. majors 테이블에 career_info 컬럼이 없으면 추가 (MySQL: LONGTEXT)
+2. career_info가 비어 있는 행을 청크 단위로 읽어 build_career_info() 결과를 저장
+3. --all: 이미 채워진 행도 다시 계산 (career_info.py의 문서 구조를 바꾼 경우)
+
+사용법:
+    python backend/db/backfill_career_info.py
+    python backend/db/backfill_career_info.py --all
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# 백엔드 모듈 임포트를 위해 프로젝트 루트 경로 추가
+current_dir = Path(__file__).resolve().parent
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from sqlalchemy import bindparam, update
+
+from backend.db.connection import SessionLocal, engine
+from backend.db.models import Major
+from backend.db.schema import ensure_column
+from backend.rag.career_info import build_career_info
+
+
+def _row_to_career_info(row: Major) -> str:
+    info = build_career_info(
+        SimpleNamespace(
+            job=row.job,
+            enter_field=row.json_value("enter_field"),
+            career_act=row.json_value("career_act"),
+            qualifications=row.qualifications,
+            main_subject=row.json_value("main_subject"),
+            chart_data=row.json_value("chart_data"),
+        )
+    )
+    return json.dumps(info, ensure_ascii=False)
+
+
+def backfill(chunk_size: int = 200, rebuild_all: bool = False) -> int:
+    """career_info를 채우고 처리한 행 수를 반환합니다."""
+    stmt = (
+        update(Major.__table__)
+        .where(Major.__table__.c.id == bindparam("_id"))
+        .values(career_info=bindparam("_career_info"))
+    )
+
+    total = 0
+    last_id = 0
+    started = time.perf_counter()
+    while True:
+        session = SessionLocal()
+        try:
+            query = session.query(Major).filter(Major.id > last_id)
+            if not rebuild_all:
+                query = query.filter(Major.career_info.is_(None))
+            rows = query.order_by(Major.id).limit(chunk_size).all()
+            params = [
+                {"_id": row.id, "_career_info": _row_to_career_info(row)}
+                for row in rows
+            ]
+        finally:
+            session.close()
+        if not rows:
+            break
+
+        with engine.begin() as conn:
+            conn.execute(stmt, params)
+
+        total += len(rows)
+        last_id = rows[-1].id
+        elapsed = time.perf_counter() - started
+        print(f"Backfilled {total} rows ({total / elapsed if elapsed > 0 else 0:.0f} rows/sec)")
+    return total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill majors.career_info")
+    parser.add_argument(
+        "--all", action="store_true", help="이미 채워진 행도 다시 계산"
+    )
+    parser.add_argument("--chunk-size", type=int, default=200, help="청크당 행 수")
+    args = parser.parse_args()
+
+    if ensure_column(Major.__table__, "career_info"):
+        print("🛠️  Added majors.career_info column.")
+    count = backfill(args.chunk_size, rebuild_all=args.all)
+    print(f"✅ Backfilled career_info for {count} rows.")
@@ -0,0 +1,223 @@
+"""
+DB 종류별 다중 행 업서트(Upsert) 유틸리티
+
+행마다 SELECT → UPDATE/INSERT를 반복하면 데이터 수만큼 왕복이 발생합니다.
+bulk_upsert()는 행을 청크로 묶어 청크당 한 번의 다중 행 INSERT 문으로 처리합니다.
+
+** DB별 SQL **
+- MySQL/MariaDB : INSERT ... VALUES (...), (...) ON DUPLICATE KEY UPDATE col = VALUES(col)
+- SQLite/PostgreSQL : INSERT ... VALUES (...), (...) ON CONFLICT (key) DO UPDATE SET col = excluded.col
+- 그 외 : session.merge()와 동일한 동작 (행 단위, 느림)
+
+sync_rows()는 기존 키를 한 번에 읽어 INSERT/UPDATE 대상을 나눈 뒤 executemany로 반영합니다.
+(값이 바뀐 행만 UPDATE하므로 재시딩 시 불필요한 쓰기가 없음)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import Table, and_, bindparam, or_, select
+from sqlalchemy.engine import Connection
+
+# SQLite 바인드 변수 최대 개수 (3.32 이상 기본값 32766, 이전 버전은 999)
+SQLITE_MAX_VARIABLES = 32766
+
+
+def _dedupe(rows: Sequence[dict[str, Any]], key_columns: Sequence[str]) -> list[dict]:
+    """
+    같은 키가 한 청크에 여러 번 나오면 마지막 행만 남깁니다.
+    (PostgreSQL은 한 문장에서 같은 행을 두 번 갱신하면 오류가 발생함)
+    """
+    unique: dict[tuple, dict[str, Any]] = {}
+    for row in rows:
+        unique[tuple(row[col] for col in key_columns)] = row
+    return list(unique.values())
+
+
+def _chunk_size_for(dialect: str, chunk_size: int, num_columns: int) -> int:
+    if dialect == "sqlite":
+        return max(1, min(chunk_size, SQLITE_MAX_VARIABLES // max(num_columns, 1)))
+    return chunk_size
+
+
+def bulk_upsert(
+    conn: Connection,
+    table: Table,
+    rows: Iterable[dict[str, Any]],
+    key_columns: Sequence[str],
+    chunk_size: int = 500,
+) -> int:
+    """
+    rows를 청크 단위 다중 행 INSERT ... ON DUPLICATE KEY UPDATE로 업서트합니다.
+
+    Args:
+        conn: SQLAlchemy Connection (트랜잭션 관리는 호출하는 쪽에서 담당)
+        table: 대상 테이블 (예: Major.__table__)
+        rows: 컬럼명 → 값 딕셔너리. 모든 행의 키 구성이 같아야 합니다.
+        key_columns: 중복 판단 기준 컬럼 (UNIQUE 제약이 있어야 함, 예: ["major_id"])
+        chunk_size: 한 문장에 넣을 최대 행 수
+
+    Returns:
+        int: 실행한 행 수 (청크 내 중복 제거 후 기준)
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+
+    dialect = conn.dialect.name
+    columns = list(rows[0].keys())
+    update_columns = [col for col in columns if col not in key_columns]
+    size = _chunk_size_for(dialect, chunk_size, len(columns))
+
+    written = 0
+    for start in range(0, len(rows), size):
+        chunk = _dedupe(rows[start : start + size], key_columns)
+
+        if dialect in ("mysql", "mariadb"):
+            from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+            stmt = mysql_insert(table).values(chunk)
+            stmt = stmt.on_duplicate_key_update(
+                {col: stmt.inserted[col] for col in update_columns}
+            )
+            conn.execute(stmt)
+        elif dialect in ("sqlite", "postgresql"):
+            if dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+            stmt = dialect_insert(table).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(key_columns),
+                set_={col: stmt.excluded[col] for col in update_columns},
+            )
+            conn.execute(stmt)
+        else:
+            _upsert_fallback(conn, table, chunk, key_columns, update_columns)
+
+        written += len(chunk)
+
+    return written
+
+
+def _upsert_fallback(
+    conn: Connection,
+    table: Table,
+    rows: list[dict[str, Any]],
+    key_columns: Sequence[str],
+    update_columns: Sequence[str],
+) -> None:
+    """업서트 구문을 지원하지 않는 DB용: 존재하는 키를 한 번에 조회한 뒤 UPDATE/INSERT로 나눕니다."""
+    key_cols = [table.c[col] for col in key_columns]
+
+    def key_of(row: dict[str, Any]) -> tuple:
+        return tuple(row[col] for col in key_columns)
+
+    def match(key: tuple):
+        return and_(*(col == value for col, value in zip(key_cols, key)))
+
+    if len(key_cols) == 1:
+        condition = key_cols[0].in_([row[key_columns[0]] for row in rows])
+    else:
+        # 복합 키는 (a = ? AND b = ?) OR ... 로 조회 (튜플 IN을 지원하지 않는 DB 대응)
+        condition = or_(*(match(key_of(row)) for row in rows))
+    existing = {tuple(row) for row in conn.execute(select(*key_cols).where(condition))}
+
+    inserts = [row for row in rows if key_of(row) not in existing]
+    updates = [row for row in rows if key_of(row) in existing]
+    if inserts:
+        conn.execute(table.insert(), inserts)
+    for row in updates:
+        conn.execute(
+            table.update()
+            .where(match(key_of(row)))
+            .values({col: row[col] for col in update_columns})
+        )
+
+
+@dataclass
+class SyncResult:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
+    def summary(self) -> str:
+        return (
+            f"inserted={self.inserted}, updated={self.updated}, "
+            f"unchanged={self.unchanged}"
+        )
+
+
+def sync_rows(
+    conn: Connection,
+    table: Table,
+    rows: Iterable[dict[str, Any]],
+    key_column: str,
+    chunk_size: int = 1000,
+) -> SyncResult:
+    """
+    집합 단위(set-based) 업서트: 기존 행을 한 번의 쿼리로 읽어 INSERT/UPDATE 대상을 계산한 뒤
+    executemany로 청크 단위 반영합니다. 값이 같은 행은 갱신하지 않습니다.
+
+    카테고리/대학처럼 행 수가 적은 테이블에 적합합니다 (기존 행 전체를 메모리에 읽음).
+    모든 DB에서 동일한 SQL(INSERT / UPDATE ... WHERE key = ?)을 사용합니다.
+
+    Args:
+        conn: SQLAlchemy Connection (트랜잭션 관리는 호출하는 쪽에서 담당)
+        table: 대상 테이블
+        rows: 컬럼명 → 값 딕셔너리. 모든 행의 키 구성이 같아야 합니다.
+        key_column: 중복 판단 기준 컬럼 (UNIQUE)
+        chunk_size: executemany 한 번에 넘길 최대 행 수
+    """
+    rows = _dedupe(list(rows), [key_column])
+    result = SyncResult()
+    if not rows:
+        return result
+
+    columns = list(rows[0].keys())
+    update_columns = [col for col in columns if col != key_column]
+    key_col = table.c[key_column]
+
+    existing = {
+        row[0]: tuple(row[1:])
+        for row in conn.execute(
+            select(key_col, *[table.c[col] for col in update_columns])
+        )
+    }
+
+    inserts: list[dict[str, Any]] = []
+    updates: list[dict[str, Any]] = []
+    for row in rows:
+        key = row[key_column]
+        if key not in existing:
+            inserts.append(row)
+        elif existing[key] != tuple(row[col] for col in update_columns):
+            # UPDATE 문의 bindparam 이름은 컬럼명과 겹칠 수 없으므로 접두사를 붙여 전달
+            updates.append(
+                {"_key": key, **{f"_v_{col}": row[col] for col in update_columns}}
+            )
+        else:
+            result.unchanged += 1
+
+    for start in range(0, len(inserts), chunk_size):
+        conn.execute(table.insert(), inserts[start : start + chunk_size])
+    result.inserted = len(inserts)
+
+    if updates:
+        stmt = (
+            table.update()
+            .where(key_col == bindparam("_key"))
+            .values({col: bindparam(f"_v_{col}") for col in update_columns})
+        )
+        for start in range(0, len(updates), chunk_size):
+            conn.execute(stmt, updates[start : start + chunk_size])
+    result.updated = len(updates)
+
+    return result
@@ -1,64 +1,206 @@
+"""
+SQLAlchemy 엔진 / 세션 팩토리
+
+엔진(커넥션 풀, DB 드라이버 로딩)과 쿼리 로그 파일은 임포트 시점이 아니라
+get_engine() 또는 SessionLocal()을 처음 호출할 때 만들어집니다.
+(관리 명령, 워커 기동 시 DB를 쓰지 않는 경로는 엔진 생성 비용을 내지 않음)
+
+    from backend.db.connection import SessionLocal, get_engine
+    session = SessionLocal()          # 첫 호출 시 엔진 생성
+    with get_engine().begin() as conn: ...
+
+기존 스크립트의 `from backend.db.connection import engine`도 그대로 동작합니다(모듈 __getattr__).
+"""
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 from backend.config import get_settings
+from backend import metrics, tracing
+from backend.log_pipeline import install_queue_logging
 import json
 import logging
 import os
+import random
+import threading
 import time
 
 settings = get_settings()
 
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    echo=False,
-    json_serializer=lambda obj: json.dumps(obj, ensure_ascii=False),
-)
+_engine = None
+_ENGINE_LOCK = threading.Lock()
 
 # ---------------------------------------------------------
 # DB 쿼리 로깅 설정
 # ---------------------------------------------------------
 
 
-# 로그 디렉토리 생성 (backend/db/logs)
+# 로그 디렉토리 (backend/db/logs) - 엔진 생성 시 만들어짐
 Current_Dir = os.path.dirname(os.path.abspath(__file__))
 Log_Dir = os.path.join(Current_Dir, "logs")
-os.makedirs(Log_Dir, exist_ok=True)
+log_file_path = os.path.join(Log_Dir, "query_log.log")
 
-# 로거 설정
+# 로거 설정 (파일 핸들러는 _configure_query_log()에서 추가)
 logger = logging.getLogger("sqlalchemy_custom")
 logger.setLevel(logging.INFO)
 
-# 파일 핸들러 추가
-log_file_path = os.path.join(Log_Dir, "query_log.log")
-file_handler = logging.FileHandler(log_file_path, encoding="utf-8")
-formatter = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
 
+def _configure_query_log() -> None:
+    """쿼리 로그 파일 핸들러를 붙이고 파일 쓰기를 백그라운드 스레드로 옮깁니다."""
+    os.makedirs(Log_Dir, exist_ok=True)
+    file_handler = logging.FileHandler(log_file_path, encoding="utf-8")
+    formatter = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+    file_handler.setFormatter(formatter)
+    logger.addHandler(file_handler)
+
+    # 파일 쓰기는 백그라운드 스레드(QueueListener)에서 수행 → 쿼리 실행 스레드는 큐에 넣기만 함
+    install_queue_logging([logger.name])
+
+
+def get_engine():
+    """
+    프로세스 공용 SQLAlchemy 엔진을 반환합니다 (첫 호출 시 생성, 스레드 안전).
+    생성 시 쿼리 로그 파일, 커넥션 풀/쿼리 지표, 트레이싱 이벤트 리스너를 함께 설정합니다.
+    """
+    global _engine
+    if _engine is None:
+        with _ENGINE_LOCK:
+            if _engine is None:
+                _configure_query_log()
+                engine = create_engine(
+                    settings.database_url,
+                    pool_pre_ping=True,
+                    pool_recycle=3600,
+                    echo=False,
+                    json_serializer=lambda obj: json.dumps(obj, ensure_ascii=False),
+                )
+                _install_listeners(engine)
+                SessionLocal.configure(bind=engine)
+                _engine = engine
+    return _engine
+
+
+def __getattr__(name: str):
+    # `from backend.db.connection import engine` 호환 (접근 시점에 엔진 생성)
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# 트레이싱 span에 기록할 SQL 문 최대 길이
+TRACE_STATEMENT_MAX_CHARS = 500
+
+
+def _should_log_query(elapsed_ms: float) -> bool:
+    """
+    SQL_LOG_MODE에 따라 쿼리 로그 기록 여부를 결정합니다.
+    - off: 기록하지 않음
+    - slow: SQL_LOG_SLOW_MS 이상 걸린 쿼리만
+    - all: 느린 쿼리는 모두, 나머지는 SQL_LOG_SAMPLE_RATE 비율로
+    """
+    mode = settings.sql_log_mode.lower()
+    if mode == "off":
+        return False
+    if elapsed_ms >= settings.sql_log_slow_ms:
+        return True
+    return mode == "all" and random.random() < settings.sql_log_sample_rate
+
+
+def _statement_kind(statement: str) -> str:
+    """지표 라벨용 SQL 종류 (SELECT, INSERT, ...)"""
+    head = statement.lstrip().split(None, 1)
+    return head[0].upper() if head else "UNKNOWN"
 
-@event.listens_for(engine, "before_cursor_execute")
-def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    conn.info["query_start_time"] = time.time()
-    logger.info(f"📝 QUERY: {statement}")
-    if parameters:
-        logger.info(f"🔧 PARAMS: {parameters}")
+
+# ---------------------------------------------------------
+# 커넥션 풀 지표 (/metrics)
+# SessionLocal 세션이 커넥션을 빌리고 반납할 때마다 기록
+# ---------------------------------------------------------
 
 
-@event.listens_for(engine, "after_cursor_execute")
-def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    total = time.time() - conn.info.get("query_start_time", time.time())
-    logger.info(f"⏱️ EXECUTION TIME: {total:.4f}s")
+def _on_pool_checkout(dbapi_connection, connection_record, connection_proxy):
+    metrics.inc("db_pool_checkouts_total")
+    metrics.add_gauge("db_pool_checked_out", 1)
 
-    # 결과 로깅 (로우 카운트 등)
-    if hasattr(cursor, "rowcount"):
-        logger.info(f"🔢 ROWS AFFECTED: {cursor.rowcount}")
 
-    logger.info("-" * 50)
+def _on_pool_checkin(dbapi_connection, connection_record):
+    metrics.add_gauge("db_pool_checked_out", -1)
 
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_start_time"] = time.perf_counter()
+    # 채팅 턴 트레이스 안에서 실행된 경우에만 span 생성 (after_cursor_execute/handle_error에서 종료)
+    if context is not None:
+        context._trace_span = tracing.start_span(
+            "db.query",
+            tracing.SPAN_KIND_CLIENT,
+            **{
+                "db.system": conn.dialect.name,
+                "db.statement": statement[:TRACE_STATEMENT_MAX_CHARS],
+            },
+        )
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info.get("query_start_time", time.perf_counter())) * 1000
+    rowcount = getattr(cursor, "rowcount", -1)
+    metrics.observe(
+        "db_query_duration_seconds", elapsed_ms / 1000, {"statement": _statement_kind(statement)}
+    )
+
+    span = getattr(context, "_trace_span", None)
+    if span is not None:
+        span.set_attribute("db.rows", rowcount)
+        tracing.end_span(span)
+        context._trace_span = None
+
+    if _should_log_query(elapsed_ms):
+        # 쿼리 1건을 레코드 1개로 기록 (실행 시간, 영향받은 행 수, SQL, 선택적으로 파라미터)
+        message = f"⏱️ {elapsed_ms:.1f}ms | 🔢 rows={rowcount} | 📝 {statement}"
+        if settings.sql_log_params and parameters:
+            message += f" | 🔧 {parameters}"
+        logger.info(message)
+
+
+def handle_error(exception_context):
+    context = exception_context.execution_context
+    span = getattr(context, "_trace_span", None)
+    if span is not None:
+        tracing.end_span(span, exception_context.original_exception)
+        context._trace_span = None
+
+    metrics.inc(
+        "db_query_errors_total",
+        labels={"statement": _statement_kind(exception_context.statement or "")},
+    )
+    # 실패한 쿼리는 SQL_LOG_MODE와 관계없이 항상 기록
+    logger.warning(
+        f"❌ QUERY FAILED: {exception_context.original_exception} | 📝 {exception_context.statement}"
+    )
+
+
+def _install_listeners(engine) -> None:
+    """지표/트레이싱/쿼리 로그 이벤트 리스너 등록"""
+    event.listen(engine, "checkout", _on_pool_checkout)
+    event.listen(engine, "checkin", _on_pool_checkin)
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "handle_error", handle_error)
+
+    # QueuePool일 때만 풀 크기/유휴 커넥션 수를 조회 시점에 노출 (SQLite 메모리 DB 등 다른 풀은 제외)
+    if hasattr(engine.pool, "size") and hasattr(engine.pool, "checkedin"):
+        metrics.register_gauge("db_pool_size", engine.pool.size)
+        metrics.register_gauge("db_pool_idle", engine.pool.checkedin)
+
+
+class _LazySessionmaker(sessionmaker):
+    """세션을 처음 만들 때 엔진을 생성(bind)하는 sessionmaker"""
+
+    def __call__(self, **local_kw):
+        if _engine is None:
+            get_engine()
+        return super().__call__(**local_kw)
+
+
+SessionLocal = _LazySessionmaker(autocommit=False, autoflush=False)
 
 Base = declarative_base()
 
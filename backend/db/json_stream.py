@@ -0,0 +1,109 @@
+"""
+대용량 JSON 배열 스트리밍 파서
+
+`json.load()`는 파일 전체를 파이썬 객체로 만들기 때문에 수백 MB 데이터에서 메모리 사용량이 크게 늘어납니다.
+iter_json_array()는 최상위 배열의 원소를 하나씩 파싱하여 반환하므로, 메모리 사용량이
+(가장 큰 원소 하나 + 읽기 버퍼) 수준으로 일정하게 유지됩니다.
+
+외부 의존성(ijson 등) 없이 표준 라이브러리 json.JSONDecoder.raw_decode를 사용합니다.
+
+** 사용 예시 **
+    for item in iter_json_array(path):
+        process(item)
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(
+    file_path: Path | str, read_size: int = 1 << 16
+) -> Iterator[Any]:
+    """
+    최상위가 JSON 배열인 파일에서 원소를 하나씩 읽어 반환합니다.
+
+    Args:
+        file_path: JSON 파일 경로 (최상위가 [ ... ] 배열이어야 함)
+        read_size: 한 번에 읽을 문자 수
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+        ValueError: 최상위가 배열이 아니거나 JSON 형식이 잘못된 경우
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    decoder = json.JSONDecoder()
+
+    with open(file_path, "r", encoding="utf-8-sig") as f:
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            # 버퍼를 더 읽어옵니다. 이미 처리한 앞부분은 잘라내 메모리를 재사용합니다.
+            nonlocal buffer, pos, eof
+            chunk = f.read(read_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return True
+
+        def skip_whitespace() -> None:
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                    pos += 1
+                if pos < len(buffer) or not fill():
+                    return
+
+        skip_whitespace()
+        if pos >= len(buffer) or buffer[pos] != "[":
+            raise ValueError(f"{file_path}: top-level JSON value must be an array")
+        pos += 1
+
+        expect_value = True  # 직전에 '[' 또는 ','를 읽었는지 여부
+        count = 0  # 지금까지 읽은 원소 수
+        while True:
+            skip_whitespace()
+            if pos >= len(buffer):
+                raise ValueError(f"{file_path}: unexpected end of JSON array")
+
+            char = buffer[pos]
+            if char == "]":
+                # 빈 배열([])은 허용, ',' 직후의 ']'(끝의 쉼표)는 잘못된 형식
+                if expect_value and count:
+                    raise ValueError(f"{file_path}: trailing ',' before ']' at offset {pos}")
+                return
+            if char == ",":
+                if expect_value:
+                    raise ValueError(f"{file_path}: unexpected ',' at offset {pos}")
+                pos += 1
+                expect_value = True
+                continue
+            if not expect_value:
+                raise ValueError(f"{file_path}: expected ',' or ']' at offset {pos}")
+
+            # 원소 하나를 파싱. 버퍼 끝에서 잘린 경우 더 읽어서 재시도합니다.
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof or not fill():
+                        raise
+                    continue
+                # 숫자처럼 버퍼 끝에서 끝난 값은 다음 청크에 이어질 수 있으므로 더 읽고 확인
+                if end >= len(buffer) and not eof and fill():
+                    continue
+                break
+
+            pos = end
+            expect_value = False
+            count += 1
+            yield value
@@ -0,0 +1,172 @@
+"""
+majors JSON 컬럼 → json_packed(zstd + msgpack) 마이그레이션 스크립트
+
+1. majors 테이블에 json_packed 컬럼이 없으면 추가 (MySQL: LONGBLOB)
+2. json_packed가 비어 있는 행을 청크 단위로 읽어 LONGTEXT JSON 컬럼들을 묶어 압축 저장
+3. --drop-text: 백필 후 LONGTEXT 컬럼을 NULL로 비워 저장 공간/전송량 절감
+   (university는 LIKE 검색에 사용되므로 유지)
+4. --revert: json_packed 값을 LONGTEXT 컬럼으로 되돌리고 json_packed를 비움
+
+마이그레이션 후 .env에 MAJOR_JSON_STORAGE=packed를 설정해야 애플리케이션이 json_packed를 읽습니다.
+(--drop-text 전에는 두 형식이 모두 채워져 있으므로 설정을 바꾸지 않아도 기존처럼 동작)
+
+사용법:
+    python backend/db/migrate_packed_json.py                 # 컬럼 추가 + 백필
+    python backend/db/migrate_packed_json.py --drop-text     # 백필 + LONGTEXT 비우기
+    python backend/db/migrate_packed_json.py --revert        # 되돌리기
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# 백엔드 모듈 임포트를 위해 프로젝트 루트 경로 추가
+current_dir = Path(__file__).resolve().parent
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from sqlalchemy import Column, Integer, MetaData, Table, bindparam, select
+from sqlalchemy.dialects.mysql import LONGTEXT
+
+from backend.db.connection import engine
+from backend.db.packed import (
+    PACKED_MAJOR_FIELDS,
+    TEXT_KEPT_FIELDS,
+    PackedJSON,
+    pack,
+    unpack,
+)
+from backend.db.schema import ensure_column as ensure_table_column
+
+# ORM 매핑(MAJOR_JSON_STORAGE)과 무관하게 json_packed 컬럼을 다루기 위한 Core 테이블 정의
+majors = Table(
+    "majors",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    *[Column(name, LONGTEXT) for name in PACKED_MAJOR_FIELDS],
+    Column("json_packed", PackedJSON),
+)
+
+
+def ensure_column() -> bool:
+    """json_packed 컬럼이 없으면 추가하고, 추가했는지 여부를 반환합니다."""
+    return ensure_table_column(majors, "json_packed")
+
+
+def backfill(chunk_size: int = 200, drop_text: bool = False) -> int:
+    """json_packed가 비어 있는 행을 채우고 처리한 행 수를 반환합니다."""
+    cleared = {
+        name: None for name in PACKED_MAJOR_FIELDS if name not in TEXT_KEPT_FIELDS
+    }
+    stmt = (
+        majors.update()
+        .where(majors.c.id == bindparam("_id"))
+        .values(
+            json_packed=bindparam("_packed"),
+            **({name: bindparam(f"_v_{name}") for name in cleared} if drop_text else {}),
+        )
+    )
+
+    total = 0
+    last_id = 0
+    started = time.perf_counter()
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select(majors.c.id, *[majors.c[name] for name in PACKED_MAJOR_FIELDS])
+                .where(majors.c.id > last_id, majors.c.json_packed.is_(None))
+                .order_by(majors.c.id)
+                .limit(chunk_size)
+            ).all()
+            if not rows:
+                break
+
+            params = []
+            for row in rows:
+                values = {
+                    name: json.loads(getattr(row, name))
+                    for name in PACKED_MAJOR_FIELDS
+                    if getattr(row, name)
+                }
+                param = {"_id": row.id, "_packed": pack(values)}
+                if drop_text:
+                    param.update({f"_v_{name}": None for name in cleared})
+                params.append(param)
+            conn.execute(stmt, params)
+
+        total += len(rows)
+        last_id = rows[-1].id
+        elapsed = time.perf_counter() - started
+        print(f"Packed {total} rows ({total / elapsed if elapsed > 0 else 0:.0f} rows/sec)")
+
+    if drop_text:
+        # 이전 실행에서 백필만 해 둔 행의 LONGTEXT도 비움
+        with engine.begin() as conn:
+            conn.execute(
+                majors.update()
+                .where(majors.c.json_packed.is_not(None))
+                .values(**cleared)
+            )
+    return total
+
+
+def revert(chunk_size: int = 200) -> int:
+    """json_packed 값을 LONGTEXT 컬럼으로 되돌리고 처리한 행 수를 반환합니다."""
+    stmt = (
+        majors.update()
+        .where(majors.c.id == bindparam("_id"))
+        .values(
+            json_packed=None,
+            **{name: bindparam(f"_v_{name}") for name in PACKED_MAJOR_FIELDS},
+        )
+    )
+    total = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select(majors.c.id, majors.c.json_packed)
+                .where(majors.c.json_packed.is_not(None))
+                .order_by(majors.c.id)
+                .limit(chunk_size)
+            ).all()
+            if not rows:
+                break
+            params = []
+            for row in rows:
+                values = row.json_packed or {}
+                param = {"_id": row.id}
+                for name in PACKED_MAJOR_FIELDS:
+                    value = values.get(name)
+                    param[f"_v_{name}"] = (
+                        json.dumps(value, ensure_ascii=False) if value else None
+                    )
+                params.append(param)
+            conn.execute(stmt, params)
+        total += len(rows)
+        print(f"Reverted {total} rows")
+    return total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate Major JSON columns to json_packed")
+    parser.add_argument(
+        "--drop-text",
+        action="store_true",
+        help="백필 후 LONGTEXT JSON 컬럼 비우기 (university 제외)",
+    )
+    parser.add_argument(
+        "--revert", action="store_true", help="json_packed → LONGTEXT로 되돌리기"
+    )
+    parser.add_argument("--chunk-size", type=int, default=200, help="청크당 행 수")
+    args = parser.parse_args()
+
+    if args.revert:
+        count = revert(args.chunk_size)
+        print(f"✅ Reverted {count} rows. Set MAJOR_JSON_STORAGE=json.")
+    else:
+        if ensure_column():
+            print("🛠️  Added majors.json_packed column.")
+        count = backfill(args.chunk_size, drop_text=args.drop_text)
+        print(f"✅ Packed {count} rows. Set MAJOR_JSON_STORAGE=packed to read json_packed.")
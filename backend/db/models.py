@@ -1,6 +1,11 @@
+import json
+from typing import Any
+
 from sqlalchemy import Column, Integer, String, Text, Float
 from sqlalchemy.dialects.mysql import LONGTEXT
+from sqlalchemy.orm import deferred
 from backend.db.connection import Base
+from backend.db.packed import PackedJSON, packed_storage_enabled
 
 
 class Major(Base):
@@ -27,6 +32,15 @@ class Major(Base):
     university = Column(LONGTEXT, nullable=True)
     chart_data = Column(LONGTEXT, nullable=True)
     raw_data = Column(LONGTEXT, nullable=True)  # 원본 raw json 백업 저장
+    # MAJOR_JSON_STORAGE=packed일 때 위 JSON 컬럼들을 묶어 압축 저장 (backend/db/packed.py)
+    # 컬럼이 없는 기존 DB에서도 조회가 깨지지 않도록 packed 모드에서만 매핑
+    # (컬럼 추가/백필: python backend/db/migrate_packed_json.py)
+    if packed_storage_enabled():
+        json_packed = Column(PackedJSON, nullable=True)
+
+    # get_major_career_info 응답용 파생 값을 시딩 시 미리 계산한 JSON 문서 (backend/rag/career_info.py)
+    # 일반 조회(SELECT *)에는 포함하지 않고 툴에서 전공 하나만 따로 조회
+    career_info = deferred(Column(LONGTEXT, nullable=True))
 
     # 통계
     salary = Column(Float, nullable=True)
@@ -36,6 +50,19 @@ class Major(Base):
     employment_rate = Column(Float, nullable=True)
     acceptance_rate = Column(Float, nullable=True)
 
+    def json_value(self, field: str, default: Any = None) -> Any:
+        """
+        JSON 컬럼 값을 파싱된 Python 객체로 반환합니다.
+        json_packed에 값이 있으면 그것을, 없으면 LONGTEXT 컬럼을 json.loads하여 사용합니다.
+        """
+        packed = getattr(self, "json_packed", None)
+        if packed and field in packed:
+            value = packed[field]
+        else:
+            raw = getattr(self, field)
+            value = json.loads(raw) if raw else None
+        return default if value is None else value
+
 
 class MajorCategory(Base):
     """
@@ -0,0 +1,91 @@
+"""
+Major JSON 컬럼의 압축 바이너리 저장 형식 (zstd + msgpack)
+
+majors 테이블의 JSON 컬럼(relate_subject, raw_data 등)은 LONGTEXT JSON 문자열로 저장되어
+조회할 때마다 큰 문자열을 전송하고 `json.loads`로 다시 파싱해야 합니다.
+MAJOR_JSON_STORAGE=packed이면 이 값들을 하나의 dict로 묶어
+msgpack 직렬화 + zstd 압축한 바이너리(json_packed 컬럼)로 저장합니다.
+
+** 형식 **
+    b"MPZ1" + zstd(ormsgpack.packb({"relate_subject": [...], "raw_data": {...}, ...}))
+
+** 읽기 **
+코드에서는 컬럼을 직접 json.loads하지 않고 `Major.json_value(field)`를 사용합니다.
+json_packed가 있으면 압축을 풀어 사용하고, 없으면 기존 LONGTEXT 컬럼을 json.loads합니다.
+(두 저장 형식이 섞여 있어도 동작하므로 마이그레이션 도중에도 안전)
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import ormsgpack
+import zstandard
+from sqlalchemy.dialects.mysql import LONGBLOB
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+from backend.config import get_settings
+
+MAGIC = b"MPZ1"
+ZSTD_LEVEL = 3
+
+# json_packed에 묶어 저장하는 Major JSON 컬럼
+PACKED_MAJOR_FIELDS = (
+    "relate_subject",
+    "enter_field",
+    "career_act",
+    "main_subject",
+    "university",
+    "chart_data",
+    "raw_data",
+)
+# packed 모드에서도 LONGTEXT를 유지하는 컬럼 (tools._get_majors_for_university에서 LIKE 검색에 사용)
+TEXT_KEPT_FIELDS = ("university",)
+
+
+def packed_storage_enabled() -> bool:
+    """MAJOR_JSON_STORAGE=packed 여부"""
+    return get_settings().major_json_storage.strip().lower() == "packed"
+
+
+def pack(value: Any) -> bytes:
+    """Python 값(JSON 호환)을 zstd 압축 msgpack 바이트로 변환합니다."""
+    payload = ormsgpack.packb(value, option=ormsgpack.OPT_NON_STR_KEYS)
+    # ZstdCompressor는 스레드 간 공유할 수 없으므로 호출마다 생성 (생성 비용은 작음)
+    return MAGIC + zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+
+
+def unpack(data: bytes) -> Any:
+    """pack()으로 만든 바이트를 Python 값으로 되돌립니다."""
+    data = bytes(data)
+    if not data.startswith(MAGIC):
+        raise ValueError("Unknown packed JSON format")
+    return ormsgpack.unpackb(zstandard.ZstdDecompressor().decompress(data[len(MAGIC) :]))
+
+
+class PackedJSON(TypeDecorator):
+    """
+    JSON 호환 값을 pack()/unpack()으로 저장하는 SQLAlchemy 타입.
+    MySQL에서는 LONGBLOB, 그 외 DB에서는 BLOB/BYTEA를 사용합니다.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name in ("mysql", "mariadb"):
+            return dialect.type_descriptor(LONGBLOB())
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        # 이미 pack()된 바이트는 그대로 저장 (시딩 워커 프로세스에서 미리 압축한 경우)
+        if isinstance(value, (bytes, bytearray)) and bytes(value[: len(MAGIC)]) == MAGIC:
+            return bytes(value)
+        return pack(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return unpack(value)
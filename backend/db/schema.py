@@ -0,0 +1,29 @@
+"""
+기존 테이블에 새 컬럼을 추가하는 간단한 스키마 보정 유틸리티
+
+create_all()은 이미 존재하는 테이블에 컬럼을 추가하지 않으므로,
+모델에 nullable 컬럼이 추가되면 시딩/마이그레이션 스크립트가 ensure_column()으로 보정합니다.
+"""
+
+from sqlalchemy import Table, inspect
+
+from backend.db.connection import engine
+
+
+def ensure_column(table: Table, column_name: str) -> bool:
+    """
+    table에 column_name 컬럼이 없으면 NULL 허용으로 추가하고, 추가했는지 여부를 반환합니다.
+    테이블 자체가 없으면 create_all()이 만들 것이므로 아무것도 하지 않습니다.
+    """
+    inspector = inspect(engine)
+    if not inspector.has_table(table.name):
+        return False
+    columns = {col["name"] for col in inspector.get_columns(table.name)}
+    if column_name in columns:
+        return False
+    column_type = table.c[column_name].type.compile(dialect=engine.dialect)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            f"ALTER TABLE {table.name} ADD COLUMN {column_name} {column_type} NULL"
+        )
+    return True
@@ -1,4 +1,7 @@
+import argparse
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # 프로젝트 루트 경로 추가
@@ -11,8 +14,14 @@ from backend.db.seed_categories import seed_categories
 from backend.db.seed_universities import seed_universities
 from backend.db.connection import engine, Base
 
+SEEDERS = [
+    ("Majors", seed_majors),
+    ("Major Categories", seed_categories),
+    ("Universities", seed_universities),
+]
 
-def seed_all():
+
+def seed_all(parallel: bool = True):
     print("🚀 Starting Full Database Seeding...")
     print("=" * 50)
 
@@ -22,22 +31,37 @@ def seed_all():
     print("✅ Tables checked/created.")
     print("=" * 50)
 
-    # 2. 전공 데이터 적재
-    print("\n[Step 1/3] Seeding Majors...")
-    seed_majors()
-
-    # 3. 카테고리 데이터 적재
-    print("\n[Step 2/3] Seeding Major Categories...")
-    seed_categories()
-
-    # 4. 대학 데이터 적재
-    print("\n[Step 3/3] Seeding Universities...")
-    seed_universities()
+    started = time.perf_counter()
+    results = {}
+    if parallel:
+        # 세 시더는 서로 다른 테이블만 사용하므로 각자 커넥션/트랜잭션으로 동시에 실행
+        print(f"\n[Parallel] Seeding {', '.join(name for name, _ in SEEDERS)}...")
+        with ThreadPoolExecutor(max_workers=len(SEEDERS)) as executor:
+            futures = [(name, executor.submit(seeder)) for name, seeder in SEEDERS]
+            # 하나라도 실패하면 예외를 그대로 전달
+            for name, future in futures:
+                results[name] = future.result()
+    else:
+        for step, (name, seeder) in enumerate(SEEDERS, start=1):
+            print(f"\n[Step {step}/{len(SEEDERS)}] Seeding {name}...")
+            results[name] = seeder()
 
     print("\n" + "=" * 50)
-    print("🎉 All seeding processes completed successfully!")
+    print(
+        f"🎉 All seeding processes completed successfully! "
+        f"({time.perf_counter() - started:.2f}s)"
+    )
     print("=" * 50)
+    # 시더별 결과 (카테고리/대학 시더는 실패 시 None)
+    return results
 
 
 if __name__ == "__main__":
-    seed_all()
+    parser = argparse.ArgumentParser(description="Seed all reference tables")
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="시더를 동시에 실행하지 않고 순서대로 실행",
+    )
+    args = parser.parse_args()
+    seed_all(parallel=not args.sequential)
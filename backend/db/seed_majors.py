@@ -1,26 +1,54 @@
+"""
+major_detail.json → majors 테이블 시딩 스크립트
+
+대용량 JSON을 한 번에 로드하지 않고 스트리밍으로 읽어 청크 단위로 처리합니다.
+1. iter_json_array()로 원소를 하나씩 읽어 청크(기본 500개)로 묶음
+2. 청크별 preprocess_item()을 프로세스 풀에서 병렬 실행 (진행 중인 청크 수 제한)
+3. 결과를 bulk_upsert()로 청크당 한 번의 다중 행 INSERT ... ON DUPLICATE KEY UPDATE로 저장
+
+get_major_career_info 툴이 사용하는 파생 값(직업 목록, 진출 분야, 성비/만족도 등)도
+preprocess_item()에서 함께 계산하여 career_info 컬럼에 저장합니다. (backend/rag/career_info.py)
+
+사용법:
+    python backend/db/seed_majors.py
+    python backend/db/seed_majors.py --workers 0        # 프로세스 풀 없이 현재 프로세스에서 처리
+    python backend/db/seed_majors.py --chunk-size 1000
+"""
+
+import argparse
 import json
+import multiprocessing
+import os
 import re
+import time
 import uuid
 import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 # 백엔드 모듈 임포트를 위해 프로젝트 루트 경로 추가
 current_dir = Path(__file__).resolve().parent
 project_root = current_dir.parent.parent
 sys.path.append(str(project_root))
 
-from backend.db.connection import SessionLocal, engine, Base
+from backend.db.bulk import bulk_upsert
+from backend.db.connection import engine
+from backend.db.json_stream import iter_json_array
 from backend.db.models import Major
+from backend.db.packed import (
+    PACKED_MAJOR_FIELDS,
+    TEXT_KEPT_FIELDS,
+    pack,
+    packed_storage_enabled,
+)
+from backend.db.schema import ensure_column
+from backend.rag.career_info import build_career_info
 
-
-def load_json_data(file_path: Path) -> List[Dict[str, Any]]:
-    """소스 JSON 데이터를 로드하고 파싱합니다."""
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+DEFAULT_JSON_PATH = project_root / "backend" / "data" / "major_detail.json"
+DEFAULT_CHUNK_SIZE = 500
 
 
 def safe_float(value: Any, default: float = 0.0) -> float:
@@ -113,7 +141,19 @@ def preprocess_item(raw_item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     raw_chart = data.get("chartData", [])
     stats = extract_chart_stats(raw_chart)
 
-    return {
+    # 툴 응답용 파생 값 미리 계산 (조회 시 정규식/HTML 정리 반복 방지)
+    career_info = build_career_info(
+        SimpleNamespace(
+            job=data.get("job"),
+            enter_field=data.get("enter_field"),
+            career_act=data.get("career_act"),
+            qualifications=data.get("qualifications"),
+            main_subject=data.get("main_subject"),
+            chart_data=raw_chart,
+        )
+    )
+
+    row = {
         "major_id": major_id,
         "major_name": major_name,
         # 텍스트/HTML 필드
@@ -142,75 +182,172 @@ def preprocess_item(raw_item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         "raw_data": json.dumps(
             raw_item, ensure_ascii=False
         ),  # 전체 항목을 원본 백업으로 저장
+        "career_info": json.dumps(career_info, ensure_ascii=False),
     }
 
+    if packed_storage_enabled():
+        # JSON 컬럼을 json_packed 하나로 묶어 압축 저장 (워커 프로세스에서 미리 압축)
+        # university는 LIKE 검색에 사용되므로 LONGTEXT도 유지
+        values = {
+            "relate_subject": data.get("relate_subject"),
+            "enter_field": data.get("enter_field"),
+            "career_act": data.get("career_act"),
+            "main_subject": data.get("main_subject"),
+            "university": data.get("university"),
+            "chart_data": raw_chart,
+            "raw_data": raw_item,
+        }
+        row["json_packed"] = pack({k: v for k, v in values.items() if v})
+        for name in PACKED_MAJOR_FIELDS:
+            if name not in TEXT_KEPT_FIELDS:
+                row[name] = None
+
+    return row
+
+
+def _preprocess_chunk(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    프로세스 풀 워커: 청크 단위로 preprocess_item()을 실행합니다.
+    (항목마다 프로세스 간 전송이 일어나지 않도록 청크로 묶어서 처리)
+    """
+    rows = []
+    skipped = 0
+    errors = []
+    for item in items:
+        try:
+            processed = preprocess_item(item)
+        except Exception as e:
+            errors.append(str(e))
+            continue
+        if processed:
+            rows.append(processed)
+        else:
+            skipped += 1
+    return {"rows": rows, "skipped": skipped, "errors": errors, "count": len(items)}
+
+
+def _iter_chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _iter_processed(
+    chunks: Iterator[List[Dict[str, Any]]], workers: int
+) -> Iterator[Dict[str, Any]]:
+    """청크 전처리 결과를 순서대로 반환합니다. 제출된 청크 수를 workers * 2로 제한하여 메모리를 일정하게 유지합니다."""
+    if workers <= 0:
+        for chunk in chunks:
+            yield _preprocess_chunk(chunk)
+        return
+
+    # seed_all은 다른 시더 스레드와 함께 실행하므로 fork 대신 spawn 사용
+    # (스레드가 잡고 있던 SQLAlchemy 풀/logging 락이 fork된 자식에 복사되면 교착될 수 있음)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        in_flight = []
+        for chunk in chunks:
+            if len(in_flight) >= workers * 2:
+                # 입력 순서를 유지해야 같은 major_id가 여러 번 나올 때 마지막 항목이 반영됨
+                wait(in_flight[:1], return_when=FIRST_COMPLETED)
+                yield in_flight.pop(0).result()
+            in_flight.append(executor.submit(_preprocess_chunk, chunk))
+        for future in in_flight:
+            yield future.result()
+
+
+def seed_majors(
+    json_path: Optional[Path] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    major_detail.json을 스트리밍으로 읽어 majors 테이블에 업서트합니다.
 
-def seed_majors():
-    json_path = project_root / "backend" / "data" / "major_detail.json"
-    print(f"Loading data from {json_path}...")
-
-    raw_list = load_json_data(json_path)
-    print(f"Found {len(raw_list)} items in JSON.")
-
-    session = SessionLocal()
+    Args:
+        json_path: 원본 JSON 경로 (기본값: backend/data/major_detail.json)
+        chunk_size: 전처리/INSERT 청크 크기
+        workers: 전처리 프로세스 수 (None이면 CPU 수, 0이면 현재 프로세스에서 처리)
 
+    Returns:
+        처리 통계 (total, succeeded, skipped, errors, elapsed, rows_per_sec)
+    """
+    json_path = Path(json_path or DEFAULT_JSON_PATH)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    chunk_size = max(chunk_size, 1)
+    print(f"Loading data from {json_path} (chunk_size={chunk_size}, workers={workers})...")
+
+    table = Major.__table__
+    # career_info 컬럼이 추가되기 전에 만든 기존 테이블 보정
+    if ensure_column(table, "career_info"):
+        print("🛠️  Added majors.career_info column.")
+
+    total = 0
     succeeded = 0
     skipped = 0
     errors = 0
+    started = time.perf_counter()
 
+    # 전체 시딩을 하나의 트랜잭션으로 처리 (중간 실패 시 전체 롤백)
     try:
-        # 테이블이 없으면 생성 (일반적으로 alembic으로 처리하지만 안전을 위해 확인)
-        # Base.metadata.create_all(bind=engine)
-
-        for i, item in enumerate(raw_list):
-            try:
-                processed = preprocess_item(item)
-                if not processed:
-                    skipped += 1
-                    continue
-
-                # 업데이트 또는 삽입 (Upsert)
-                # 존재 여부 확인
-                existing = (
-                    session.query(Major)
-                    .filter_by(major_id=processed["major_id"])
-                    .first()
+        with engine.begin() as conn:
+            chunks = _iter_chunks(iter_json_array(json_path), chunk_size)
+            for result in _iter_processed(chunks, workers):
+                for message in result["errors"]:
+                    print(f"Error processing item: {message}")
+                errors += len(result["errors"])
+                skipped += result["skipped"]
+                total += result["count"]
+
+                succeeded += bulk_upsert(
+                    conn, table, result["rows"], ["major_id"], chunk_size
                 )
 
-                if existing:
-                    # 필드 업데이트
-                    for k, v in processed.items():
-                        setattr(existing, k, v)
-                else:
-                    # 새로 삽입
-                    new_major = Major(**processed)
-                    session.add(new_major)
-
-                succeeded += 1
-
-                if i % 100 == 0:
-                    print(f"Processing... {i}/{len(raw_list)}")
-
-            except Exception as e:
-                print(f"Error processing item index {i}: {e}")
-                errors += 1
-
-        session.commit()
+                elapsed = time.perf_counter() - started
+                print(
+                    f"Processing... {total} items "
+                    f"({succeeded / elapsed if elapsed > 0 else 0.0:.0f} rows/sec)"
+                )
     except Exception as e:
-        session.rollback()
         print(f"Critical error during seeding: {e}")
         raise
-    finally:
-        session.close()
+
+    elapsed = time.perf_counter() - started
+    rows_per_sec = succeeded / elapsed if elapsed > 0 else 0.0
 
     print("=" * 50)
     print(f"Seeding Complete.")
-    print(f"Total processed: {len(raw_list)}")
+    print(f"Total processed: {total}")
     print(f"Succeeded (Upsert): {succeeded}")
     print(f"Skipped (Invalid Data): {skipped}")
     print(f"Errors: {errors}")
+    print(f"Elapsed: {elapsed:.2f}s ({rows_per_sec:.0f} rows/sec)")
     print("=" * 50)
 
+    return {
+        "total": total,
+        "succeeded": succeeded,
+        "skipped": skipped,
+        "errors": errors,
+        "elapsed": elapsed,
+        "rows_per_sec": rows_per_sec,
+    }
+
 
 if __name__ == "__main__":
-    seed_majors()
+    parser = argparse.ArgumentParser(description="Seed majors table from major_detail.json")
+    parser.add_argument("--json-path", type=Path, help="원본 JSON 경로")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"전처리/INSERT 청크 크기 (기본값: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="전처리 프로세스 수 (기본값: CPU 수, 0이면 프로세스 풀 미사용)",
+    )
+    args = parser.parse_args()
+    seed_majors(json_path=args.json_path, chunk_size=args.chunk_size, workers=args.workers)
@@ -0,0 +1,90 @@
+# backend/graph/cancellation.py
+"""
+그래프 실행 취소(Cancellation) 모듈
+
+클라이언트가 답변 도중 연결을 끊으면 남은 LLM 토큰 생성과 툴 실행을 중단하기 위해 사용합니다.
+
+** 취소 전파 경로 **
+1. CancellationCallbackHandler: run_mentor_stream(config={"callbacks": [...]})로 전달되어
+   LLM 토큰 수신(on_llm_new_token), LLM/툴 시작 시점에 RunCancelled를 발생시킵니다.
+   → 진행 중인 OpenAI 스트림이 즉시 닫히고, 이후 노드/툴은 실행되지 않습니다.
+2. current_token (ContextVar): 콜백이 호출되지 않는 작업(임베딩 API 호출 등)은
+   툴 내부에서 raise_if_cancelled()로 직접 확인합니다.
+"""
+
+import threading
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+class RunCancelled(BaseException):
+    """
+    그래프 실행이 취소되었음을 알리는 예외.
+
+    툴 내부의 `except Exception` 처리나 ToolNode의 에러 처리에 잡혀서 무시되지 않도록
+    asyncio.CancelledError와 같이 BaseException을 상속합니다.
+    """
+
+
+class CancellationToken:
+    """스레드 간에 공유되는 취소 플래그"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise RunCancelled(self.reason)
+
+
+# 현재 실행 중인 그래프의 취소 토큰 (LangGraph가 툴 실행 시 컨텍스트를 복사하므로 툴 내부까지 전달됨)
+current_token: ContextVar[Optional[CancellationToken]] = ContextVar(
+    "current_cancellation_token", default=None
+)
+
+
+def raise_if_cancelled() -> None:
+    """현재 컨텍스트의 실행이 취소되었으면 RunCancelled를 발생시킵니다."""
+    token = current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+class CancellationCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain 콜백 이벤트마다 취소 여부를 확인하는 핸들러.
+
+    raise_error=True로 설정해야 콜백에서 발생한 예외가 LLM/툴 호출 밖으로 전파됩니다.
+    """
+
+    raise_error = True
+
+    def __init__(self, token: CancellationToken):
+        self.token = token
+
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        self.token.raise_if_cancelled()
+
+    def on_chat_model_start(self, serialized, messages, **kwargs: Any) -> None:
+        self.token.raise_if_cancelled()
+
+    def on_llm_start(self, serialized, prompts, **kwargs: Any) -> None:
+        self.token.raise_if_cancelled()
+
+    def on_tool_start(self, serialized, input_str, **kwargs: Any) -> None:
+        self.token.raise_if_cancelled()
+
+    def on_retriever_start(self, serialized, query, **kwargs: Any) -> None:
+        self.token.raise_if_cancelled()
@@ -5,6 +5,8 @@ LangGraph 그래프를 구성하는 노드 함수들을 정의합니다.
 ReAct 패턴: LLM이 자율적으로 tool 호출 여부를 결정 (agent_node, should_continue)
 """
 
+import threading
+
 from langchain_core.messages import SystemMessage
 
 from .state import MentorState
@@ -22,10 +24,9 @@ from backend.rag.tools import (
     get_university_admission_info,
 )
 
+from backend import tracing
 from backend.config import get_llm
-
-# LLM 인스턴스 생성 (.env에서 설정한 LLM_PROVIDER와 MODEL_NAME 사용)
-llm = get_llm()
+from backend.scheduler import llm_slot
 
 # doc_type별 기본 가중치
 MAJOR_DOC_WEIGHTS = {
@@ -46,7 +47,24 @@ tools = [
     get_search_help,
     get_university_admission_info,
 ]  # 사용 가능한 툴 목록
-llm_with_tools = llm.bind_tools(tools)  # LLM에 툴 사용 권한 부여
+
+# LLM 인스턴스 (.env에서 설정한 LLM_PROVIDER와 MODEL_NAME 사용)
+# 임포트 시점이 아니라 첫 노드 실행 시 생성 → 관리 명령/워커 기동 시 LLM 클라이언트 생성 비용 제거
+_llm = None
+_llm_with_tools = None
+_LLM_LOCK = threading.Lock()
+
+
+def _get_llms():
+    """(LLM, 툴이 바인딩된 LLM)을 반환합니다 (첫 호출 시 생성, 스레드 안전)."""
+    global _llm, _llm_with_tools
+    if _llm_with_tools is None:
+        with _LLM_LOCK:
+            if _llm_with_tools is None:
+                llm = get_llm()
+                _llm = llm
+                _llm_with_tools = llm.bind_tools(tools)  # LLM에 툴 사용 권한 부여
+    return _llm, _llm_with_tools
 
 
 def _format_profile_value(value) -> str:
@@ -242,7 +260,9 @@ def _normalize_majors_with_llm(raw_majors: list[str]) -> list[str]:
     )
 
     try:
-        response = llm.invoke(prompt)
+        llm, _ = _get_llms()
+        with llm_slot():
+            response = llm.invoke(prompt)
         content = response.content.strip()
 
         # 쉼표로 분리하여 리스트로 변환
@@ -254,6 +274,7 @@ def _normalize_majors_with_llm(raw_majors: list[str]) -> list[str]:
         return targets  # 실패 시 원본 반환
 
 
+@tracing.traced("graph.recommend_majors_node")
 def recommend_majors_node(state: MentorState) -> dict:
     """
     온보딩 답변을 사용하여 사용자 프로필 임베딩을 생성하고 전공을 순위별로 추천합니다.
@@ -350,7 +371,17 @@ def agent_node(state: MentorState) -> dict:
     if system_message:
         messages = [system_message] + messages
 
-    response = llm_with_tools.invoke(messages)
+    _, llm_with_tools = _get_llms()
+
+    # 프로세스 전역 스케줄러에서 실행 슬롯을 얻은 뒤 호출 (대기열 초과 시 AdmissionRejected)
+    # graph.agent_node span에서 llm.invoke span을 뺀 시간이 스케줄러 대기 시간
+    with tracing.span("graph.agent_node", messages=len(messages)):
+        with llm_slot(), tracing.span("llm.invoke", tracing.SPAN_KIND_CLIENT):
+            response = llm_with_tools.invoke(messages)
+            usage = getattr(response, "usage_metadata", None) or {}
+            tracing.set_attribute("llm.input_tokens", usage.get("input_tokens"))
+            tracing.set_attribute("llm.output_tokens", usage.get("output_tokens"))
+        tracing.set_attribute("llm.tool_calls", len(getattr(response, "tool_calls", None) or []))
 
     # [MODIFICIATION] Removed internal retry loop to prevent token duplication in stream.
     # The prompt should be sufficient to encourage tool usage.
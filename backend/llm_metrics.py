@@ -0,0 +1,179 @@
+# backend/llm_metrics.py
+"""
+LLM 호출 지표 수집 / 사용량 집계 콜백
+
+** LLMMetricsCallback **
+get_llm()이 만드는 모든 ChatModel에 붙어 호출마다 다음 지표를 backend.metrics에 기록합니다.
+(bind_tools()로 감싼 모델, 에이전트/후보 검증 등 호출 위치와 관계없이 적용)
+
+- llm_request_duration_seconds{model}: 호출 시작 ~ 종료 시간 (히스토그램)
+- llm_time_to_first_token_seconds{model}: 스트리밍 호출의 첫 토큰까지 시간 (히스토그램)
+- llm_tokens_total{model, direction=input|output}: 제공자가 보고한 토큰 수 (카운터)
+- llm_requests_total{model, outcome=success|error}: 호출 수 (카운터)
+
+토큰 수는 응답 메시지의 usage_metadata(없으면 llm_output["token_usage"])를 사용하며,
+제공자가 사용량을 보고하지 않으면 토큰 카운터는 증가하지 않습니다.
+
+** UsageTracker **
+그래프 실행 config의 callbacks로 전달하면 한 번의 실행(채팅 턴) 동안 발생한
+LLM 호출(툴 내부의 후보 검증 호출 포함)과 툴 호출을 합산합니다. 결과는 Message.metadata["usage"]로 저장됩니다.
+
+    usage = UsageTracker()
+    graph.stream(state, config={"callbacks": [usage]})
+    usage.summary(latency_ms=1234.5)
+"""
+
+import threading
+from collections import Counter
+import time
+from typing import Any, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from backend import metrics
+from backend.config import get_settings
+
+
+class LLMMetricsCallback(BaseCallbackHandler):
+    """run_id별 시작 시각을 보관했다가 종료/에러 시 지표를 기록하는 콜백 핸들러"""
+
+    def __init__(self, model: str):
+        self.labels = {"model": model}
+        self._lock = threading.Lock()
+        # run_id → [시작 시각, 첫 토큰 수신 여부]
+        self._runs: dict[UUID, list] = {}
+
+    def _start(self, run_id: UUID) -> None:
+        with self._lock:
+            self._runs[run_id] = [time.perf_counter(), False]
+
+    def _finish(self, run_id: UUID) -> Optional[float]:
+        with self._lock:
+            state = self._runs.pop(run_id, None)
+        return None if state is None else time.perf_counter() - state[0]
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(run_id)
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(run_id)
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            state = self._runs.get(run_id)
+            if state is None or state[1]:
+                return
+            state[1] = True
+            elapsed = time.perf_counter() - state[0]
+        metrics.observe("llm_time_to_first_token_seconds", elapsed, self.labels)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        elapsed = self._finish(run_id)
+        if elapsed is not None:
+            metrics.observe("llm_request_duration_seconds", elapsed, self.labels)
+        metrics.inc("llm_requests_total", labels={**self.labels, "outcome": "success"})
+
+        input_tokens, output_tokens = _usage(response)
+        if input_tokens:
+            metrics.inc("llm_tokens_total", input_tokens, {**self.labels, "direction": "input"})
+        if output_tokens:
+            metrics.inc("llm_tokens_total", output_tokens, {**self.labels, "direction": "output"})
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        elapsed = self._finish(run_id)
+        if elapsed is not None:
+            metrics.observe("llm_request_duration_seconds", elapsed, self.labels)
+        metrics.inc("llm_requests_total", labels={**self.labels, "outcome": "error"})
+
+
+def _usage(response: LLMResult) -> tuple[int, int]:
+    """(입력 토큰, 출력 토큰) - 보고되지 않은 값은 0"""
+    input_tokens = output_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                input_tokens += usage.get("input_tokens", 0) or 0
+                output_tokens += usage.get("output_tokens", 0) or 0
+    if input_tokens or output_tokens:
+        return input_tokens, output_tokens
+
+    token_usage = (response.llm_output or {}).get("token_usage") or {}
+    return (
+        token_usage.get("prompt_tokens", 0) or 0,
+        token_usage.get("completion_tokens", 0) or 0,
+    )
+
+
+def estimate_cost(input_tokens: int, output_tokens: int) -> Optional[float]:
+    """LLM_INPUT/OUTPUT_COST_PER_1M 기준 비용(USD). 단가가 설정되지 않았으면 None"""
+    settings = get_settings()
+    if not settings.llm_input_cost_per_1m and not settings.llm_output_cost_per_1m:
+        return None
+    return (
+        input_tokens * settings.llm_input_cost_per_1m
+        + output_tokens * settings.llm_output_cost_per_1m
+    ) / 1_000_000
+
+
+class UsageTracker(BaseCallbackHandler):
+    """한 번의 그래프 실행 동안 LLM 토큰 사용량과 툴 호출 수를 합산하는 콜백 핸들러"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.llm_calls = 0
+        self.tool_calls: Counter = Counter()
+        self.model: Optional[str] = None
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        input_tokens, output_tokens = _usage(response)
+        model = _model_name(response)
+        with self._lock:
+            self.llm_calls += 1
+            self.input_tokens += input_tokens
+            self.output_tokens += output_tokens
+            if model and self.model is None:
+                self.model = model
+
+    def on_tool_start(self, serialized, input_str: str, *, run_id: UUID, **kwargs: Any) -> None:
+        name = (serialized or {}).get("name") or kwargs.get("name") or "unknown"
+        with self._lock:
+            self.tool_calls[name] += 1
+
+    def summary(self, **extra: Any) -> dict:
+        """
+        Message.metadata["usage"]에 저장할 dict
+        (input/output/total 토큰, 모델, LLM/툴 호출 수, 툴별 호출 수, 비용 + extra)
+        """
+        with self._lock:
+            data = {
+                "input_tokens": self.input_tokens,
+                "output_tokens": self.output_tokens,
+                "total_tokens": self.input_tokens + self.output_tokens,
+                "model": self.model or get_settings().model_name,
+                "llm_calls": self.llm_calls,
+                "tool_calls": sum(self.tool_calls.values()),
+                "tools": dict(self.tool_calls),
+            }
+        cost = estimate_cost(data["input_tokens"], data["output_tokens"])
+        if cost is not None:
+            data["cost_usd"] = round(cost, 6)
+        data.update(extra)
+        return data
+
+
+def _model_name(response: LLMResult) -> Optional[str]:
+    """제공자가 응답에 기록한 모델 이름 (예: gpt-4o-mini-2024-07-18)"""
+    name = (response.llm_output or {}).get("model_name")
+    if name:
+        return name
+    for generations in response.generations:
+        for generation in generations:
+            metadata = getattr(getattr(generation, "message", None), "response_metadata", None)
+            if metadata and metadata.get("model_name"):
+                return metadata["model_name"]
+    return None
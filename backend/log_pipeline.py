@@ -0,0 +1,113 @@
+# backend/log_pipeline.py
+"""
+비동기(큐 기반) 로깅 파이프라인
+
+로거에 붙은 파일 핸들러가 요청 처리 스레드에서 직접 디스크에 쓰지 않도록,
+핸들러를 백그라운드 QueueListener로 옮기고 로거에는 QueueHandler만 남깁니다.
+
+** 규칙 **
+1. 요청 스레드: 레코드를 큐에 넣기만 함 (큐가 가득 차면 버리고 log_records_dropped_total 증가)
+2. 백그라운드 스레드(QueueListener): 원래 핸들러(파일, 콘솔 등)로 기록
+3. SamplingFilter: INFO 이하 레코드는 설정한 비율만 큐에 넣음 (WARNING 이상은 항상 기록)
+4. 프로세스 종료 시(atexit) 큐에 남은 레코드를 모두 기록한 뒤 리스너 종료
+
+** 사용 예시 **
+    install_queue_logging(["django", "unigo_app", "backend"], sample_rates={"backend": 0.2})
+
+gunicorn --preload처럼 설치 후 fork하는 경우 리스너 스레드가 자식 프로세스로 복사되지 않으므로
+워커 프로세스 안에서(앱 로딩 시점에) 설치해야 합니다.
+"""
+
+import atexit
+import logging
+import queue
+import random
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, Optional
+
+from backend import metrics
+from backend.config import get_settings
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """큐가 가득 차면 기다리지 않고 레코드를 버리는 QueueHandler"""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            metrics.inc("log_records_dropped_total")
+
+
+class SamplingFilter(logging.Filter):
+    """max_level 이하 레코드를 rate 비율로만 통과시키는 필터 (그보다 높은 레벨은 항상 통과)"""
+
+    def __init__(self, rate: float, max_level: int = logging.INFO):
+        super().__init__()
+        self.rate = rate
+        self.max_level = max_level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
+
+_lock = threading.Lock()
+_listeners: list[QueueListener] = []
+
+
+def install_queue_logging(
+    logger_names: Iterable[str],
+    queue_size: Optional[int] = None,
+    sample_rates: Optional[dict[str, float]] = None,
+) -> int:
+    """
+    지정한 로거들의 핸들러를 백그라운드 리스너로 옮깁니다.
+    같은 핸들러 묶음을 쓰는 로거끼리는 큐와 리스너 하나를 공유합니다.
+    이미 QueueHandler로 바뀐 로거는 건너뛰므로 여러 번 호출해도 안전합니다.
+
+    Returns:
+        새로 시작한 리스너 수
+    """
+    size = queue_size if queue_size is not None else get_settings().log_queue_size
+    sample_rates = sample_rates or {}
+
+    # 핸들러 묶음(동일 객체 기준) → 로거 목록
+    groups: dict[tuple[int, ...], tuple[list[logging.Handler], list[logging.Logger]]] = {}
+    for name in logger_names:
+        logger = logging.getLogger(name)
+        handlers = [h for h in logger.handlers if not isinstance(h, QueueHandler)]
+        if not handlers or len(handlers) != len(logger.handlers):
+            continue
+        key = tuple(id(h) for h in handlers)
+        groups.setdefault(key, (handlers, []))[1].append(logger)
+
+    with _lock:
+        for handlers, loggers in groups.values():
+            log_queue: queue.Queue = queue.Queue(maxsize=size)
+            listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            _listeners.append(listener)
+
+            for logger in loggers:
+                queue_handler = NonBlockingQueueHandler(log_queue)
+                rate = sample_rates.get(logger.name)
+                if rate is not None:
+                    queue_handler.addFilter(SamplingFilter(rate))
+                for handler in handlers:
+                    logger.removeHandler(handler)
+                logger.addHandler(queue_handler)
+
+    return len(groups)
+
+
+def stop_queue_logging() -> None:
+    """모든 리스너를 종료합니다. (큐에 남은 레코드는 기록 후 종료)"""
+    with _lock:
+        while _listeners:
+            _listeners.pop().stop()
+
+
+atexit.register(stop_queue_logging)
@@ -6,14 +6,20 @@
 사용자 질문에 대한 답변을 받습니다.
 """
 
+import threading
+import time
+
 from langchain_core.messages import HumanMessage
-from .graph.graph_builder import build_graph
+from . import metrics
+from .graph.cancellation import RunCancelled
 
 # 그래프 캐싱을 위한 전역 변수
 # 그래프 빌드는 비용이 높으므로(컴파일 등), 한 번 빌드한 그래프를 메모리에 상주시켜 재사용합니다.
 # 이를 통해 매 요청마다 그래프를 다시 만드는 오버헤드를 줄입니다.
+# graph_builder(→ nodes, LangGraph)는 첫 get_graph() 호출 시 임포트합니다.
 _graph_react = None
 _graph_major = None
+_GRAPH_LOCK = threading.Lock()
 
 
 def get_graph(mode: str = "react"):
@@ -38,11 +44,19 @@ def get_graph(mode: str = "react"):
 
     if mode == "react":
         if _graph_react is None:
-            _graph_react = build_graph(mode="react")
+            with _GRAPH_LOCK:
+                if _graph_react is None:
+                    from .graph.graph_builder import build_graph
+
+                    _graph_react = build_graph(mode="react")
         return _graph_react
     elif mode == "major":
         if _graph_major is None:
-            _graph_major = build_graph(mode="major")
+            with _GRAPH_LOCK:
+                if _graph_major is None:
+                    from .graph.graph_builder import build_graph
+
+                    _graph_major = build_graph(mode="major")
         return _graph_major
     else:
         raise ValueError(f"Unknown mode: {mode}")
@@ -117,6 +131,7 @@ def run_mentor_stream(
     chat_history: list[dict] | None = None,
     mode: str = "react",
     stream_mode: str | list[str] = "updates",
+    config: dict | None = None,
 ):
     """
     멘토 시스템을 실행하고 결과를 스트리밍합니다 (제너레이터).
@@ -127,6 +142,7 @@ def run_mentor_stream(
         chat_history (list): 대화 기록
         mode (str): 실행 모드
         stream_mode (str | list[str]): LangGraph 스트리밍 모드
+        config (dict, optional): LangGraph 실행 설정 (예: 취소용 callbacks)
 
     Yields:
         dict: LangGraph 스트리밍 청크
@@ -148,7 +164,29 @@ def run_mentor_stream(
     }
 
     # stream_mode="updates"를 사용하여 각 노드의 업데이트 사항을 스트리밍
-    return graph.stream(state, stream_mode=stream_mode)
+    stream = graph.stream(state, config=config, stream_mode=stream_mode)
+    return _measure_graph_run(stream, mode)
+
+
+def _measure_graph_run(stream, mode: str):
+    """
+    그래프 스트림을 그대로 전달하면서 실행 시간과 결과를 지표로 기록합니다.
+    - graph_run_duration_seconds{mode}: 첫 청크 요청 ~ 스트림 종료
+    - graph_runs_total{mode, outcome=success|cancelled|error}
+      (cancelled: 취소 토큰으로 중단되었거나 소비자가 끝까지 읽지 않고 close()한 경우)
+    """
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield from stream
+        outcome = "success"
+    except (GeneratorExit, RunCancelled):
+        outcome = "cancelled"
+        raise
+    finally:
+        labels = {"mode": mode}
+        metrics.observe("graph_run_duration_seconds", time.perf_counter() - started, labels)
+        metrics.inc("graph_runs_total", labels={**labels, "outcome": outcome})
 
 
 def run_major_recommendation(
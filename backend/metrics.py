@@ -0,0 +1,245 @@
+# backend/metrics.py
+"""
+프로세스 내 운영 지표(metrics) 수집 모듈
+
+외부 의존성 없이 카운터, 게이지, 이동 평균, 히스토그램을 스레드 안전하게 기록합니다.
+값은 워커 프로세스 단위로 유지되며, snapshot()으로 현재 값을 조회하거나
+render_prometheus()로 Prometheus 텍스트 형식(/metrics 엔드포인트)으로 내보낼 수 있습니다.
+labels를 지정하면 `name{key="value"}` 형태의 키로 구분하여 기록합니다.
+
+** 사용 예시 **
+    from backend import metrics
+    metrics.inc("chat_runs_cancelled_total")
+    metrics.observe_avg("chat_completion_tokens", 350)
+    metrics.observe("llm_queue_wait_seconds", 0.12, labels={"priority": "chat"})
+    metrics.add_gauge("sse_streams_active", 1)
+    metrics.cache_access("embeddings", hit=True)
+    with metrics.timed("tool_duration_seconds", {"tool": "list_departments"}):
+        ...
+"""
+
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+_lock = threading.Lock()
+_counters: dict[str, float] = {}
+_gauges: dict[str, float] = {}
+_averages: dict[str, float] = {}
+_histograms: dict[str, dict] = {}
+# 조회 시점에 값을 계산하는 게이지 (예: DB 커넥션 풀 사용 수)
+_gauge_callbacks: dict[str, Callable[[], float]] = {}
+
+# 이동 평균(EMA) 가중치: 최근 값의 반영 비율
+EMA_ALPHA = 0.1
+
+# 히스토그램 기본 버킷 상한값 (초 단위 지연 시간 기준)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _key(name: str, labels: dict | None) -> str:
+    if not labels:
+        return name
+    pairs = ",".join(f'{k}="{_escape(v)}"' for k, v in sorted(labels.items()))
+    return f"{name}{{{pairs}}}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def inc(name: str, amount: float = 1, labels: dict | None = None) -> None:
+    """카운터를 amount만큼 증가시킵니다."""
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+def observe(
+    name: str,
+    value: float,
+    labels: dict | None = None,
+    buckets: tuple = DEFAULT_BUCKETS,
+) -> None:
+    """값을 히스토그램에 기록합니다 (버킷별 개수, 합계, 전체 개수)."""
+    key = _key(name, labels)
+    with _lock:
+        hist = _histograms.get(key)
+        if hist is None:
+            hist = {"buckets": buckets, "counts": [0] * len(buckets), "sum": 0.0, "count": 0}
+            _histograms[key] = hist
+        idx = bisect.bisect_left(hist["buckets"], value)
+        if idx < len(hist["counts"]):
+            hist["counts"][idx] += 1
+        hist["sum"] += value
+        hist["count"] += 1
+
+
+@contextmanager
+def timed(name: str, labels: dict | None = None):
+    """
+    블록(또는 데코레이터로 감싼 함수)의 실행 시간(초)을 히스토그램에 기록합니다.
+    예외로 끝나도 기록합니다.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, labels)
+
+
+def cache_access(cache: str, hit: bool) -> None:
+    """캐시 계층별 조회 결과를 cache_requests_total{cache, result=hit|miss}에 기록합니다."""
+    inc("cache_requests_total", labels={"cache": cache, "result": "hit" if hit else "miss"})
+
+
+def set_gauge(name: str, value: float, labels: dict | None = None) -> None:
+    """게이지를 value로 설정합니다."""
+    key = _key(name, labels)
+    with _lock:
+        _gauges[key] = value
+
+
+def add_gauge(name: str, amount: float, labels: dict | None = None) -> None:
+    """게이지를 amount만큼 증감합니다 (진행 중인 스트림 수 등)."""
+    key = _key(name, labels)
+    with _lock:
+        _gauges[key] = _gauges.get(key, 0) + amount
+
+
+def register_gauge(name: str, callback: Callable[[], float], labels: dict | None = None) -> None:
+    """
+    조회 시점(snapshot/render_prometheus)에 callback()을 호출해 값을 얻는 게이지를 등록합니다.
+    같은 이름으로 다시 등록하면 마지막 callback을 사용합니다.
+    """
+    with _lock:
+        _gauge_callbacks[_key(name, labels)] = callback
+
+
+def _collect_gauges() -> dict[str, float]:
+    with _lock:
+        result = dict(_gauges)
+        callbacks = list(_gauge_callbacks.items())
+    # callback은 락 밖에서 호출 (callback 안에서 다른 지표를 기록해도 교착되지 않도록)
+    for key, callback in callbacks:
+        try:
+            result[key] = float(callback())
+        except Exception:
+            continue
+    return result
+
+
+def histogram(name: str, labels: dict | None = None) -> dict | None:
+    """
+    히스토그램의 현재 값을 반환합니다.
+    buckets: [(상한값, 누적 개수), ...], sum: 합계, count: 전체 개수
+    """
+    with _lock:
+        hist = _histograms.get(_key(name, labels))
+        if hist is None:
+            return None
+        cumulative, total = [], 0
+        for bound, n in zip(hist["buckets"], hist["counts"]):
+            total += n
+            cumulative.append((bound, total))
+        return {"buckets": cumulative, "sum": hist["sum"], "count": hist["count"]}
+
+
+def get(name: str, default: float = 0) -> float:
+    """카운터, 게이지 또는 이동 평균 값을 조회합니다."""
+    with _lock:
+        if name in _counters:
+            return _counters[name]
+        if name in _gauges:
+            return _gauges[name]
+        return _averages.get(name, default)
+
+
+def observe_avg(name: str, value: float) -> float:
+    """값을 지수 이동 평균에 반영하고 갱신된 평균을 반환합니다 (첫 값은 그대로 사용)."""
+    with _lock:
+        prev = _averages.get(name)
+        avg = value if prev is None else prev + EMA_ALPHA * (value - prev)
+        _averages[name] = avg
+        return avg
+
+
+def snapshot() -> dict[str, float]:
+    """현재 모든 지표 값을 dict로 반환합니다 (히스토그램은 _count, _sum으로 요약)."""
+    gauges = _collect_gauges()
+    with _lock:
+        result = {**_averages, **gauges, **_counters}
+        for key, hist in _histograms.items():
+            name, brace, labels = key.partition("{")
+            result[f"{name}_count{brace}{labels}"] = hist["count"]
+            result[f"{name}_sum{brace}{labels}"] = hist["sum"]
+        return result
+
+
+def _split(key: str) -> tuple[str, str]:
+    """'name{a="1"}' → ('name', 'a="1"')"""
+    name, _, labels = key.partition("{")
+    return name, labels[:-1] if labels else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _sample(name: str, labels: str, value: float, extra: str = "") -> str:
+    pairs = ",".join(p for p in (labels, extra) if p)
+    return f"{name}{{{pairs}}} {_format_value(value)}" if pairs else f"{name} {_format_value(value)}"
+
+
+def render_prometheus() -> str:
+    """
+    모든 지표를 Prometheus 텍스트 노출 형식(0.0.4)으로 반환합니다.
+    - 카운터 → counter, 게이지/이동 평균 → gauge
+    - 히스토그램 → 누적 _bucket{le=...}(+Inf 포함), _sum, _count
+    """
+    gauges = _collect_gauges()
+    with _lock:
+        families: dict[str, tuple[str, list[str]]] = {}
+
+        def family(name: str, kind: str) -> list[str]:
+            return families.setdefault(name, (kind, []))[1]
+
+        for key, value in _counters.items():
+            name, labels = _split(key)
+            family(name, "counter").append(_sample(name, labels, value))
+        for key, value in {**_averages, **gauges}.items():
+            name, labels = _split(key)
+            family(name, "gauge").append(_sample(name, labels, value))
+        for key, hist in _histograms.items():
+            name, labels = _split(key)
+            lines = family(name, "histogram")
+            total = 0
+            for bound, n in zip(hist["buckets"], hist["counts"]):
+                total += n
+                lines.append(_sample(f"{name}_bucket", labels, total, f'le="{_format_value(bound)}"'))
+            lines.append(_sample(f"{name}_bucket", labels, hist["count"], 'le="+Inf"'))
+            lines.append(_sample(f"{name}_sum", labels, hist["sum"]))
+            lines.append(_sample(f"{name}_count", labels, hist["count"]))
+
+    output = []
+    for name in sorted(families):
+        kind, lines = families[name]
+        output.append(f"# TYPE {name} {kind}")
+        output.extend(lines)
+    return "\n".join(output) + "\n"
+
+
+def reset() -> None:
+    """모든 지표를 초기화합니다 (테스트/벤치마크용). 등록된 게이지 callback은 유지합니다."""
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _averages.clear()
+        _histograms.clear()
@@ -1,34 +1,118 @@
 """
-Pinecone 전공 인덱스를 처음부터 다시 구성할 때 사용하는 유틸리티 스크립트.
+Pinecone 전공 인덱스를 재구성할 때 사용하는 유틸리티 스크립트.
 
-로컬 JSON 데이터를 MajorDoc으로 변환한 뒤 Pinecone 네임스페이스를 비우고
-모든 문서를 재업서트하는 일련의 과정을 자동화합니다.
+MySQL 전공 데이터를 MajorDoc으로 변환한 뒤, 마지막 인덱싱 시점의 manifest(doc_id → 내용 해시)와
+비교하여 바뀐 문서만 임베딩/업서트하고 사라진 문서는 삭제합니다.
+변경되지 않은 벡터는 그대로 두므로 재구축 중에도 검색 품질이 유지됩니다.
+
+사용법:
+    python -m backend.rag.build_major_index            # 증분 재인덱싱
+    python -m backend.rag.build_major_index --dry-run  # 변경 내역만 출력
+    python -m backend.rag.build_major_index --full     # 네임스페이스를 비우고 전체 재적재
 """
 
 from __future__ import annotations
 
-from backend.rag.loader import load_major_detail, build_all_major_docs
+import argparse
+
+from backend.config import get_settings
+from backend.rag.index_manifest import (
+    ManifestDiff,
+    diff_manifest,
+    doc_hash,
+    load_manifest,
+    save_manifest,
+)
+from backend.rag.ingest_pipeline import Checkpoint, default_checkpoint_path
+from backend.rag.loader import MajorRecord, load_major_detail, build_all_major_docs
 from backend.rag.vectorstore import (
+    _get_major_namespace,
     clear_major_index,
+    delete_docs,
     index_major_docs,
     get_major_vectorstore,
+    major_doc_metadata,
+    refresh_index_descriptor,
 )
 
 
-def rebuild_major_index() -> None:
-    # 로컬 JSON → MajorDoc 생성 → Pinecone 업서트 순서로 인덱스를 재구축
-    records = load_major_detail()
+def rebuild_major_index(
+    dry_run: bool = False,
+    full: bool = False,
+    records: list[MajorRecord] | None = None,
+) -> ManifestDiff:
+    """
+    전공 인덱스를 manifest 기반으로 증분 재구축하고 변경 내역을 반환합니다.
+
+    Args:
+        dry_run: True면 임베딩/업서트/삭제 없이 변경 내역만 계산
+        full: True면 기존처럼 네임스페이스를 비우고 모든 문서를 다시 업서트
+        records: 이미 로드한 MajorRecord 목록 (없으면 DB에서 로드)
+    """
+    if records is None:
+        records = load_major_detail()
     docs = build_all_major_docs(records)
     print(f"Loaded {len(records)} majors and prepared {len(docs)} documents.")
 
+    # 같은 doc_id가 여러 번 나오면 마지막 문서를 사용 (Pinecone 업서트 결과와 동일)
+    docs_by_id = {doc.doc_id: doc for doc in docs}
+    new_manifest = {
+        doc_id: doc_hash(doc.text, major_doc_metadata(doc))
+        for doc_id, doc in docs_by_id.items()
+    }
+
+    settings = get_settings()
+    index_name = settings.pinecone_index_name
+    namespace = _get_major_namespace()
+    old_manifest = None if full else load_manifest(index_name, namespace)
+    diff = diff_manifest(old_manifest, new_manifest)
+
+    if old_manifest is None and not full:
+        print(
+            "⚠️ No manifest found: all documents will be upserted. "
+            "Vectors of removed documents cannot be detected on this run (use --full to reset)."
+        )
+    print(f"Diff: {diff.summary()}")
+
+    if dry_run:
+        return diff
+
     # 인덱스가 존재하지 않는 환경에서도 안전하게 초기화되도록 벡터스토어를 먼저 준비
+    # 적재 시점에 인덱스 디스크립터(이름/차원/메트릭/호스트)를 갱신 → 워커는 control-plane 호출 없이 연결
+    descriptor = refresh_index_descriptor()
+    print(f"Index descriptor: {descriptor.name} (dim={descriptor.dimension}, host={descriptor.host})")
     get_major_vectorstore()
-    clear_major_index()
-    print("Cleared existing Pinecone index namespace.")
+    checkpoint_path = default_checkpoint_path("majors")
+    if full:
+        clear_major_index()
+        # 이전 실패 실행의 체크포인트가 남아 있으면 비운 네임스페이스에 해당 문서가 빠지므로 함께 삭제
+        Checkpoint(checkpoint_path).clear()
+        print("Cleared existing Pinecone index namespace and ingest checkpoint.")
+
+    if diff.to_upsert:
+        indexed = index_major_docs(
+            [docs_by_id[doc_id] for doc_id in diff.to_upsert],
+            checkpoint_path=checkpoint_path,
+        )
+        print(f"Indexed {indexed} documents into Pinecone.")
+
+    if diff.removed:
+        deleted = delete_docs(diff.removed)
+        print(f"Deleted {deleted} removed documents from Pinecone.")
 
-    indexed = index_major_docs(docs)
-    print(f"Indexed {indexed} documents into Pinecone.")
+    # 업서트/삭제가 모두 끝난 뒤에 manifest 갱신 (중간 실패 시 다음 실행에서 다시 반영)
+    path = save_manifest(index_name, namespace, new_manifest)
+    print(f"Saved manifest: {path}")
+    return diff
 
 
 if __name__ == "__main__":
-    rebuild_major_index()
+    parser = argparse.ArgumentParser(description="Rebuild the Pinecone major index")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="변경 내역(diff)만 출력하고 종료"
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="네임스페이스를 비우고 전체 문서 재적재"
+    )
+    args = parser.parse_args()
+    rebuild_major_index(dry_run=args.dry_run, full=args.full)
@@ -0,0 +1,277 @@
+"""
+전공 진로 정보(career_info) 문서 생성
+
+get_major_career_info 툴이 응답에 사용하는 파생 값(직업 목록, 진출 분야, 성비/만족도,
+학과 활동, 자격증, 주요 과목)을 전공 레코드에서 계산합니다.
+
+이 값들은 원본 데이터가 바뀌지 않는 한 항상 같으므로, 시딩 시 seed_majors.preprocess_item()에서
+한 번 계산하여 majors.career_info 컬럼(JSON)에 저장하고 툴은 저장된 문서를 그대로 사용합니다.
+컬럼이 비어 있거나 문서 버전이 다르면 툴이 build_career_info()로 즉석에서 계산합니다.
+
+DB/LLM 의존성이 없는 순수 함수만 포함하므로 시딩 워커 프로세스에서도 가볍게 임포트할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# 문서 구조가 바뀌면 올려서 이전 시딩 결과 대신 즉석 계산을 사용하도록 함
+CAREER_INFO_VERSION = 1
+
+
+def _strip_html(value: str) -> str:
+    """HTML 태그를 공백으로 치환"""
+    return re.sub(r"<[^>]+>", " ", value or "")
+
+
+def _dedup_preserve_order(items: List[str]) -> List[str]:
+    """빈 값과 중복을 제거하되 순서는 유지"""
+    seen: set[str] = set()
+    ordered: List[str] = []
+    for item in items:
+        if item and item not in seen:
+            seen.add(item)
+            ordered.append(item)
+    return ordered
+
+
+def extract_job_list(job_text: str) -> List[str]:
+    """
+    진출 직업 텍스트를 개별 직업명 리스트로 분리
+
+    Args:
+        job_text: 쉼표/슬래시/줄바꿈으로 구분된 직업명 문자열
+
+    Returns:
+        중복이 제거된 직업명 리스트
+    """
+    if not job_text:
+        return []
+
+    # 구분자로 분리
+    parts = re.split(r"[,/\n]", job_text)
+
+    # 공백 제거 및 너무 짧은 항목 제외
+    cleaned = [part.strip() for part in parts if len(part.strip()) > 1]
+
+    # 중복 제거 (순서 유지)
+    return _dedup_preserve_order(cleaned)
+
+
+def format_enter_field(record: Any) -> List[Dict[str, str]]:
+    """
+    major_detail.json의 enter_field 구조를 사용자에게 보여주기 쉬운 형태로 정리
+
+    Args:
+        record: MajorRecord 객체 (enter_field 속성)
+
+    Returns:
+        진출 분야 정보 리스트
+        [
+            {"category": "기업 및 산업체", "description": "..."},
+            {"category": "연구소", "description": "..."},
+            ...
+        ]
+    """
+    formatted: List[Dict[str, str]] = []
+    raw_list = getattr(record, "enter_field", None)
+
+    if not isinstance(raw_list, list):
+        return formatted
+
+    for item in raw_list:
+        if not isinstance(item, dict):
+            continue
+
+        # 카테고리 추출 (오타 대응: gradeuate/graduate)
+        category = (item.get("gradeuate") or item.get("graduate") or "").strip()
+        description = _strip_html(item.get("description") or "").strip()
+
+        # 카테고리와 설명이 모두 없으면 스킵
+        if not category and not description:
+            continue
+
+        entry: Dict[str, str] = {}
+        if category:
+            entry["category"] = category
+        if description:
+            entry["description"] = description
+
+        formatted.append(entry)
+
+    return formatted
+
+
+def format_career_activities(record: Any) -> List[Dict[str, str]]:
+    """
+    학과 준비 활동(career_act)을 act_name/description 짝으로 정리
+
+    Args:
+        record: MajorRecord 객체 (career_act 속성)
+
+    Returns:
+        추천 활동 정보 리스트
+        [
+            {"act_name": "건축박람회", "act_description": "..."},
+            {"act_name": "코딩대회", "act_description": "..."},
+            ...
+        ]
+    """
+    activities: List[Dict[str, str]] = []
+    raw_list = getattr(record, "career_act", None)
+
+    if not isinstance(raw_list, list):
+        return activities
+
+    for item in raw_list:
+        if not isinstance(item, dict):
+            continue
+
+        name = (item.get("act_name") or "").strip()
+        description = _strip_html(item.get("act_description") or "").strip()
+
+        # 이름과 설명이 모두 없으면 스킵
+        if not name and not description:
+            continue
+
+        entry: Dict[str, str] = {}
+        if name:
+            entry["act_name"] = name
+        if description:
+            entry["act_description"] = description
+
+        activities.append(entry)
+
+    return activities
+
+
+def parse_qualifications(record: Any) -> Tuple[str, List[str]]:
+    """
+    qualifications 필드를 문자열/리스트 여부에 관계없이 일관된 형태로 변환
+
+    Args:
+        record: MajorRecord 객체 (qualifications 속성)
+
+    Returns:
+        (joined_text, list) 튜플
+        - joined_text: 쉼표로 연결된 자격증 문자열
+        - list: 개별 자격증 리스트
+    """
+    raw_value = getattr(record, "qualifications", None)
+
+    if raw_value is None:
+        return "", []
+
+    tokens: List[str] = []
+
+    # 리스트 타입 처리
+    if isinstance(raw_value, list):
+        tokens = [str(item).strip() for item in raw_value if str(item).strip()]
+    # 문자열 타입 처리
+    else:
+        text = str(raw_value).strip()
+        if text:
+            parts = [p.strip() for p in re.split(r"[,/\n]", text) if p.strip()]
+            tokens = parts
+
+    # 중복 제거
+    deduped = _dedup_preserve_order(tokens)
+
+    # 쉼표로 연결
+    joined = ", ".join(deduped)
+
+    return joined, deduped
+
+
+def format_main_subjects(record: Any) -> List[Dict[str, str]]:
+    """
+    main_subject 배열에서 과목명과 요약을 추출하여 정리
+
+    Args:
+        record: MajorRecord 객체 (main_subject 속성)
+
+    Returns:
+        주요 과목 정보 리스트
+        [
+            {"SBJECT_NM": "건축구조시스템", "SBJECT_SUMRY": "..."},
+            {"SBJECT_NM": "건축설계", "SBJECT_SUMRY": "..."},
+            ...
+        ]
+    """
+    subjects: List[Dict[str, str]] = []
+    raw_list = getattr(record, "main_subject", None)
+
+    if not isinstance(raw_list, list):
+        return subjects
+
+    for item in raw_list:
+        if not isinstance(item, dict):
+            continue
+
+        # 과목명 추출 (다양한 키 이름 지원)
+        name = (item.get("SBJECT_NM") or item.get("subject_name") or "").strip()
+        summary = _strip_html(
+            item.get("SBJECT_SUMRY") or item.get("subject_description") or ""
+        ).strip()
+
+        # 과목명과 요약이 모두 없으면 스킵
+        if not name and not summary:
+            continue
+
+        entry: Dict[str, str] = {}
+        if name:
+            entry["SBJECT_NM"] = name
+        if summary:
+            entry["SBJECT_SUMRY"] = summary
+
+        subjects.append(entry)
+
+    return subjects
+
+
+def extract_chart_breakdown(chart_data: Any) -> Tuple[Any, Any]:
+    """chart_data 첫 블록에서 (성비, 만족도) 원본 값을 꺼냅니다."""
+    if chart_data and isinstance(chart_data, list):
+        stats_block = chart_data[0]
+        if isinstance(stats_block, dict):
+            return stats_block.get("gender"), stats_block.get("satisfaction")
+    return None, None
+
+
+def build_career_info(record: Any) -> Dict[str, Any]:
+    """
+    전공 레코드에서 get_major_career_info 응답용 파생 값을 한 번에 계산합니다.
+
+    Args:
+        record: job, enter_field, career_act, qualifications, main_subject,
+                chart_data(또는 gender/satisfaction) 속성을 가진 객체
+
+    Returns:
+        {"version", "jobs", "job_summary", "enter_field", "gender_ratio", "satisfaction",
+         "career_act", "qualifications", "qualifications_list", "main_subject"}
+    """
+    job_text = (getattr(record, "job", "") or "").strip()
+    gender, satisfaction = extract_chart_breakdown(getattr(record, "chart_data", None))
+    if gender is None and satisfaction is None:
+        gender = getattr(record, "gender", None)
+        satisfaction = getattr(record, "satisfaction", None)
+    qualifications_text, qualifications_list = parse_qualifications(record)
+
+    return {
+        "version": CAREER_INFO_VERSION,
+        "jobs": extract_job_list(job_text),
+        "job_summary": job_text,
+        "enter_field": format_enter_field(record),
+        "gender_ratio": gender,
+        "satisfaction": satisfaction,
+        "career_act": format_career_activities(record),
+        "qualifications": qualifications_text,
+        "qualifications_list": qualifications_list,
+        "main_subject": format_main_subjects(record),
+    }
+
+
+def is_current(info: Optional[Dict[str, Any]]) -> bool:
+    """저장된 문서를 그대로 사용할 수 있는지 (현재 버전인지) 확인"""
+    return isinstance(info, dict) and info.get("version") == CAREER_INFO_VERSION
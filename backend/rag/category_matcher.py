@@ -0,0 +1,102 @@
+"""
+전공 카테고리 쿼리 확장용 매처
+
+tools._expand_category_query는 사용자 입력이
+1) 대분류(key)인지, 2) 세부 분류(value) 문자열의 일부인지에 따라 검색 토큰을 다르게 만듭니다.
+기존에는 2)를 `any(raw in v for values in categories.values() for v in values)`로 확인하여
+호출마다 수천 개의 세부 분류 문자열을 선형 탐색했습니다.
+
+CategoryMatcher는 카테고리 데이터가 로드될 때 한 번 컴파일됩니다.
+- 대분류: dict로 key → 미리 분리해 둔 확장 토큰 리스트 (O(1) 조회)
+- 세부 분류: 모든 value의 접미사를 정렬한 색인(SuffixIndex)
+  → "raw가 어떤 value의 부분 문자열인가"를 이진 탐색 한 번으로 판정
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+_DETAIL_SPLIT = re.compile(r"[\/,()]")
+_QUERY_SPLIT = re.compile(r"[\/,]")
+
+
+def _dedup_preserve_order(items: List[str]) -> List[str]:
+    seen: set[str] = set()
+    ordered: List[str] = []
+    for item in items:
+        if item and item not in seen:
+            seen.add(item)
+            ordered.append(item)
+    return ordered
+
+
+class SuffixIndex:
+    """
+    문자열 목록의 모든 접미사를 정렬해 둔 색인.
+    "pattern이 어떤 문자열의 부분 문자열인가"는 "pattern으로 시작하는 접미사가 있는가"와 같으므로
+    이진 탐색 한 번(O(len(pattern) · log n))으로 판정합니다.
+    세부 분류 문자열은 짧아서(평균 10자 내외) 접미사 수가 전체 글자 수 수준으로 유지됩니다.
+    """
+
+    def __init__(self, texts: List[str]):
+        self._suffixes: List[str] = sorted(
+            {text[i:] for text in texts for i in range(len(text))}
+        )
+
+    def contains(self, pattern: str) -> bool:
+        """pattern이 원본 문자열 중 하나의 부분 문자열인지 여부 (빈 문자열은 항상 True)"""
+        if not pattern:
+            return True
+        idx = bisect_left(self._suffixes, pattern)
+        return idx < len(self._suffixes) and self._suffixes[idx].startswith(pattern)
+
+    def __len__(self) -> int:
+        return len(self._suffixes)
+
+
+class CategoryMatcher:
+    """카테고리 dict({대분류: [세부 분류, ...]})로부터 컴파일한 쿼리 확장기"""
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        # 대분류 → 세부 분류를 "/", ",", "()" 기준으로 분리한 토큰
+        self._key_tokens: Dict[str, List[str]] = {}
+        details: List[str] = []
+        for key, values in categories.items():
+            tokens: List[str] = []
+            for item in values:
+                tokens.extend(p.strip() for p in _DETAIL_SPLIT.split(item) if p.strip())
+                details.append(item)
+            self._key_tokens[key] = tokens
+
+        self._details = SuffixIndex(list(dict.fromkeys(details)))
+
+    def is_category(self, query: str) -> bool:
+        return query in self._key_tokens
+
+    def is_detail_substring(self, query: str) -> bool:
+        """query가 세부 분류 중 하나의 부분 문자열인지 (기존 `raw in v` 선형 탐색과 동일한 결과)"""
+        return self._details.contains(query)
+
+    def expand(self, query: str) -> List[str]:
+        """
+        쿼리를 검색 토큰 리스트로 확장합니다. (중복 제거, 순서 유지)
+
+        - 대분류(key): 해당 key의 모든 세부 분류 토큰
+        - 세부 분류의 일부: "/", ",", "()" 기준으로 분리
+        - 그 외: "/", "," 기준으로 분리 (분리 결과가 없으면 원문)
+        """
+        raw = query.strip()
+        if not raw:
+            return []
+
+        key_tokens: Optional[List[str]] = self._key_tokens.get(raw)
+        if key_tokens is not None:
+            tokens = list(key_tokens)
+        elif self.is_detail_substring(raw):
+            tokens = [p.strip() for p in _DETAIL_SPLIT.split(raw) if p.strip()]
+        else:
+            tokens = [p.strip() for p in _QUERY_SPLIT.split(raw) if p.strip()] or [raw]
+
+        return _dedup_preserve_order(tokens)
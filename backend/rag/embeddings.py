@@ -10,15 +10,44 @@
 """
 # backend/rag/embeddings.py
 import os
+import threading
 
-from langchain_openai import OpenAIEmbeddings
+from langchain_core.embeddings import Embeddings
 
+from backend import metrics, tracing
 from backend.config import get_settings
 
 # 임베딩 모델 싱글톤 캐시
 # 여러 쿼리가 동시에 실행될 때 모델을 중복 로딩하지 않도록 전역 변수에 캐싱
 # 특히 HuggingFace 모델은 로딩 시간이 길기 때문에 캐싱이 중요함
 _EMBEDDINGS_CACHE = None
+_EMBEDDINGS_LOCK = threading.Lock()
+
+
+class TracedEmbeddings(Embeddings):
+    """
+    임베딩 호출을 트레이싱 span(embedding.query / embedding.documents)과
+    지연 시간 히스토그램(embedding_duration_seconds)으로 감싸는 래퍼
+    나머지 속성은 원래 모델로 위임합니다. (트레이싱 비활성화 시 span은 아무것도 하지 않음)
+    """
+
+    def __init__(self, model: Embeddings):
+        self.model = model
+
+    def embed_query(self, text: str) -> list[float]:
+        with tracing.span("embedding.query", tracing.SPAN_KIND_CLIENT, chars=len(text)), \
+                metrics.timed("embedding_duration_seconds", {"operation": "query"}):
+            return self.model.embed_query(text)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        with tracing.span("embedding.documents", tracing.SPAN_KIND_CLIENT, count=len(texts)), \
+                metrics.timed("embedding_duration_seconds", {"operation": "documents"}):
+            return self.model.embed_documents(texts)
+
+    def __getattr__(self, name):
+        if name == "model":
+            raise AttributeError(name)
+        return getattr(self.model, name)
 
 
 def get_embeddings():
@@ -38,7 +67,7 @@ def get_embeddings():
       - huggingface: HuggingFace의 임베딩 모델 (예: upskyy/bge-m3-korean)
 
     Returns:
-        LangChain Embeddings 인스턴스 (OpenAIEmbeddings 또는 HuggingFaceEmbeddings)
+        LangChain Embeddings 인스턴스 (OpenAIEmbeddings 또는 HuggingFaceEmbeddings를 감싼 TracedEmbeddings)
 
     Raises:
         ValueError: 지원하지 않는 EMBEDDING_PROVIDER가 설정된 경우
@@ -46,11 +75,19 @@ def get_embeddings():
     global _EMBEDDINGS_CACHE
 
     # 이미 로드된 모델이 있으면 재사용 (싱글톤 패턴)
-    # 여러 쿼리가 동시에 실행되어도 모델은 한 번만 로딩됨
+    # 여러 쿼리가 동시에 실행되어도 모델은 한 번만 로딩됨 (첫 생성은 락으로 보호)
+    metrics.cache_access("embeddings_model", hit=_EMBEDDINGS_CACHE is not None)
     if _EMBEDDINGS_CACHE is not None:
         return _EMBEDDINGS_CACHE
 
-    settings = get_settings()
+    with _EMBEDDINGS_LOCK:
+        if _EMBEDDINGS_CACHE is None:
+            _EMBEDDINGS_CACHE = TracedEmbeddings(_create_embeddings(get_settings()))
+        return _EMBEDDINGS_CACHE
+
+
+def _create_embeddings(settings) -> Embeddings:
+    """EMBEDDING_PROVIDER에 맞는 임베딩 모델 인스턴스를 생성합니다."""
     provider = settings.embedding_provider.lower()
 
     # 임베딩 문맥 고려 사항
@@ -61,11 +98,12 @@ def get_embeddings():
         # OpenAI 임베딩 사용
         # 예: text-embedding-3-small (1536차원, 저렴), text-embedding-3-large (3072차원, 고품질)
         print("Using OpenAI Embeddings")
-        _EMBEDDINGS_CACHE = OpenAIEmbeddings(
+        from langchain_openai import OpenAIEmbeddings
+
+        return OpenAIEmbeddings(
             model=settings.embedding_model_name,  # .env의 EMBEDDING_MODEL_NAME
             openai_api_key=settings.openai_api_key
         )
-        return _EMBEDDINGS_CACHE
 
     if provider == "huggingface":
         # HuggingFace 임베딩 사용 (로컬 또는 Inference API)
@@ -86,12 +124,11 @@ def get_embeddings():
         # normalize_embeddings=True: 벡터를 단위 벡터로 정규화 (코사인 유사도 계산에 유리)
         encode_kwargs = {"normalize_embeddings": True}
 
-        _EMBEDDINGS_CACHE = HuggingFaceEmbeddings(
+        return HuggingFaceEmbeddings(
             model_name=settings.embedding_model_name,  # 예: "upskyy/bge-m3-korean"
             model_kwargs=model_kwargs,
             encode_kwargs=encode_kwargs
         )
-        return _EMBEDDINGS_CACHE
 
     # 지원하지 않는 제공자
     raise ValueError(
@@ -0,0 +1,156 @@
+"""
+벡터 인덱스 manifest (doc_id → 내용 해시) / 인덱스 디스크립터 관리 모듈
+
+Pinecone 인덱스를 재구축할 때 네임스페이스를 비우고 전체 문서를 다시 임베딩하는 대신,
+마지막으로 업서트한 문서들의 해시를 로컬 파일에 기록해 두고 바뀐 문서만 반영합니다.
+
+인덱스 디스크립터(이름, 차원, 메트릭, 호스트)도 같은 디렉토리에 기록합니다.
+워커는 이 파일의 호스트로 인덱스에 바로 연결하므로 기동 시 control-plane 호출(list_indexes, describe_index)과
+차원 추론용 임베딩 호출을 하지 않습니다. (적재 시점 또는 backend/scripts/index_descriptor.py refresh로 갱신)
+
+** 파일 위치 **
+    {VECTORSTORE_DIR}/manifests/{index_name}__{namespace}.json   # doc_id → 내용 해시
+    {VECTORSTORE_DIR}/manifests/{index_name}.index.json          # 인덱스 디스크립터
+
+** 사용 예시 **
+    new = {doc.doc_id: doc_hash(doc.text, meta) for doc, meta in ...}
+    diff = diff_manifest(load_manifest(index, ns), new)
+    # diff.to_upsert → 임베딩/업서트, diff.removed → 삭제
+    save_manifest(index, ns, new)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from backend.config import get_settings, resolve_path
+
+
+@dataclass
+class ManifestDiff:
+    """이전 manifest 대비 새 문서 집합의 변경 내역"""
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def to_upsert(self) -> list[str]:
+        return self.added + self.changed
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+    def summary(self) -> str:
+        return (
+            f"added={len(self.added)}, changed={len(self.changed)}, "
+            f"removed={len(self.removed)}, unchanged={self.unchanged}"
+        )
+
+
+def doc_hash(text: str, metadata: dict[str, Any] | None = None) -> str:
+    """
+    문서 텍스트와 메타데이터로 내용 해시를 계산합니다.
+    메타데이터만 바뀐 경우(예: 연봉 수치)도 다시 업서트되도록 함께 해시합니다.
+    """
+    payload = json.dumps(
+        {"text": text, "metadata": metadata or {}},
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def manifest_path(index_name: str, namespace: str | None) -> Path:
+    settings = get_settings()
+    base = resolve_path(settings.vectorstore_dir) / "manifests"
+    return base / f"{index_name}__{namespace or 'default'}.json"
+
+
+def load_manifest(index_name: str, namespace: str | None) -> dict[str, str] | None:
+    """저장된 manifest를 읽습니다. 아직 없으면 None."""
+    path = manifest_path(index_name, namespace)
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(
+    index_name: str, namespace: str | None, manifest: dict[str, str]
+) -> Path:
+    """manifest를 저장합니다 (임시 파일에 쓴 뒤 교체하여 중간에 실패해도 기존 파일 유지)."""
+    path = manifest_path(index_name, namespace)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp_path, path)
+    return path
+
+
+def diff_manifest(old: dict[str, str] | None, new: dict[str, str]) -> ManifestDiff:
+    """이전 manifest(old)와 새 manifest(new)를 비교합니다. old가 None이면 전부 추가로 봅니다."""
+    old = old or {}
+    diff = ManifestDiff()
+    for doc_id, digest in new.items():
+        previous = old.get(doc_id)
+        if previous is None:
+            diff.added.append(doc_id)
+        elif previous != digest:
+            diff.changed.append(doc_id)
+        else:
+            diff.unchanged += 1
+    diff.removed = [doc_id for doc_id in old if doc_id not in new]
+    return diff
+
+
+# ==================== 인덱스 디스크립터 ====================
+
+
+@dataclass
+class IndexDescriptor:
+    """Pinecone 인덱스 연결 정보 (describe_index 결과 중 필요한 값)"""
+
+    name: str
+    dimension: int
+    metric: str
+    host: str
+    embedding_model: str = ""  # 기록 당시 EMBEDDING_MODEL_NAME (모델이 바뀌면 다시 조회)
+    refreshed_at: str = ""
+
+
+def descriptor_path(index_name: str) -> Path:
+    settings = get_settings()
+    return resolve_path(settings.vectorstore_dir) / "manifests" / f"{index_name}.index.json"
+
+
+def load_index_descriptor(index_name: str) -> IndexDescriptor | None:
+    """저장된 인덱스 디스크립터를 읽습니다. 없거나 형식이 맞지 않으면 None."""
+    path = descriptor_path(index_name)
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return IndexDescriptor(**json.load(f))
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
+def save_index_descriptor(descriptor: IndexDescriptor) -> Path:
+    """인덱스 디스크립터를 저장합니다 (save_manifest와 같이 임시 파일에 쓴 뒤 교체)."""
+    path = descriptor_path(descriptor.name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(asdict(descriptor), f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,267 @@
+"""
+배치 단위 임베딩 + 업서트 파이프라인
+
+수만 개의 문서를 `add_texts` 한 번으로 넘기면 배치 크기 조절, 재시도, 진행 상황 확인이 불가능합니다.
+이 모듈은 문서를 배치로 나누어 스레드 풀에서 동시에 임베딩/업서트하고, 완료된 문서를 체크포인트 파일에
+기록하여 중간에 실패해도 이어서 실행할 수 있게 합니다.
+
+** 처리 흐름 (배치 단위) **
+1. embeddings.embed_documents(texts)
+2. index.upsert(vectors=[{id, values, metadata}], namespace)
+   - PineconeVectorStore와 같은 형식으로 원문 텍스트를 metadata[text_key]에 저장
+3. 체크포인트에 (doc_id, 내용 해시) 기록
+
+** 재시도 **
+429, 5xx, 네트워크/타임아웃 오류는 지수 백오프(+jitter)로 재시도하고,
+그 외 오류나 재시도 횟수 초과 시 예외를 그대로 발생시킵니다 (체크포인트는 유지).
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from backend.config import get_settings, resolve_path
+from backend.rag.index_manifest import doc_hash
+
+# 재시도 대상 HTTP 상태 코드
+TRANSIENT_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+# openai / httpx 등에서 일시적 오류를 나타내는 예외 클래스 이름
+TRANSIENT_ERROR_NAMES = {
+    "RateLimitError",
+    "APIConnectionError",
+    "APITimeoutError",
+    "InternalServerError",
+    "ServiceUnavailableError",
+    "ConnectTimeout",
+    "ReadTimeout",
+    "RemoteProtocolError",
+    "ProtocolError",
+    "MaxRetryError",
+}
+
+
+@dataclass
+class IngestItem:
+    """파이프라인에 넣을 문서 하나 (ID, 임베딩할 텍스트, 메타데이터)"""
+
+    doc_id: str
+    text: str
+    metadata: dict[str, Any]
+
+
+@dataclass
+class PipelineStats:
+    total: int = 0
+    upserted: int = 0
+    skipped: int = 0  # 체크포인트에 기록되어 건너뛴 문서 수
+    batches: int = 0
+    retries: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def docs_per_sec(self) -> float:
+        return self.upserted / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"upserted={self.upserted}/{self.total} (skipped={self.skipped}), "
+            f"batches={self.batches}, retries={self.retries}, "
+            f"elapsed={self.elapsed:.1f}s, throughput={self.docs_per_sec:.1f} docs/sec"
+        )
+
+
+def default_checkpoint_path(name: str) -> Path:
+    """체크포인트 기본 경로: {VECTORSTORE_DIR}/checkpoints/{name}.jsonl"""
+    return resolve_path(get_settings().vectorstore_dir) / "checkpoints" / f"{name}.jsonl"
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """재시도하면 성공할 가능성이 있는 오류인지 판단합니다."""
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    status = getattr(exc, "status", None) or getattr(exc, "status_code", None)
+    if isinstance(status, int) and status in TRANSIENT_STATUS_CODES:
+        return True
+    return type(exc).__name__ in TRANSIENT_ERROR_NAMES
+
+
+def call_with_retry(
+    func: Callable[[], Any],
+    max_retries: int,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    on_retry: Callable[[int, BaseException], None] | None = None,
+):
+    """일시적 오류면 지수 백오프로 재시도하며 func()를 호출합니다."""
+    attempt = 0
+    while True:
+        try:
+            return func()
+        except Exception as exc:
+            if attempt >= max_retries or not is_transient_error(exc):
+                raise
+            attempt += 1
+            if on_retry:
+                on_retry(attempt, exc)
+            delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+            time.sleep(delay * (0.5 + random.random() / 2))
+
+
+class Checkpoint:
+    """
+    완료된 문서를 JSON Lines 파일에 기록하는 체크포인트.
+    내용 해시를 함께 저장하여, 체크포인트 이후 바뀐 문서는 건너뛰지 않고 다시 업서트합니다.
+    """
+
+    def __init__(self, path: str | Path | None):
+        self.path = Path(path) if path else None
+        self._done: dict[str, str] = {}
+        self._lock = threading.Lock()
+        if self.path and self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        self._done.update(json.loads(line))
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def is_done(self, doc_id: str, digest: str) -> bool:
+        return self._done.get(doc_id) == digest
+
+    def record(self, entries: dict[str, str]) -> None:
+        with self._lock:
+            self._done.update(entries)
+            if self.path:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entries, ensure_ascii=False) + "\n")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._done.clear()
+            if self.path and self.path.exists():
+                self.path.unlink()
+
+
+def run_embed_upsert(
+    items: Iterable[IngestItem],
+    embeddings,
+    index,
+    namespace: str | None = None,
+    text_key: str = "text",
+    batch_size: int | None = None,
+    max_workers: int | None = None,
+    max_retries: int | None = None,
+    checkpoint_path: str | Path | None = None,
+    label: str = "ingest",
+) -> PipelineStats:
+    """
+    문서를 배치로 나누어 스레드 풀에서 임베딩/업서트합니다.
+
+    Args:
+        items: IngestItem 목록
+        embeddings: LangChain Embeddings (embed_documents 사용)
+        index: Pinecone Index 핸들 (upsert 사용)
+        namespace: 업서트할 네임스페이스
+        text_key: 원문 텍스트를 저장할 메타데이터 키 (PineconeVectorStore의 text_key와 동일해야 함)
+        batch_size / max_workers / max_retries: None이면 .env 설정(INGEST_*) 사용
+        checkpoint_path: 지정하면 완료된 문서를 기록하고, 다시 실행할 때 건너뜁니다.
+                         모든 배치가 성공하면 체크포인트 파일을 삭제합니다.
+        label: 진행 상황 출력용 이름
+
+    Returns:
+        PipelineStats: 처리 결과 및 처리량(docs/sec)
+    """
+    settings = get_settings()
+    batch_size = max(batch_size or settings.ingest_batch_size, 1)
+    max_workers = max(max_workers or settings.ingest_max_workers, 1)
+    max_retries = settings.ingest_max_retries if max_retries is None else max_retries
+
+    checkpoint = Checkpoint(checkpoint_path)
+    stats = PipelineStats()
+    pending: list[tuple[IngestItem, str]] = []
+    for item in items:
+        stats.total += 1
+        digest = doc_hash(item.text, item.metadata)
+        if checkpoint.is_done(item.doc_id, digest):
+            stats.skipped += 1
+        else:
+            pending.append((item, digest))
+
+    if stats.skipped:
+        print(f"[{label}] Resuming from checkpoint: skipping {stats.skipped} documents.")
+
+    batches = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+    stats_lock = threading.Lock()
+    started = time.monotonic()
+
+    def on_retry(attempt: int, exc: BaseException) -> None:
+        with stats_lock:
+            stats.retries += 1
+        print(f"[{label}] Transient error (retry {attempt}/{max_retries}): {exc}")
+
+    def process(batch: list[tuple[IngestItem, str]]) -> int:
+        texts = [item.text for item, _ in batch]
+        vectors_values = call_with_retry(
+            lambda: embeddings.embed_documents(texts), max_retries, on_retry=on_retry
+        )
+        vectors = [
+            {
+                "id": item.doc_id,
+                "values": values,
+                "metadata": {**item.metadata, text_key: item.text},
+            }
+            for (item, _), values in zip(batch, vectors_values)
+        ]
+        upsert_kwargs: dict[str, Any] = {"vectors": vectors}
+        if namespace:
+            upsert_kwargs["namespace"] = namespace
+        call_with_retry(
+            lambda: index.upsert(**upsert_kwargs), max_retries, on_retry=on_retry
+        )
+        checkpoint.record({item.doc_id: digest for item, digest in batch})
+        return len(batch)
+
+    def report() -> None:
+        elapsed = time.monotonic() - started
+        rate = stats.upserted / elapsed if elapsed > 0 else 0.0
+        print(
+            f"[{label}] {stats.upserted + stats.skipped}/{stats.total} docs "
+            f"({rate:.1f} docs/sec)"
+        )
+
+    # 제출된 배치 수를 max_workers * 2로 제한하여 메모리 사용량을 일정하게 유지
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = set()
+        try:
+            for batch in batches:
+                if len(in_flight) >= max_workers * 2:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        stats.upserted += future.result()
+                        stats.batches += 1
+                    report()
+                in_flight.add(executor.submit(process, batch))
+
+            for future in in_flight:
+                stats.upserted += future.result()
+                stats.batches += 1
+        except BaseException:
+            # 실패 시 아직 시작하지 않은 배치는 취소 (완료된 배치는 체크포인트에 남아 있음)
+            for future in in_flight:
+                future.cancel()
+            raise
+
+    stats.elapsed = time.monotonic() - started
+    checkpoint.clear()
+    print(f"[{label}] Done: {stats.summary()}")
+    return stats
@@ -87,6 +87,34 @@ class UniversityMajorDoc:
     department: str
     major_name: str  # 표준 학과명 (대분류)
     text: str  # 검색용 텍스트 (예: "연세대학교 인공지능융합대학")
+    # 같은 텍스트가 여러 표준 학과에 속할 때 합쳐진 전체 목록 (collapse_university_major_docs)
+    major_ids: list[str] = field(default_factory=list)
+    major_names: list[str] = field(default_factory=list)
+
+
+@dataclass
+class DedupReport:
+    """코퍼스 전체 텍스트 중복 제거 결과"""
+
+    total_docs: int = 0
+    unique_texts: int = 0
+    max_fanout: int = 0  # 하나의 텍스트에 합쳐진 최대 문서 수
+
+    @property
+    def removed(self) -> int:
+        return self.total_docs - self.unique_texts
+
+    @property
+    def dedup_ratio(self) -> float:
+        """제거된 문서 비율 (0.0 ~ 1.0). 임베딩 호출/벡터 수가 이 비율만큼 줄어듭니다."""
+        return self.removed / self.total_docs if self.total_docs else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.total_docs} docs -> {self.unique_texts} unique texts "
+            f"(removed {self.removed}, dedup ratio {self.dedup_ratio:.1%}, "
+            f"max fan-out {self.max_fanout})"
+        )
 
 
 def _slugify(value: str) -> str:
@@ -222,30 +250,30 @@ def load_major_detail(path: str | Path | None = None) -> list[MajorRecord]:
                             summary=row.summary or "",
                             interest=row.interest or "",
                             property=row.property or "",
-                            relate_subject=row.relate_subject,
+                            relate_subject=row.json_value("relate_subject"),
                             job=row.job or "",
-                            enter_field=row.enter_field,
+                            enter_field=row.json_value("enter_field"),
                             salary=row.salary,
                             employment=row.employment,
                             employment_rate=row.employment_rate,
                             acceptance_rate=row.acceptance_rate,
-                            department_aliases=row.department_aliases or [],
-                            career_act=row.career_act,
+                            department_aliases=row.json_value(
+                                "department_aliases", []
+                            ),
+                            career_act=row.json_value("career_act"),
                             qualifications=row.qualifications,
-                            main_subject=row.main_subject,
-                            university=json.loads(row.university)
-                            if row.university
-                            else [],
-                            chart_data=row.chart_data,
-                            raw=row.raw_data or {},
+                            main_subject=row.json_value("main_subject"),
+                            university=row.json_value("university", []),
+                            chart_data=row.json_value("chart_data"),
+                            raw=row.json_value("raw_data", {}),
                             gender=None,  # DB 컬럼에 없으면 none 또는 추가 필요
                             satisfaction=None,
                         )
                         # gender/satisfaction 통계는 chart_data에서 다시 추출하거나 컬럼 추가 필요
                         # 여기서는 chart_data가 있으면 다시 계산하도록 처리 가능하지만
                         # 일단 있는 데이터로 채워넣음
-                        if row.chart_data and isinstance(row.chart_data, list):
-                            stats_block = row.chart_data[0]
+                        if record.chart_data and isinstance(record.chart_data, list):
+                            stats_block = record.chart_data[0]
                             if isinstance(stats_block, dict):
                                 record.gender = stats_block.get("gender")
                                 record.satisfaction = stats_block.get("satisfaction")
@@ -493,3 +521,46 @@ def build_university_major_docs(record: MajorRecord) -> list[UniversityMajorDoc]
         )
 
     return docs
+
+
+def collapse_university_major_docs(
+    docs: list[UniversityMajorDoc],
+) -> tuple[list[UniversityMajorDoc], DedupReport]:
+    """
+    전체 코퍼스에서 검색용 텍스트가 같은 UniversityMajorDoc을 하나로 합친다.
+
+    같은 "{대학명} {학과명}"이 여러 표준 학과에 속하면 문서가 그 수만큼 만들어지고
+    각각 임베딩되지만 doc_id가 같아 마지막 문서만 남았다.
+    텍스트별로 한 번만 임베딩하고, 속한 표준 학과 전체를 major_ids / major_names에 기록한다.
+    (major_id / major_name에는 처음 등장한 표준 학과를 유지하여 기존 검색 코드와 호환)
+    """
+    grouped: dict[str, list[UniversityMajorDoc]] = {}
+    for doc in docs:
+        grouped.setdefault(_normalize_whitespace(doc.text), []).append(doc)
+
+    collapsed: list[UniversityMajorDoc] = []
+    max_fanout = 0
+    for text, group in grouped.items():
+        first = group[0]
+        major_ids = _unique_preserve_order([d.major_id for d in group if d.major_id])
+        major_names = _unique_preserve_order(
+            [d.major_name for d in group if d.major_name]
+        )
+        max_fanout = max(max_fanout, len(group))
+        collapsed.append(
+            UniversityMajorDoc(
+                doc_id=first.doc_id,
+                major_id=first.major_id,
+                university=first.university,
+                department=first.department,
+                major_name=first.major_name,
+                text=text,
+                major_ids=major_ids,
+                major_names=major_names,
+            )
+        )
+
+    report = DedupReport(
+        total_docs=len(docs), unique_texts=len(collapsed), max_fanout=max_fanout
+    )
+    return collapsed, report
@@ -0,0 +1,212 @@
+"""
+로컬 벡터 검색 백엔드
+
+임베딩 스냅샷(snapshot.py)을 mmap으로 열어 Pinecone 없이 코사인 유사도 검색을 수행합니다.
+`.env`에서 VECTOR_BACKEND=local로 설정하면 vectorstore.py의 get_*_vectorstore()가
+PineconeVectorStore 대신 LocalVectorStore를 반환합니다.
+
+- 네트워크가 없는 개발/테스트 환경, 새 서버의 빠른 기동에 사용
+- 검색 결과 형식(Document, 점수)은 PineconeVectorStore(cosine)와 동일
+- 문서 추가(add_texts)는 지원하지 않음: 인덱싱은 Pinecone에 한 뒤 스냅샷을 다시 내보냄
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Iterable
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from backend import metrics
+
+from .snapshot import Snapshot, SnapshotNamespace, load_snapshot
+
+_SNAPSHOT_CACHE: Snapshot | None = None
+_SNAPSHOT_LOCK = threading.Lock()
+
+
+def get_snapshot() -> Snapshot:
+    """설정된 스냅샷을 한 번만 열어 재사용합니다."""
+    global _SNAPSHOT_CACHE
+    with _SNAPSHOT_LOCK:
+        metrics.cache_access("vector_snapshot", hit=_SNAPSHOT_CACHE is not None)
+        if _SNAPSHOT_CACHE is None:
+            _SNAPSHOT_CACHE = load_snapshot()
+        return _SNAPSHOT_CACHE
+
+
+def _match_condition(value: Any, condition: Any) -> bool:
+    if not isinstance(condition, dict):
+        return value == condition
+    for op, operand in condition.items():
+        if op == "$eq" and not value == operand:
+            return False
+        if op == "$ne" and not value != operand:
+            return False
+        if op == "$in" and not (
+            any(v in operand for v in value) if isinstance(value, list) else value in operand
+        ):
+            return False
+        if op == "$nin" and (
+            any(v in operand for v in value) if isinstance(value, list) else value in operand
+        ):
+            return False
+        if op in ("$gt", "$gte", "$lt", "$lte"):
+            if value is None:
+                return False
+            if op == "$gt" and not value > operand:
+                return False
+            if op == "$gte" and not value >= operand:
+                return False
+            if op == "$lt" and not value < operand:
+                return False
+            if op == "$lte" and not value <= operand:
+                return False
+    return True
+
+
+def match_filter(metadata: dict[str, Any], filter: dict[str, Any] | None) -> bool:
+    """Pinecone 메타데이터 필터 문법($eq, $in, $gte, $and, $or 등)의 기본 연산을 로컬에서 평가합니다."""
+    if not filter:
+        return True
+    for key, condition in filter.items():
+        if key == "$and":
+            if not all(match_filter(metadata, sub) for sub in condition):
+                return False
+        elif key == "$or":
+            if not any(match_filter(metadata, sub) for sub in condition):
+                return False
+        elif not _match_condition(metadata.get(key), condition):
+            return False
+    return True
+
+
+class LocalVectorStore(VectorStore):
+    """스냅샷 네임스페이스 하나를 대상으로 하는 읽기 전용 VectorStore"""
+
+    def __init__(
+        self,
+        namespace: SnapshotNamespace,
+        embedding: Embeddings,
+        text_key: str = "text",
+    ):
+        self._namespace = namespace
+        self._embedding = embedding
+        self._text_key = text_key
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embedding
+
+    def _to_document(self, i: int) -> Document:
+        metadata = dict(self._namespace.metadata[i])
+        text = metadata.pop(self._text_key, "") or ""
+        return Document(page_content=text, metadata=metadata, id=self._namespace.ids[i])
+
+    def similarity_search_by_vector_with_score(
+        self,
+        embedding: list[float],
+        *,
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list[tuple[Document, float]]:
+        """쿼리 벡터와 코사인 유사도가 높은 문서 k개를 (Document, score)로 반환합니다."""
+        size = len(self._namespace)
+        if size == 0 or k <= 0:
+            return []
+
+        query = np.asarray(embedding, dtype=np.float32)
+        if query.shape[0] != self._namespace.vectors.shape[1]:
+            raise ValueError(
+                f"Query dimension {query.shape[0]} does not match snapshot dimension "
+                f"{self._namespace.vectors.shape[1]}"
+            )
+        query_norm = float(np.linalg.norm(query)) or 1.0
+        scores = (self._namespace.vectors @ query) / (self._namespace.norms * query_norm)
+
+        if filter:
+            mask = np.fromiter(
+                (match_filter(meta, filter) for meta in self._namespace.metadata),
+                dtype=bool,
+                count=size,
+            )
+            scores = np.where(mask, scores, -np.inf)
+            size = int(mask.sum())
+            if size == 0:
+                return []
+
+        k = min(k, size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self._to_document(int(i)), float(scores[i])) for i in top]
+
+    def similarity_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list[tuple[Document, float]]:
+        return self.similarity_search_by_vector_with_score(
+            self._embedding.embed_query(query), k=k, filter=filter
+        )
+
+    def similarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list[Document]:
+        return [
+            doc for doc, _ in self.similarity_search_with_score(query, k=k, filter=filter)
+        ]
+
+    def similarity_search_by_vector(
+        self,
+        embedding: list[float],
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list[Document]:
+        return [
+            doc
+            for doc, _ in self.similarity_search_by_vector_with_score(
+                embedding, k=k, filter=filter
+            )
+        ]
+
+    def _select_relevance_score_fn(self) -> Callable[[float], float]:
+        # PineconeVectorStore(cosine)와 같은 변환: [-1, 1] → [0, 1]
+        return lambda score: (score + 1) / 2
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: list[dict] | None = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        raise NotImplementedError(
+            "LocalVectorStore is read-only. Index into Pinecone and export a new snapshot."
+        )
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: list[str],
+        embedding: Embeddings,
+        metadatas: list[dict] | None = None,
+        **kwargs: Any,
+    ) -> "LocalVectorStore":
+        raise NotImplementedError(
+            "LocalVectorStore is read-only. Use backend.rag.snapshot to build snapshots."
+        )
+
+
+def get_local_vectorstore(namespace: str | None, embedding: Embeddings) -> LocalVectorStore:
+    """최신(또는 VECTOR_SNAPSHOT_PATH) 스냅샷의 네임스페이스로 LocalVectorStore를 만듭니다."""
+    return LocalVectorStore(get_snapshot().namespace(namespace), embedding)
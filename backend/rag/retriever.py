@@ -15,10 +15,15 @@
 """
 
 # backend/rag/retriever.py
+import logging
 from dataclasses import dataclass
 from typing import Dict, List, Any
 
-from .vectorstore import get_major_vectorstore
+from backend import metrics, tracing
+
+from .vectorstore import _get_major_namespace, get_major_vectorstore
+
+logger = logging.getLogger(__name__)
 
 
 # Pinecone 검색 결과를 일관된 구조로 다루기 위한 헬퍼 데이터클래스
@@ -48,18 +53,25 @@ def search_major_docs(
         SearchHit 객체 리스트 (문서별 점수, 메타데이터 포함)
     """
     vectorstore = get_major_vectorstore()
-    try:
-        results = vectorstore.similarity_search_by_vector_with_relevance_scores(
-            embedding=query_embedding,
-            k=top_k,
-        )
-    except AttributeError:
-        # langchain_pinecone < 0.2.16 버전 호환: with_relevance_scores 헬퍼가 없을 때 대체 경로 사용
-        # 구버전 라이브러리 사용 시 발생할 수 있는 호환성 문제를 해결하기 위한 예외 처리입니다.
-        results = vectorstore.similarity_search_by_vector_with_score(
-            embedding=query_embedding,
-            k=top_k,
-        )
+    namespace = _get_major_namespace() or ""
+    with tracing.span(
+        "vector.query",
+        tracing.SPAN_KIND_CLIENT,
+        namespace=namespace,
+        top_k=top_k,
+    ), metrics.timed("vector_query_duration_seconds", {"namespace": namespace or "default"}):
+        try:
+            results = vectorstore.similarity_search_by_vector_with_relevance_scores(
+                embedding=query_embedding,
+                k=top_k,
+            )
+        except AttributeError:
+            # langchain_pinecone < 0.2.16 버전 호환: with_relevance_scores 헬퍼가 없을 때 대체 경로 사용
+            # 구버전 라이브러리 사용 시 발생할 수 있는 호환성 문제를 해결하기 위한 예외 처리입니다.
+            results = vectorstore.similarity_search_by_vector_with_score(
+                embedding=query_embedding,
+                k=top_k,
+            )
 
     hits: List[SearchHit] = []
     for doc, score in results:
@@ -77,11 +89,11 @@ def search_major_docs(
         hits.append(hit)
 
     if not hits:
-        print("[Majors] ⚠️  Pinecone returned no results")
+        logger.warning("[Majors] ⚠️  Pinecone returned no results")
     else:
-        print(f"[Majors] ✅ Pinecone search returned {len(hits)} hits")
+        logger.info(f"[Majors] ✅ Pinecone search returned {len(hits)} hits")
         for hit in hits[:5]:
-            print(
+            logger.debug(
                 f"   - {hit.major_name} ({hit.doc_type}) "
                 f"score={hit.score:.3f}, major_id={hit.major_id}"
             )
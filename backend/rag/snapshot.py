@@ -0,0 +1,386 @@
+"""
+임베딩 스냅샷(Snapshot) 아티팩트 모듈
+
+Pinecone에만 저장되어 있던 (id, vector, metadata)를 버전별 로컬 파일로 내보내고 다시 읽습니다.
+- 네트워크 없이 로컬 검색 백엔드(local_index.py)에서 바로 검색
+- 임베딩 API를 다시 호출하지 않고 새 Pinecone 인덱스에 재적재
+
+** 디렉토리 구조 **
+    {VECTORSTORE_DIR}/snapshots/{index_name}/
+        LATEST                       # 최신 버전 이름
+        {version}/
+            manifest.json            # 포맷 버전, 차원, 임베딩 모델, 네임스페이스별 개수
+            {namespace}.npy          # float32 (N, dim) 행렬 → np.load(mmap_mode="r")
+            {namespace}.meta.zst     # zstd 압축 JSON {"ids": [...], "metadata": [...]}
+
+행렬은 mmap으로 열기 때문에 로드 시간이 파일 크기와 무관하게 수 ms 수준이며,
+메타데이터는 처음 접근할 때 압축을 풉니다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+import zstandard
+
+from backend import metrics
+from backend.config import get_settings, resolve_path
+
+FORMAT_VERSION = 1
+# Pinecone에서 빈 문자열("")이 기본 네임스페이스이므로 파일명에는 이 이름을 사용
+DEFAULT_NAMESPACE_FILE = "__default__"
+FETCH_BATCH_SIZE = 100
+
+
+def snapshot_root(index_name: str | None = None) -> Path:
+    """스냅샷 기본 디렉토리: {VECTORSTORE_DIR}/snapshots/{index_name}"""
+    settings = get_settings()
+    index_name = index_name or settings.pinecone_index_name
+    return resolve_path(settings.vectorstore_dir) / "snapshots" / index_name
+
+
+def _namespace_file(namespace: str) -> str:
+    return namespace or DEFAULT_NAMESPACE_FILE
+
+
+@dataclass
+class SnapshotNamespace:
+    """스냅샷 내 네임스페이스 하나 (벡터 행렬은 mmap, 메타데이터는 지연 로드)"""
+
+    name: str
+    vectors: np.ndarray
+    meta_path: Path
+    _ids: list[str] | None = field(default=None, repr=False)
+    _metadata: list[dict[str, Any]] | None = field(default=None, repr=False)
+    _norms: np.ndarray | None = field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return int(self.vectors.shape[0])
+
+    def _load_meta(self) -> None:
+        with open(self.meta_path, "rb") as f:
+            payload = json.loads(zstandard.ZstdDecompressor().decompress(f.read()))
+        self._ids = payload["ids"]
+        self._metadata = payload["metadata"]
+
+    @property
+    def ids(self) -> list[str]:
+        if self._ids is None:
+            self._load_meta()
+        return self._ids  # type: ignore[return-value]
+
+    @property
+    def metadata(self) -> list[dict[str, Any]]:
+        if self._metadata is None:
+            self._load_meta()
+        return self._metadata  # type: ignore[return-value]
+
+    @property
+    def norms(self) -> np.ndarray:
+        """행별 벡터 크기 (0은 1로 치환). 행렬 전체를 읽으므로 네임스페이스당 한 번만 계산합니다."""
+        metrics.cache_access("snapshot_norms", hit=self._norms is not None)
+        if self._norms is None:
+            norms = np.linalg.norm(self.vectors, axis=1)
+            norms[norms == 0] = 1.0
+            self._norms = norms
+        return self._norms
+
+
+@dataclass
+class Snapshot:
+    path: Path
+    manifest: dict[str, Any]
+    _namespaces: dict[str, SnapshotNamespace] = field(default_factory=dict, repr=False)
+
+    @property
+    def version(self) -> str:
+        return self.manifest["version"]
+
+    @property
+    def dimension(self) -> int:
+        return int(self.manifest["dimension"])
+
+    @property
+    def namespaces(self) -> list[str]:
+        return list(self.manifest["namespaces"].keys())
+
+    def namespace(self, name: str | None) -> SnapshotNamespace:
+        """네임스페이스 데이터를 반환합니다 (None/빈 문자열은 기본 네임스페이스)."""
+        name = name or ""
+        if name not in self.manifest["namespaces"]:
+            raise KeyError(f"Namespace '{name}' not found in snapshot {self.path}")
+        metrics.cache_access("snapshot_namespace", hit=name in self._namespaces)
+        if name not in self._namespaces:
+            base = _namespace_file(name)
+            self._namespaces[name] = SnapshotNamespace(
+                name=name,
+                vectors=np.load(self.path / f"{base}.npy", mmap_mode="r"),
+                meta_path=self.path / f"{base}.meta.zst",
+            )
+        return self._namespaces[name]
+
+
+def write_snapshot(
+    namespaces: dict[str, Iterable[dict[str, Any]]],
+    dimension: int,
+    out_root: str | Path | None = None,
+    index_name: str | None = None,
+    version: str | None = None,
+) -> Path:
+    """
+    네임스페이스별 벡터 목록을 새 버전의 스냅샷으로 저장하고 LATEST를 갱신합니다.
+
+    Args:
+        namespaces: 네임스페이스 → [{"id", "values", "metadata"}, ...]
+        dimension: 벡터 차원
+        out_root: 스냅샷 기본 디렉토리 (기본값: snapshot_root(index_name))
+        version: 버전 이름 (기본값: UTC 타임스탬프)
+
+    Returns:
+        Path: 생성된 버전 디렉토리
+    """
+    settings = get_settings()
+    index_name = index_name or settings.pinecone_index_name
+    root = Path(out_root) if out_root else snapshot_root(index_name)
+    version = version or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    final_dir = root / version
+    if final_dir.exists():
+        raise FileExistsError(f"Snapshot version already exists: {final_dir}")
+
+    # 임시 디렉토리에 모두 쓴 뒤 이름을 바꿔서, 중간에 실패해도 불완전한 버전이 남지 않도록 함
+    tmp_dir = root / f".{version}.tmp"
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+
+    manifest: dict[str, Any] = {
+        "format_version": FORMAT_VERSION,
+        "version": version,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "index_name": index_name,
+        "embedding_provider": settings.embedding_provider,
+        "embedding_model": settings.embedding_model_name,
+        "dimension": dimension,
+        "metric": "cosine",
+        "namespaces": {},
+    }
+
+    compressor = zstandard.ZstdCompressor(level=10)
+    try:
+        for namespace, records in namespaces.items():
+            ids: list[str] = []
+            metadata: list[dict[str, Any]] = []
+            rows: list[list[float]] = []
+            for record in records:
+                ids.append(record["id"])
+                metadata.append(record.get("metadata") or {})
+                rows.append(record["values"])
+
+            matrix = np.asarray(rows, dtype=np.float32).reshape(len(rows), dimension)
+            base = _namespace_file(namespace)
+            np.save(tmp_dir / f"{base}.npy", matrix)
+            payload = json.dumps(
+                {"ids": ids, "metadata": metadata}, ensure_ascii=False
+            ).encode("utf-8")
+            with open(tmp_dir / f"{base}.meta.zst", "wb") as f:
+                f.write(compressor.compress(payload))
+            manifest["namespaces"][namespace] = {"count": len(ids)}
+
+        with open(tmp_dir / "manifest.json", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_dir, final_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    latest_tmp = root / "LATEST.tmp"
+    latest_tmp.write_text(version, encoding="utf-8")
+    os.replace(latest_tmp, root / "LATEST")
+    return final_dir
+
+
+def resolve_snapshot_path(path: str | Path | None = None) -> Path:
+    """
+    스냅샷 버전 디렉토리를 찾습니다.
+    path가 없으면 VECTOR_SNAPSHOT_PATH, 그것도 없으면 기본 디렉토리의 LATEST를 사용합니다.
+    path가 버전 디렉토리가 아니라 기본 디렉토리면 그 안의 LATEST를 따라갑니다.
+    """
+    if path is None:
+        configured = get_settings().vector_snapshot_path
+        path = resolve_path(configured) if configured else snapshot_root()
+    path = Path(path)
+    if (path / "manifest.json").exists():
+        return path
+    latest = path / "LATEST"
+    if latest.exists():
+        return path / latest.read_text(encoding="utf-8").strip()
+    raise FileNotFoundError(f"No snapshot found at {path}")
+
+
+def load_snapshot(path: str | Path | None = None) -> Snapshot:
+    """스냅샷 manifest를 읽고 Snapshot을 반환합니다 (벡터/메타데이터는 접근 시 로드)."""
+    snapshot_dir = resolve_snapshot_path(path)
+    with open(snapshot_dir / "manifest.json", "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot format {manifest.get('format_version')} at {snapshot_dir}"
+        )
+    return Snapshot(path=snapshot_dir, manifest=manifest)
+
+
+# ==================== Pinecone 내보내기 / 재적재 ====================
+
+
+def _field(obj: Any, name: str) -> Any:
+    # Pinecone 응답 객체/딕셔너리 양쪽 모두 지원
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+def _iter_namespace_ids(index, namespace: str) -> Iterable[list[str]]:
+    # index.list()는 ID 목록을 페이지 단위로 반환 (serverless 인덱스)
+    for page in index.list(namespace=namespace):
+        if page:
+            yield list(page)
+
+
+def _fetch_vectors(index, ids: list[str], namespace: str) -> list[dict[str, Any]]:
+    response = index.fetch(ids=ids, namespace=namespace)
+    vectors = _field(response, "vectors") or {}
+    records = []
+    for vec_id in ids:
+        vec = vectors.get(vec_id)
+        if vec is None:
+            continue
+        records.append(
+            {
+                "id": vec_id,
+                "values": list(_field(vec, "values")),
+                "metadata": _field(vec, "metadata") or {},
+            }
+        )
+    return records
+
+
+def export_snapshot(
+    namespaces: list[str] | None = None,
+    out_root: str | Path | None = None,
+    version: str | None = None,
+) -> Path:
+    """
+    Pinecone 인덱스의 네임스페이스들을 스냅샷으로 내보냅니다.
+
+    Args:
+        namespaces: 내보낼 네임스페이스 목록 (기본값: 인덱스의 모든 네임스페이스)
+    """
+    from backend.rag.ingest_pipeline import call_with_retry
+    from backend.rag.vectorstore import _get_pinecone_client
+
+    settings = get_settings()
+    index = _get_pinecone_client().Index(settings.pinecone_index_name)
+    stats = index.describe_index_stats()
+    dimension = int(_field(stats, "dimension"))
+    available = list((_field(stats, "namespaces") or {}).keys())
+    namespaces = namespaces if namespaces is not None else available
+
+    collected: dict[str, list[dict[str, Any]]] = {}
+    for namespace in namespaces:
+        started = time.monotonic()
+        records: list[dict[str, Any]] = []
+        for ids in _iter_namespace_ids(index, namespace):
+            for start in range(0, len(ids), FETCH_BATCH_SIZE):
+                batch = ids[start : start + FETCH_BATCH_SIZE]
+                records.extend(
+                    call_with_retry(
+                        lambda: _fetch_vectors(index, batch, namespace),
+                        settings.ingest_max_retries,
+                    )
+                )
+        collected[namespace] = records
+        print(
+            f"[snapshot] Exported {len(records)} vectors from namespace "
+            f"'{namespace or DEFAULT_NAMESPACE_FILE}' ({time.monotonic() - started:.1f}s)"
+        )
+
+    path = write_snapshot(
+        collected,
+        dimension=dimension,
+        out_root=out_root,
+        index_name=settings.pinecone_index_name,
+        version=version,
+    )
+    print(f"[snapshot] Saved snapshot: {path}")
+    return path
+
+
+def restore_snapshot(
+    snapshot: Snapshot,
+    namespaces: list[str] | None = None,
+    batch_size: int | None = None,
+) -> int:
+    """
+    스냅샷의 벡터를 현재 설정된 Pinecone 인덱스에 그대로 업서트합니다 (임베딩 API 호출 없음).
+    인덱스가 없으면 스냅샷 차원으로 새로 생성합니다.
+
+    Returns:
+        int: 업서트한 벡터 수
+    """
+    from pinecone import ServerlessSpec
+
+    from backend.rag.ingest_pipeline import call_with_retry
+    from backend.rag.vectorstore import (
+        _get_pinecone_client,
+        _get_region_and_cloud,
+        _list_index_names,
+        refresh_index_descriptor,
+    )
+
+    settings = get_settings()
+    client = _get_pinecone_client()
+    index_name = settings.pinecone_index_name
+    if index_name not in _list_index_names(client):
+        region, cloud = _get_region_and_cloud(settings)
+        client.create_index(
+            name=index_name,
+            dimension=snapshot.dimension,
+            metric=snapshot.manifest.get("metric", "cosine"),
+            spec=ServerlessSpec(cloud=cloud, region=region),
+        )
+    # 새로 만든 인덱스의 호스트를 디스크립터에 기록 (워커 기동 시 control-plane 호출 없음)
+    descriptor = refresh_index_descriptor(create=False)
+    index = client.Index(host=descriptor.host)
+    batch_size = max(batch_size or settings.ingest_batch_size, 1)
+
+    total = 0
+    for name in namespaces if namespaces is not None else snapshot.namespaces:
+        ns = snapshot.namespace(name)
+        for start in range(0, len(ns), batch_size):
+            end = min(start + batch_size, len(ns))
+            vectors = [
+                {
+                    "id": ns.ids[i],
+                    "values": ns.vectors[i].tolist(),
+                    "metadata": ns.metadata[i],
+                }
+                for i in range(start, end)
+            ]
+            upsert_kwargs: dict[str, Any] = {"vectors": vectors}
+            if name:
+                upsert_kwargs["namespace"] = name
+            call_with_retry(
+                lambda: index.upsert(**upsert_kwargs), settings.ingest_max_retries
+            )
+            total += len(vectors)
+        print(
+            f"[snapshot] Restored {len(ns)} vectors into namespace "
+            f"'{name or DEFAULT_NAMESPACE_FILE}'"
+        )
+    return total
@@ -22,15 +22,24 @@ LLM이 사용자 질문을 분석하고, 필요시 자율적으로 이 툴들을
 
 from typing import List, Dict, Any, Optional, Tuple
 from langchain_core.tools import tool
+import logging
 import re
 import json
 from backend.config import get_llm
+from backend.graph.cancellation import raise_if_cancelled
+from backend.scheduler import llm_slot
+from backend import metrics, tracing
+from backend.tracing import traced
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
+from .category_matcher import CategoryMatcher
+from .career_info import build_career_info, extract_chart_breakdown, is_current
 from .vectorstore import get_university_majors_vectorstore
 from .university_lookup import lookup_university_url, search_universities
 
+logger = logging.getLogger(__name__)
+
 # ==================== 상수 정의 ====================
 
 # 검색 결과 제한
@@ -48,24 +57,25 @@ SEPARATOR_LINE = "=" * 80
 
 def _log_tool_start(tool_name: str, description: str) -> None:
     """
-    툴 실행 시작 로그 출력
+    툴 실행 시작 로그 기록
 
     Args:
         tool_name: 툴 이름
         description: 실행 목적 설명
     """
-    print(f"[Tool:{tool_name}] 시작 - {description}")
+    logger.info(f"[Tool:{tool_name}] 시작 - {description}")
 
 
 def _log_tool_result(tool_name: str, outcome: str) -> None:
     """
-    툴 실행 결과 로그 출력
+    툴 실행 결과 로그 기록
 
     Args:
         tool_name: 툴 이름
         outcome: 실행 결과 요약
     """
-    print(f"[Tool:{tool_name}] 결과 - {outcome}")
+    logger.info(f"[Tool:{tool_name}] 결과 - {outcome}")
+    tracing.set_attribute("tool.outcome", outcome)
 
 
 # ==================== 사용자 가이드 ====================
@@ -114,19 +124,6 @@ def _get_tool_usage_guide() -> str:
 # ==================== 텍스트 처리 유틸리티 ====================
 
 
-def _strip_html(value: str) -> str:
-    """
-    HTML 태그를 제거하고 텍스트만 반환
-
-    Args:
-        value: HTML이 포함된 문자열
-
-    Returns:
-        HTML 태그가 제거된 순수 텍스트
-    """
-    return re.sub(r"<[^>]+>", " ", value or "")
-
-
 def _normalize_major_key(value: str) -> str:
     """
     전공명을 정규화하여 비교 가능한 형태로 변환
@@ -141,25 +138,6 @@ def _normalize_major_key(value: str) -> str:
     return re.sub(r"\s+", "", (value or "").lower())
 
 
-def _dedup_preserve_order(items: List[str]) -> List[str]:
-    """
-    리스트에서 중복을 제거하되 순서는 유지
-
-    Args:
-        items: 중복이 포함된 문자열 리스트
-
-    Returns:
-        중복이 제거된 문자열 리스트 (순서 유지)
-    """
-    seen: set[str] = set()
-    ordered: List[str] = []
-    for item in items:
-        if item and item not in seen:
-            seen.add(item)
-            ordered.append(item)
-    return ordered
-
-
 # ==================== 전공 카테고리 관리 ====================
 
 
@@ -185,11 +163,11 @@ def _load_major_categories() -> Dict[str, List[str]]:
                     pass
 
         if not categories:
-            print("⚠️ Major categories not found in DB.")
+            logger.warning("⚠️ Major categories not found in DB.")
 
         return categories
     except Exception as e:
-        print(f"⚠️ Failed to load major categories from DB: {e}")
+        logger.warning(f"⚠️ Failed to load major categories from DB: {e}")
         return {}
     finally:
         session.close()
@@ -197,6 +175,8 @@ def _load_major_categories() -> Dict[str, List[str]]:
 
 # 전공 카테고 캐싱 변수 (Late Binding)
 _MAIN_CATEGORIES: Optional[Dict[str, List[str]]] = None
+# _MAIN_CATEGORIES로부터 컴파일한 쿼리 확장 매처 (카테고리와 함께 캐싱)
+_CATEGORY_MATCHER: Optional[CategoryMatcher] = None
 
 
 def get_main_categories() -> Dict[str, List[str]]:
@@ -204,12 +184,27 @@ def get_main_categories() -> Dict[str, List[str]]:
     전공 카테고리 정보를 로드하고 캐싱합니다. (Lazy Loading)
     최초 호출 시 DB에서 로드하며, 실패 시 빈 딕셔너리를 반환합니다.
     """
-    global _MAIN_CATEGORIES
+    global _MAIN_CATEGORIES, _CATEGORY_MATCHER
+    metrics.cache_access("major_categories", hit=_MAIN_CATEGORIES is not None)
     if _MAIN_CATEGORIES is None:
         _MAIN_CATEGORIES = _load_major_categories()
+        _CATEGORY_MATCHER = None
     return _MAIN_CATEGORIES
 
 
+def get_category_matcher() -> CategoryMatcher:
+    """
+    캐싱된 카테고리로 CategoryMatcher를 한 번만 컴파일하여 재사용합니다.
+    카테고리를 다시 로드하면(_MAIN_CATEGORIES 초기화) 다음 호출에서 새로 컴파일합니다.
+    """
+    global _CATEGORY_MATCHER
+    categories = get_main_categories()
+    metrics.cache_access("category_matcher", hit=_CATEGORY_MATCHER is not None)
+    if _CATEGORY_MATCHER is None:
+        _CATEGORY_MATCHER = CategoryMatcher(categories)
+    return _CATEGORY_MATCHER
+
+
 def _expand_category_query(query: str) -> Tuple[List[str], str]:
     """
     list_departments용 쿼리 확장 함수
@@ -231,32 +226,8 @@ def _expand_category_query(query: str) -> Tuple[List[str], str]:
     if not raw:
         return [], ""
 
-    categories = get_main_categories()
-    tokens: List[str] = []
-
-    # 1) 대분류(key) 입력인 경우 → 해당 key의 모든 세부 value를 한꺼번에 풀어서 사용
-    if raw in categories:
-        details = categories[raw]
-        for item in details:
-            # "컴퓨터 / 소프트웨어 / 인공지능" 형태를 개별 토큰으로 분리
-            parts = [p.strip() for p in re.split(r"[\/,()]", item) if p.strip()]
-            tokens.extend(parts)
-
-    # 2) 세부 분류(value) 그대로 들어온 경우
-    elif any(raw in v for values in categories.values() for v in values):
-        parts = [p.strip() for p in re.split(r"[\/,()]", raw) if p.strip()]
-        tokens.extend(parts)
-
-    # 3) 일반 텍스트 쿼리 (예: "컴퓨터 / 소프트웨어 / 인공지능", "AI, 데이터")
-    else:
-        parts = [p.strip() for p in re.split(r"[\/,]", raw) if p.strip()]
-        if parts:
-            tokens.extend(parts)
-        else:
-            tokens.append(raw)
-
-    # 중복 제거 (순서 유지)
-    dedup_tokens = _dedup_preserve_order(tokens)
+    # 대분류 dict 조회 + 세부 분류 접미사 색인 이진 탐색 (category_matcher.py)
+    dedup_tokens = get_category_matcher().expand(raw)
 
     # 임베딩용 텍스트 생성
     embed_text = " ".join(dedup_tokens) if dedup_tokens else raw
@@ -266,26 +237,36 @@ def _expand_category_query(query: str) -> Tuple[List[str], str]:
 
 # ==================== 전공 데이터 관리 (DB 기반) ====================
 
-from backend.db.connection import SessionLocal
+from sqlalchemy import func, inspect as sa_inspect
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import load_only
+
+from backend.db.connection import SessionLocal, get_engine
 from backend.db.models import Major
 
+# get_major_career_info가 전공을 찾을 때 읽는 컬럼 (JSON/압축 컬럼은 읽지 않음)
+CAREER_ROW_COLUMNS = (
+    Major.id,
+    Major.major_id,
+    Major.major_name,
+    Major.salary,
+    Major.employment_rate,
+    Major.acceptance_rate,
+)
+
+# majors.career_info 컬럼 존재 여부 (마이그레이션 전 DB 대응, 최초 조회 시 한 번 확인)
+_HAS_CAREER_INFO_COLUMN: Optional[bool] = None
+
 
 def _convert_db_model_to_record(row: Major) -> Any:
     """DB 모델 객체를 MajorRecord 데이터클래스로 변환합니다."""
     from backend.rag.loader import MajorRecord  # 순환 참조 방지
 
     # 차트 데이터에서 성비/만족도 추출
-    gender = None
-    satisfaction = None
+    chart_data_obj = row.json_value("chart_data")
+    gender, satisfaction = extract_chart_breakdown(chart_data_obj)
 
-    chart_data_obj = json.loads(row.chart_data) if row.chart_data else None
-    if chart_data_obj and isinstance(chart_data_obj, list):
-        stats_block = chart_data_obj[0]
-        if isinstance(stats_block, dict):
-            gender = stats_block.get("gender")
-            satisfaction = stats_block.get("satisfaction")
-
-    aliases = json.loads(row.department_aliases) if row.department_aliases else []
+    aliases = row.json_value("department_aliases", [])
 
     return MajorRecord(
         major_id=row.major_id,
@@ -294,28 +275,108 @@ def _convert_db_model_to_record(row: Major) -> Any:
         summary=row.summary or "",
         interest=row.interest or "",
         property=row.property or "",
-        relate_subject=json.loads(row.relate_subject) if row.relate_subject else None,
+        relate_subject=row.json_value("relate_subject"),
         job=row.job or "",
-        enter_field=json.loads(row.enter_field) if row.enter_field else None,
+        enter_field=row.json_value("enter_field"),
         salary=row.salary,
         employment=row.employment,
         employment_rate=row.employment_rate,
         acceptance_rate=row.acceptance_rate,
         department_aliases=aliases,
-        career_act=json.loads(row.career_act) if row.career_act else None,
+        career_act=row.json_value("career_act"),
         qualifications=row.qualifications,
-        main_subject=json.loads(row.main_subject) if row.main_subject else None,
-        university=json.loads(row.university) if row.university else None,
+        main_subject=row.json_value("main_subject"),
+        university=row.json_value("university"),
         chart_data=chart_data_obj,
-        raw=json.loads(row.raw_data) if row.raw_data else {},
+        raw=row.json_value("raw_data", {}),
         gender=gender,
         satisfaction=satisfaction,
     )
 
 
-def _lookup_major_by_name(query: str) -> Optional[Any]:
+class _CareerRow:
+    """
+    get_major_career_info용 경량 전공 레코드.
+    응답에 필요한 숫자 컬럼과 저장된 career_info만 담고, JSON 컬럼은 디코딩하지 않습니다.
+    """
+
+    def __init__(self, row: Major, career_info: Optional[str]):
+        self.major_id = row.major_id
+        self.major_name = row.major_name
+        self.salary = row.salary
+        self.employment_rate = row.employment_rate
+        self.acceptance_rate = row.acceptance_rate
+        self.career_info = career_info
+
+
+def _has_career_info_column() -> bool:
+    global _HAS_CAREER_INFO_COLUMN
+    if _HAS_CAREER_INFO_COLUMN is None:
+        try:
+            columns = sa_inspect(get_engine()).get_columns(Major.__tablename__)
+            _HAS_CAREER_INFO_COLUMN = any(col["name"] == "career_info" for col in columns)
+        except SQLAlchemyError as e:
+            logger.warning(f"⚠️  Failed to inspect majors columns: {e}")
+            return False
+        if not _HAS_CAREER_INFO_COLUMN:
+            logger.warning(
+                "⚠️  majors.career_info column is missing, computing career info on the fly "
+                "(run backend/db/backfill_career_info.py)"
+            )
+    return _HAS_CAREER_INFO_COLUMN
+
+
+def _query_majors(session, for_career: bool = False):
+    """
+    Major 조회 쿼리. for_career=True면 CAREER_ROW_COLUMNS와 career_info만 읽습니다.
+    (packed 모드에서 json_packed 압축 해제, LONGTEXT JSON 컬럼 전송을 하지 않음)
+    """
+    query = session.query(Major)
+    if not for_career:
+        return query
+    columns = CAREER_ROW_COLUMNS
+    if _has_career_info_column():
+        columns = (*columns, Major.career_info)
+    return query.options(load_only(*columns))
+
+
+def _to_record(row: Major, for_career: bool = False) -> Any:
+    if not for_career:
+        return _convert_db_model_to_record(row)
+    # load_only에 포함되지 않았으면 (컬럼 없음) 지연 로딩하지 않고 None
+    career_info = None if "career_info" in sa_inspect(row).unloaded else row.career_info
+    return _CareerRow(row, career_info)
+
+
+def _load_career_info(record: Any) -> Dict[str, Any]:
+    """
+    전공을 찾을 때 함께 읽은 진로 정보 문서(majors.career_info)를 반환합니다.
+    비어 있거나(백필 전) 버전이 다르면 전공 행 전체를 읽어 즉석으로 계산합니다.
+    """
+    try:
+        info = json.loads(record.career_info) if record.career_info else None
+    except ValueError as e:
+        logger.warning(f"⚠️  Invalid career_info for {record.major_id}, computing on the fly: {e}")
+        info = None
+
+    # 미리 계산된 문서를 쓰면 hit, 즉석 계산이면 miss
+    hit = is_current(info)
+    metrics.cache_access("career_info", hit=hit)
+    if hit:
+        return info
+
+    session = SessionLocal()
+    try:
+        row = session.query(Major).filter(Major.major_id == record.major_id).first()
+        return build_career_info(_convert_db_model_to_record(row) if row else record)
+    finally:
+        session.close()
+
+
+def _lookup_major_by_name(query: str, for_career: bool = False) -> Optional[Any]:
     """
     정확한 전공명 또는 별칭으로 전공 정보를 DB에서 검색합니다. (Exact Match Only)
+    for_career=True면 MajorRecord 대신 _CareerRow를 반환합니다. (다른 검색 함수도 동일)
     """
     query_str = query.strip()
     if not query_str:
@@ -324,26 +385,28 @@ def _lookup_major_by_name(query: str) -> Optional[Any]:
     session = SessionLocal()
     try:
         # 1. 전공명 정확 일치
-        obj = session.query(Major).filter(Major.major_name == query_str).first()
+        obj = _query_majors(session, for_career).filter(Major.major_name == query_str).first()
 
         # 2. 별칭 검색 (전공명 일치가 없을 경우)
         if not obj:
             # JSON 리스트 내 검색 (LIKE 사용)
             search_pattern = f'%"{query_str}"%'
             obj = (
-                session.query(Major)
+                _query_majors(session, for_career)
                 .filter(Major.department_aliases.like(search_pattern))
                 .first()
             )
 
         if obj:
-            return _convert_db_model_to_record(obj)
+            return _to_record(obj, for_career)
         return None
     finally:
         session.close()
 
 
-def _filter_majors_by_token(token: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
+def _filter_majors_by_token(
+    token: str, limit: int = DEFAULT_SEARCH_LIMIT, for_career: bool = False
+) -> List[Any]:
     """
     전공명에 특정 토큰(키워드)이 포함된 전공들을 DB에서 검색합니다. (Partial Match)
     """
@@ -354,18 +417,18 @@ def _filter_majors_by_token(token: str, limit: int = DEFAULT_SEARCH_LIMIT) -> Li
     session = SessionLocal()
     try:
         results = (
-            session.query(Major)
+            _query_majors(session, for_career)
             .filter(Major.major_name.like(f"%{token_str}%"))
             .limit(limit)
             .all()
         )
-        return [_convert_db_model_to_record(obj) for obj in results]
+        return [_to_record(obj, for_career) for obj in results]
     finally:
         session.close()
 
 
 def _search_major_records_by_vector(
-    query: str, limit: int = DEFAULT_SEARCH_LIMIT
+    query: str, limit: int = DEFAULT_SEARCH_LIMIT, for_career: bool = False
 ) -> List[Any]:
     """
     벡터 검색을 통해 유사한 전공을 찾고, DB에서 상세 정보를 조회합니다.
@@ -373,6 +436,8 @@ def _search_major_records_by_vector(
     from backend.rag.embeddings import get_embeddings
     from backend.rag.retriever import search_major_docs, aggregate_major_scores
 
+    # 임베딩 API 호출은 LangChain 콜백을 거치지 않으므로 취소 여부를 직접 확인
+    raise_if_cancelled()
     embeddings = get_embeddings()
     query_vec = embeddings.embed_query(query)
 
@@ -396,12 +461,12 @@ def _search_major_records_by_vector(
     session = SessionLocal()
     try:
         records = []
-        majors = session.query(Major).filter(Major.major_id.in_(top_ids)).all()
+        majors = _query_majors(session, for_career).filter(Major.major_id.in_(top_ids)).all()
         major_map = {m.major_id: m for m in majors}
 
         for mid in top_ids:
             if mid in major_map:
-                records.append(_convert_db_model_to_record(major_map[mid]))
+                records.append(_to_record(major_map[mid], for_career))
 
         return records
     finally:
@@ -414,10 +479,17 @@ def _search_university_majors_by_vector(
     """
     대학-학과 단위로 세밀하게 벡터 검색을 수행합니다. (Namespace: university_majors)
     """
+    raise_if_cancelled()
     try:
         vs = get_university_majors_vectorstore()
         # threshold=0.75 이상만 리턴하도록 설정
-        docs = vs.similarity_search_with_score(query, k=limit * 2)
+        with tracing.span(
+            "vector.query",
+            tracing.SPAN_KIND_CLIENT,
+            namespace="university_majors",
+            top_k=limit * 2,
+        ), metrics.timed("vector_query_duration_seconds", {"namespace": "university_majors"}):
+            docs = vs.similarity_search_with_score(query, k=limit * 2)
 
         results = []
         for doc, score in docs:
@@ -430,6 +502,9 @@ def _search_university_majors_by_vector(
                     "department": doc.metadata.get("department"),
                     "major_name": doc.metadata.get("major_name"),  # 대분류 이름
                     "major_id": doc.metadata.get("major_id"),  # 대분류 ID
+                    # 같은 대학-학과가 여러 대분류에 속하는 경우 전체 목록
+                    "major_names": doc.metadata.get("major_names")
+                    or [doc.metadata.get("major_name")],
                     "score": score,
                 }
             )
@@ -445,7 +520,7 @@ def _search_university_majors_by_vector(
 
         return deduped[:limit]
     except Exception as e:
-        print(f"⚠️ University major search failed: {e}")
+        logger.warning(f"⚠️ University major search failed: {e}")
         return []
 
 
@@ -465,7 +540,8 @@ def _verify_with_llm(
     # 후보군 포맷팅
     candidates_text = ""
     for idx, c in enumerate(candidates):
-        candidates_text += f"{idx + 1}. {c['university']} {c['department']} (Category: {c['major_name']})\n"
+        categories = ", ".join(n for n in c.get("major_names") or [c["major_name"]] if n)
+        candidates_text += f"{idx + 1}. {c['university']} {c['department']} (Category: {categories})\n"
 
     prompt = ChatPromptTemplate.from_template("""
     User Query: {query}
@@ -484,7 +560,8 @@ def _verify_with_llm(
     try:
         llm = get_llm()
         chain = prompt | llm | StrOutputParser()
-        result = chain.invoke({"query": query, "candidates": candidates_text})
+        with tracing.span("llm.verify_candidates", candidates=len(candidates)), llm_slot():
+            result = chain.invoke({"query": query, "candidates": candidates_text})
 
         # 숫자만 추출
         match_idx = int(re.sub(r"\D", "", result.strip()) or "0") - 1
@@ -495,12 +572,14 @@ def _verify_with_llm(
             )
             return candidates[match_idx]
     except Exception as e:
-        print(f"⚠️ LLM verification failed: {e}")
+        logger.warning(f"⚠️ LLM verification failed: {e}")
 
     return None
 
 
-def _find_majors(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
+def _find_majors(
+    query: str, limit: int = DEFAULT_SEARCH_LIMIT, for_career: bool = False
+) -> List[Any]:
     """
     통합 전공 검색 함수 (4단계 검색 전략 - DB 기반)
 
@@ -508,6 +587,8 @@ def _find_majors(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
     2. 별칭 매칭
     3. 벡터 유사도 검색 (항상 수행)
     4. 토큰 필터링 (보완)
+
+    for_career=True면 get_major_career_info용 _CareerRow 목록을 반환합니다.
     """
     matches: List[Any] = []
     seen_ids: set[str] = set()
@@ -526,17 +607,22 @@ def _find_majors(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
             best_univ_match = univ_matches[0]
 
     if best_univ_match:
-        # 정밀 검색으로 찾은 대분류를 최우선으로 추가
-        direct_univ = _lookup_major_by_name(best_univ_match["major_name"])
-        if direct_univ:
-            matches.append(direct_univ)
-            seen_ids.add(direct_univ.major_id)
-            print(
-                f"✨ Granular Match Found: {best_univ_match['university']} {best_univ_match['department']}"
-            )
+        # 정밀 검색으로 찾은 대분류를 최우선으로 추가 (여러 대분류에 속하면 모두 추가)
+        for category_name in best_univ_match.get("major_names") or [
+            best_univ_match["major_name"]
+        ]:
+            if not category_name:
+                continue
+            direct_univ = _lookup_major_by_name(category_name, for_career)
+            if direct_univ and direct_univ.major_id not in seen_ids:
+                matches.append(direct_univ)
+                seen_ids.add(direct_univ.major_id)
+                logger.info(
+                    f"✨ Granular Match Found: {best_univ_match['university']} {best_univ_match['department']} ({category_name})"
+                )
 
     # 1단계: 정확한 전공명 매칭
-    direct = _lookup_major_by_name(query)
+    direct = _lookup_major_by_name(query, for_career)
     if direct and direct.major_id not in seen_ids:
         matches.append(direct)
         seen_ids.add(direct.major_id)
@@ -547,7 +633,7 @@ def _find_majors(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
     # 2단계: 별칭 검색 (토큰 기반)
     if not matches and tokens:
         for token in tokens:
-            alias_match = _lookup_major_by_name(token)
+            alias_match = _lookup_major_by_name(token, for_career)
             if alias_match and alias_match.major_id not in seen_ids:
                 matches.append(alias_match)
                 seen_ids.add(alias_match.major_id)
@@ -555,7 +641,7 @@ def _find_majors(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
     # 3단계: 벡터 유사도 검색 (항상 수행)
     search_text = embed_text or query
     vector_matches = _search_major_records_by_vector(
-        search_text, limit=max(limit, DEFAULT_SEARCH_LIMIT)
+        search_text, limit=max(limit, DEFAULT_SEARCH_LIMIT), for_career=for_career
     )
 
     for record in vector_matches:
@@ -568,7 +654,7 @@ def _find_majors(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
     # 4단계: 토큰 필터링 (보완)
     if len(matches) < limit and tokens:
         for token in tokens:
-            token_matches = _filter_majors_by_token(token, limit=limit)
+            token_matches = _filter_majors_by_token(token, limit=limit, for_career=for_career)
             for record in token_matches:
                 if record.major_id not in seen_ids:
                     matches.append(record)
@@ -744,200 +830,6 @@ def _get_majors_for_university(university_name: str) -> List[str]:
 # ==================== 진로 정보 추출 ====================
 
 
-def _extract_job_list(job_text: str) -> List[str]:
-    """
-    진출 직업 텍스트를 개별 직업명 리스트로 분리
-
-    Args:
-        job_text: 쉼표/슬래시/줄바꿈으로 구분된 직업명 문자열
-
-    Returns:
-        중복이 제거된 직업명 리스트
-    """
-    if not job_text:
-        return []
-
-    # 구분자로 분리
-    parts = re.split(r"[,/\n]", job_text)
-
-    # 공백 제거 및 너무 짧은 항목 제외
-    cleaned = [part.strip() for part in parts if len(part.strip()) > 1]
-
-    # 중복 제거 (순서 유지)
-    return _dedup_preserve_order(cleaned)
-
-
-def _format_enter_field(record: Any) -> List[Dict[str, str]]:
-    """
-    major_detail.json의 enter_field 구조를 사용자에게 보여주기 쉬운 형태로 정리
-
-    Args:
-        record: MajorRecord 객체
-
-    Returns:
-        진출 분야 정보 리스트
-        [
-            {"category": "기업 및 산업체", "description": "..."},
-            {"category": "연구소", "description": "..."},
-            ...
-        ]
-    """
-    formatted: List[Dict[str, str]] = []
-    raw_list = getattr(record, "enter_field", None)
-
-    if not isinstance(raw_list, list):
-        return formatted
-
-    for item in raw_list:
-        if not isinstance(item, dict):
-            continue
-
-        # 카테고리 추출 (오타 대응: gradeuate/graduate)
-        category = (item.get("gradeuate") or item.get("graduate") or "").strip()
-        description = _strip_html(item.get("description") or "").strip()
-
-        # 카테고리와 설명이 모두 없으면 스킵
-        if not category and not description:
-            continue
-
-        entry: Dict[str, str] = {}
-        if category:
-            entry["category"] = category
-        if description:
-            entry["description"] = description
-
-        formatted.append(entry)
-
-    return formatted
-
-
-def _format_career_activities(record: Any) -> List[Dict[str, str]]:
-    """
-    학과 준비 활동(career_act)을 act_name/description 짝으로 정리
-
-    Args:
-        record: MajorRecord 객체
-
-    Returns:
-        추천 활동 정보 리스트
-        [
-            {"act_name": "건축박람회", "act_description": "..."},
-            {"act_name": "코딩대회", "act_description": "..."},
-            ...
-        ]
-    """
-    activities: List[Dict[str, str]] = []
-    raw_list = getattr(record, "career_act", None)
-
-    if not isinstance(raw_list, list):
-        return activities
-
-    for item in raw_list:
-        if not isinstance(item, dict):
-            continue
-
-        name = (item.get("act_name") or "").strip()
-        description = _strip_html(item.get("act_description") or "").strip()
-
-        # 이름과 설명이 모두 없으면 스킵
-        if not name and not description:
-            continue
-
-        entry: Dict[str, str] = {}
-        if name:
-            entry["act_name"] = name
-        if description:
-            entry["act_description"] = description
-
-        activities.append(entry)
-
-    return activities
-
-
-def _parse_qualifications(record: Any) -> Tuple[str, List[str]]:
-    """
-    qualifications 필드를 문자열/리스트 여부에 관계없이 일관된 형태로 변환
-
-    Args:
-        record: MajorRecord 객체
-
-    Returns:
-        (joined_text, list) 튜플
-        - joined_text: 쉼표로 연결된 자격증 문자열
-        - list: 개별 자격증 리스트
-    """
-    raw_value = getattr(record, "qualifications", None)
-
-    if raw_value is None:
-        return "", []
-
-    tokens: List[str] = []
-
-    # 리스트 타입 처리
-    if isinstance(raw_value, list):
-        tokens = [str(item).strip() for item in raw_value if str(item).strip()]
-    # 문자열 타입 처리
-    else:
-        text = str(raw_value).strip()
-        if text:
-            parts = [p.strip() for p in re.split(r"[,/\n]", text) if p.strip()]
-            tokens = parts
-
-    # 중복 제거
-    deduped = _dedup_preserve_order(tokens)
-
-    # 쉼표로 연결
-    joined = ", ".join(deduped)
-
-    return joined, deduped
-
-
-def _format_main_subjects(record: Any) -> List[Dict[str, str]]:
-    """
-    main_subject 배열에서 과목명과 요약을 추출하여 정리
-
-    Args:
-        record: MajorRecord 객체
-
-    Returns:
-        주요 과목 정보 리스트
-        [
-            {"SBJECT_NM": "건축구조시스템", "SBJECT_SUMRY": "..."},
-            {"SBJECT_NM": "건축설계", "SBJECT_SUMRY": "..."},
-            ...
-        ]
-    """
-    subjects: List[Dict[str, str]] = []
-    raw_list = getattr(record, "main_subject", None)
-
-    if not isinstance(raw_list, list):
-        return subjects
-
-    for item in raw_list:
-        if not isinstance(item, dict):
-            continue
-
-        # 과목명 추출 (다양한 키 이름 지원)
-        name = (item.get("SBJECT_NM") or item.get("subject_name") or "").strip()
-        summary = _strip_html(
-            item.get("SBJECT_SUMRY") or item.get("subject_description") or ""
-        ).strip()
-
-        # 과목명과 요약이 모두 없으면 스킵
-        if not name and not summary:
-            continue
-
-        entry: Dict[str, str] = {}
-        if name:
-            entry["SBJECT_NM"] = name
-        if summary:
-            entry["SBJECT_SUMRY"] = summary
-
-        subjects.append(entry)
-
-    return subjects
-
-
 def _resolve_major_for_career(query: str) -> Optional[Any]:
     """
     진로 정보 조회를 위한 전공 레코드 검색
@@ -946,13 +838,13 @@ def _resolve_major_for_career(query: str) -> Optional[Any]:
         query: 전공명 또는 별칭
 
     Returns:
-        가장 관련성 높은 MajorRecord 객체 또는 None
+        가장 관련성 높은 전공의 _CareerRow (저장된 career_info 포함) 또는 None
     """
     if not query:
         return None
 
-    # _find_majors를 사용하여 가장 관련성 높은 전공 1개 반환
-    matches = _find_majors(query, limit=1)
+    # _find_majors를 사용하여 가장 관련성 높은 전공 1개 반환 (JSON 컬럼은 읽지 않음)
+    matches = _find_majors(query, limit=1, for_career=True)
     return matches[0] if matches else None
 
 
@@ -1079,7 +971,8 @@ def summarize_conversation_history(history: List[Dict[str, str]]) -> str:
 
     chain = prompt | llm | StrOutputParser()
     history_text = _format_conversation_history(history)
-    result = chain.invoke({"conversation_history": history_text})
+    with llm_slot():
+        result = chain.invoke({"conversation_history": history_text})
     return result.strip()
 
 
@@ -1087,6 +980,8 @@ def summarize_conversation_history(history: List[Dict[str, str]]) -> str:
 
 
 @tool
+@traced("tool.list_departments")
+@metrics.timed("tool_duration_seconds", {"tool": "list_departments"})
 def list_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
     """
     Pinecone majors vector DB를 기반으로 학과 목록을 조회하고 추천하는 툴입니다.
@@ -1112,14 +1007,14 @@ def list_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
         "list_departments",
         f"학과 목록 조회 - query='{raw_query or '전체'}', top_k={top_k}",
     )
-    print(f"✅ Using list_departments tool with query: '{raw_query}'")
+    logger.info(f"✅ Using list_departments tool with query: '{raw_query}'")
 
     raw_query = (query or "").strip()
     _log_tool_start(
         "list_departments",
         f"학과 목록 조회 - query='{raw_query or '전체'}', top_k={top_k}",
     )
-    print(f"✅ Using list_departments tool with query: '{raw_query}'")
+    logger.info(f"✅ Using list_departments tool with query: '{raw_query}'")
 
     # 전체 목록 요청 처리
     if raw_query == "전체" or not raw_query:
@@ -1132,8 +1027,8 @@ def list_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
             # 여기서는 top_k 제한을 걸어서 가져오는 것이 성능상 유리함
             query_obj = session.query(Major)
 
-            # 전체 개수 카운트
-            total_count = query_obj.count()
+            # 전체 개수 카운트 (전체 컬럼을 서브쿼리로 감싸지 않도록 id만 집계)
+            total_count = session.query(func.count(Major.id)).scalar()
 
             # 이름순 정렬하여 top_k만큼 가져오기 (혹은 전체 가져와서 포맷팅?)
             # 여기서는 로직 유지: 전체 이름을 수집하고 정렬
@@ -1164,7 +1059,7 @@ def list_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
         all_names = sorted(set(all_names))
         limited = all_names[:top_k] if top_k else all_names
 
-        print(
+        logger.info(
             f"✅ Returning {len(limited)} majors out of {len(all_names)} total (DB limited 500)"
         )
 
@@ -1182,8 +1077,8 @@ def list_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
 
     # 키워드 검색 처리
     tokens, embed_text = _expand_category_query(raw_query)
-    print(f"   ℹ️ Expanded query tokens: {tokens}")
-    print(f"   ℹ️ Embedding text: '{embed_text}'")
+    logger.debug(f"   ℹ️ Expanded query tokens: {tokens}")
+    logger.debug(f"   ℹ️ Embedding text: '{embed_text}'")
 
     # 통합 검색 실행
     matches = _find_majors(raw_query, limit=max(top_k, DEFAULT_SEARCH_LIMIT))
@@ -1203,13 +1098,13 @@ def list_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
 
     # 검색 결과가 없는 경우
     if not department_names:
-        print("⚠️  WARNING: No majors found for the given query")
+        logger.warning("⚠️  WARNING: No majors found for the given query")
         _log_tool_result("list_departments", "검색 결과 없음")
         return "검색 결과가 없습니다. 다른 키워드로 검색해보세요."
 
     # 결과 제한 및 포맷팅
     result = department_names[:top_k]
-    print(f"✅ Returning {len(result)} majors from major_detail vector DB")
+    logger.info(f"✅ Returning {len(result)} majors from major_detail vector DB")
 
     _log_tool_result("list_departments", f"{len(result)}개 학과 정보 반환")
     result_text = _format_department_output(
@@ -1225,6 +1120,8 @@ def list_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
 
 
 @tool
+@traced("tool.get_major_career_info")
+@metrics.timed("tool_duration_seconds", {"tool": "get_major_career_info"})
 def get_major_career_info(
     major_name: str, specific_field: str = "all"
 ) -> Dict[str, Any]:
@@ -1258,7 +1155,7 @@ def get_major_career_info(
     _log_tool_start(
         "get_major_career_info", f"전공 정보 조회 - major='{query}', field='{field}'"
     )
-    print(f"✅ Using get_major_career_info tool for: '{query}' (Field: {field})")
+    logger.info(f"✅ Using get_major_career_info tool for: '{query}' (Field: {field})")
 
     # 입력 검증
     if not query:
@@ -1271,7 +1168,7 @@ def get_major_career_info(
     # 전공 레코드 검색
     record = _resolve_major_for_career(query)
     if record is None:
-        print(f"⚠️  WARNING: No career data found for '{query}'")
+        logger.warning(f"⚠️  WARNING: No career data found for '{query}'")
         return {
             "error": "no_results",
             "message": f"'{query}' 전공의 정보를 찾을 수 없습니다.",
@@ -1290,20 +1187,21 @@ def get_major_career_info(
         "data_source_disclaimer": "본 데이터는 대학별 개별 공시 자료가 아닌, 커리어넷의 표준 학과 정보입니다.",
     }
 
+    # 시딩 시 계산해 둔 파생 값 (직업 목록, 진출 분야, 성비/만족도, 활동, 자격증, 과목)
+    career_info = _load_career_info(record)
+
     # 1. 직업/진로 정보 (jobs)
     if field in ["all", "jobs"]:
-        job_text = (getattr(record, "job", "") or "").strip()
-        job_list = _extract_job_list(job_text)
-        enter_field = _format_enter_field(record)
+        job_list = career_info["jobs"]
 
         response["jobs"] = job_list
-        response["job_summary"] = job_text
-        response["enter_field"] = enter_field
+        response["job_summary"] = career_info["job_summary"]
+        response["enter_field"] = career_info["enter_field"]
 
         if not job_list:
             response["warning"] = "데이터에 등록된 직업 목록이 없습니다."
         else:
-            print(f"   ℹ️ Included {len(job_list)} jobs")
+            logger.debug(f"   ℹ️ Included {len(job_list)} jobs")
 
     # 2. 통계 정보 (stats)
     if field in ["all", "stats"]:
@@ -1315,31 +1213,30 @@ def get_major_career_info(
             except (ValueError, TypeError):
                 pass
 
-        response["gender_ratio"] = record.gender
-        response["satisfaction"] = record.satisfaction
+        response["gender_ratio"] = career_info["gender_ratio"]
+        response["satisfaction"] = career_info["satisfaction"]
         response["employment_rate"] = record.employment_rate
         response["acceptance_rate"] = record.acceptance_rate
         response["annual_salary"] = annual_salary
-        print(
+        logger.debug(
             f"   ℹ️ Included stats (employment: {record.employment_rate}, salary: {annual_salary})"
         )
 
     # 3. 학업/자격증/활동 정보 (academics)
     if field in ["all", "academics"]:
-        career_activities = _format_career_activities(record)
-        qualifications_text, qualifications_list = _parse_qualifications(record)
-        main_subjects = _format_main_subjects(record)
+        career_activities = career_info["career_act"]
+        main_subjects = career_info["main_subject"]
 
         if career_activities:
             response["career_act"] = career_activities
-        if qualifications_text:
-            response["qualifications"] = qualifications_text
-        if qualifications_list:
-            response["qualifications_list"] = qualifications_list
+        if career_info["qualifications"]:
+            response["qualifications"] = career_info["qualifications"]
+        if career_info["qualifications_list"]:
+            response["qualifications_list"] = career_info["qualifications_list"]
         if main_subjects:
             response["main_subject"] = main_subjects
 
-        print(
+        logger.debug(
             f"   ℹ️ Included academic info (subjects: {len(main_subjects)}, acts: {len(career_activities)})"
         )
 
@@ -1351,6 +1248,8 @@ def get_major_career_info(
 
 
 @tool
+@traced("tool.get_universities_by_department")
+@metrics.timed("tool_duration_seconds", {"tool": "get_universities_by_department"})
 def get_universities_by_department(department_name: str) -> List[Dict[str, str]]:
     """
     특정 학과를 개설한 대학 목록을 조회하는 툴입니다.
@@ -1371,7 +1270,7 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
     _log_tool_start(
         "get_universities_by_department", f"학과별 대학 조회 - department='{query}'"
     )
-    print(f"✅ Using get_universities_by_department tool for: '{query}'")
+    logger.info(f"✅ Using get_universities_by_department tool for: '{query}'")
 
     # 입력 검증
     if not query:
@@ -1403,12 +1302,15 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
 
             vectorstore = get_major_category_vectorstore()
             # 검색어와 의미적으로 유사한 학과명 상위 20개 검색
-            docs = vectorstore.similarity_search(query, k=20)
+            with tracing.span(
+                "vector.query", tracing.SPAN_KIND_CLIENT, namespace="major_categories", top_k=20
+            ), metrics.timed("vector_query_duration_seconds", {"namespace": "major_categories"}):
+                docs = vectorstore.similarity_search(query, k=20)
 
             vector_matched_names = [d.page_content for d in docs]
-            print(f"Vector Search found related categories: {vector_matched_names}")
+            logger.info(f"Vector Search found related categories: {vector_matched_names}")
         except Exception as e:
-            print(f"   ⚠️  Vector Search failed: {e}")
+            logger.warning(f"   ⚠️  Vector Search failed: {e}")
 
         # =========================================================
         # 2. SQL 키워드 검색 (기본)
@@ -1417,7 +1319,7 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
         major_records = (
             db.query(Major).filter(Major.major_name.like(f"%{query}%")).all()
         )
-        print(f"Primary Search found {len(major_records)} records")
+        logger.info(f"Primary Search found {len(major_records)} records")
 
         # 2-2. 2차 검색: 접미사 제거 후 확장 (Keyword Expansion)
         normalized_query = _normalize_major_key(query)
@@ -1426,11 +1328,11 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
         )
 
         if len(keyword) >= 2 and keyword != query:
-            print(f"Expanding search with keyword: '{keyword}'")
+            logger.info(f"Expanding search with keyword: '{keyword}'")
             secondary_records = (
                 db.query(Major).filter(Major.major_name.like(f"%{keyword}%")).all()
             )
-            print(f"Secondary Search found {len(secondary_records)} records")
+            logger.info(f"Secondary Search found {len(secondary_records)} records")
 
             # 중복 방지를 위해 기존 레코드에 추가
             existing_ids = {r.id for r in major_records}
@@ -1441,7 +1343,7 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
 
         # 2-3. [New] Vector 매칭 결과 추가 (Semantic Expansion)
         if vector_matched_names:
-            print(f"Applying Vector matches: {vector_matched_names}")
+            logger.info(f"Applying Vector matches: {vector_matched_names}")
             # vector_matched_names에 있는 '표준 학과명'을 가진 Major 레코드를 조회
             vector_records = (
                 db.query(Major).filter(Major.major_name.in_(vector_matched_names)).all()
@@ -1502,11 +1404,11 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
                     aggregated.append(entry)
 
             except json.JSONDecodeError:
-                print(f"⚠️  JSON Decode Error in Major ID {record.id}")
+                logger.warning(f"⚠️  JSON Decode Error in Major ID {record.id}")
                 continue
 
     except Exception as e:
-        print(f"❌ SQL Query Error: {e}")
+        logger.error(f"❌ SQL Query Error: {e}")
         _log_tool_result("get_universities_by_department", f"SQL Error: {e}")
         return [
             {
@@ -1523,7 +1425,7 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
 
     # 검색 결과가 없는 경우
     if not aggregated:
-        print(f"⚠️  WARNING: No universities found offering '{query}' in SQL DB")
+        logger.warning(f"⚠️  WARNING: No universities found offering '{query}' in SQL DB")
         result = [
             {
                 "error": "no_results",
@@ -1538,11 +1440,13 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
         "get_universities_by_department",
         f"총 {len(aggregated)}건 대학 정보 반환 (SQL Source)",
     )
-    print(f"✅ Retrieved {len(aggregated)} universities for '{query}'")
+    logger.info(f"✅ Retrieved {len(aggregated)} universities for '{query}'")
     return aggregated
 
 
 @tool
+@traced("tool.get_search_help")
+@metrics.timed("tool_duration_seconds", {"tool": "get_search_help"})
 def get_search_help() -> str:
     """
     사용자의 질문을 처리할 적절한 툴을 찾지 못했거나, 검색 결과가 없을 때 도움말을 제공하는 툴입니다.
@@ -1555,7 +1459,7 @@ def get_search_help() -> str:
     이 툴은 별도의 파라미터 없이 호출하면 됩니다.
     """
     _log_tool_start("get_search_help", "검색 가이드 안내")
-    print("ℹ️  Using get_search_help tool - providing usage guide to user")
+    logger.info("ℹ️  Using get_search_help tool - providing usage guide to user")
 
     message = _get_tool_usage_guide()
 
@@ -1564,6 +1468,8 @@ def get_search_help() -> str:
 
 
 @tool
+@traced("tool.get_university_admission_info")
+@metrics.timed("tool_duration_seconds", {"tool": "get_university_admission_info"})
 def get_university_admission_info(university_name: str) -> Dict[str, Any]:
     """
     특정 대학의 '입시(입학) 정보'를 조회하는 툴입니다.
@@ -1588,7 +1494,7 @@ def get_university_admission_info(university_name: str) -> Dict[str, Any]:
         "get_university_admission_info",
         f"대학 입시 정보 조회 - university='{query}'",
     )
-    print(f"✅ Using get_university_admission_info tool for: '{query}'")
+    logger.info(f"✅ Using get_university_admission_info tool for: '{query}'")
 
     # 입력 검증
     if not query:
@@ -1605,7 +1511,7 @@ def get_university_admission_info(university_name: str) -> Dict[str, Any]:
 
     # 대학 정보가 없는 경우
     if university_info is None:
-        print(f"⚠️  WARNING: No admission data found for '{query}'")
+        logger.warning(f"⚠️  WARNING: No admission data found for '{query}'")
         similar_universities = search_universities(query)
         if similar_universities:
             similar_names = [u["university"] for u in similar_universities[:5]]
@@ -13,26 +13,40 @@ Pinecone을 사용하여 전공 정보를 벡터로 저장하고 검색하는 
 1. get_major_vectorstore(): 전공 추천을 위한 Pinecone 벡터 스토어 반환
 2. index_major_docs(): 전공 문서를 Pinecone에 인덱싱
 3. clear_major_index(): Pinecone 인덱스 초기화
+4. delete_docs(): 지정한 문서 ID만 삭제 (증분 재인덱싱용)
+
+VECTOR_BACKEND=local이면 get_*_vectorstore()는 Pinecone 대신
+로컬 임베딩 스냅샷을 검색하는 LocalVectorStore(local_index.py)를 반환합니다.
 """
 
 # backend/rag/vectorstore.py
 from __future__ import annotations
 
-from typing import Any
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+import logging
 import threading
 
-from langchain_pinecone import PineconeVectorStore
-from pinecone import Pinecone, ServerlessSpec
-from pinecone.exceptions import NotFoundException
-
+from backend import metrics
 from backend.config import get_settings
 from .embeddings import get_embeddings
+from .index_manifest import IndexDescriptor, load_index_descriptor, save_index_descriptor
+from .ingest_pipeline import IngestItem, run_embed_upsert
 from .loader import MajorDoc
 
+# pinecone / langchain_pinecone은 임포트 비용이 커서 실제로 Pinecone을 쓰는 함수 안에서 임포트
+# (VECTOR_BACKEND=local, 관리 명령, 워커 기동 시 로딩하지 않음)
+if TYPE_CHECKING:
+    from pinecone import Pinecone
+
+logger = logging.getLogger(__name__)
+
 # Pinecone (majors) caches
 _MAJOR_VECTORSTORE_CACHE = None
 _MAJOR_VECTORSTORE_LOCK = threading.Lock()
 _MAJOR_INDEX_CACHE = None
+_MAJOR_INDEX_LOCK = threading.Lock()
 
 
 # ==================== Pinecone Vector Store for Majors ====================
@@ -40,6 +54,8 @@ _MAJOR_INDEX_CACHE = None
 
 def _get_pinecone_client() -> Pinecone:
     # Pinecone API 클라이언트를 초기화하고 키 누락 시 명확한 에러를 발생시킵니다.
+    from pinecone import Pinecone
+
     settings = get_settings()
     if not settings.pinecone_api_key:
         raise ValueError("PINECONE_API_KEY is not set in environment or .env file.")
@@ -84,6 +100,7 @@ def _list_index_names(client: Pinecone) -> list[str]:
 
 def _infer_embedding_dimension(embeddings) -> int:
     # 설정에 명시된 차원이 없으면 임베딩 모델에서 한 번 추론하여 차원을 구합니다.
+    # (인덱스를 새로 만들 때만 사용. 기존 인덱스의 차원은 describe_index/디스크립터에서 읽음)
     settings = get_settings()
     if settings.pinecone_dimension:
         return settings.pinecone_dimension
@@ -100,29 +117,82 @@ def _get_region_and_cloud(settings):
     return region, cloud
 
 
-def _ensure_major_index(embeddings):
-    # Pinecone 인덱스가 없으면 생성하고 있으면 핸들을 재사용
-    global _MAJOR_INDEX_CACHE
-    if _MAJOR_INDEX_CACHE is not None:
-        return _MAJOR_INDEX_CACHE
+def _description_field(description: Any, name: str) -> Any:
+    # describe_index 응답(IndexModel 또는 dict)에서 필드를 읽습니다.
+    if isinstance(description, dict):
+        return description.get(name)
+    return getattr(description, name, None)
+
+
+def refresh_index_descriptor(embeddings=None, create: bool = True) -> IndexDescriptor:
+    """
+    control-plane에서 인덱스 정보를 조회하여 로컬 인덱스 디스크립터를 갱신합니다.
+    인덱스가 없으면 create=True일 때 새로 만듭니다(차원: PINECONE_DIMENSION 또는 임베딩 1회 호출로 추론).
+
+    적재 스크립트(build_major_index, 스냅샷 import)와 backend/scripts/index_descriptor.py refresh에서 호출하며,
+    디스크립터가 없는 상태에서 첫 검색을 할 때도 한 번 호출됩니다.
+    """
+    from pinecone import ServerlessSpec
 
     settings = get_settings()
     client = _get_pinecone_client()
     index_name = settings.pinecone_index_name
-    existing = _list_index_names(client)
-    dimension = _infer_embedding_dimension(embeddings)
 
-    if index_name not in existing:
+    if index_name not in _list_index_names(client):
+        if not create:
+            raise ValueError(f"Pinecone index '{index_name}' does not exist.")
         region, cloud = _get_region_and_cloud(settings)
         client.create_index(
             name=index_name,
-            dimension=dimension,
+            dimension=_infer_embedding_dimension(embeddings or get_embeddings()),
             metric="cosine",
             spec=ServerlessSpec(cloud=cloud, region=region),
         )
 
-    _MAJOR_INDEX_CACHE = client.Index(index_name)
-    return _MAJOR_INDEX_CACHE
+    description = client.describe_index(index_name)
+    descriptor = IndexDescriptor(
+        name=index_name,
+        dimension=int(_description_field(description, "dimension")),
+        metric=str(_description_field(description, "metric")),
+        host=str(_description_field(description, "host")),
+        embedding_model=settings.embedding_model_name,
+        refreshed_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    )
+    save_index_descriptor(descriptor)
+    return descriptor
+
+
+def _get_index_descriptor(embeddings) -> IndexDescriptor:
+    # 로컬 디스크립터가 있으면 그대로 사용 (네트워크 호출 없음), 없거나 임베딩 모델이 바뀌었으면 갱신
+    settings = get_settings()
+    descriptor = load_index_descriptor(settings.pinecone_index_name)
+    metrics.cache_access("index_descriptor", hit=descriptor is not None)
+    if descriptor is None or not descriptor.host:
+        return refresh_index_descriptor(embeddings)
+    if descriptor.embedding_model and descriptor.embedding_model != settings.embedding_model_name:
+        logger.warning(
+            f"⚠️ Index descriptor was written for '{descriptor.embedding_model}', "
+            f"but EMBEDDING_MODEL_NAME is '{settings.embedding_model_name}'. Refreshing."
+        )
+        return refresh_index_descriptor(embeddings)
+    return descriptor
+
+
+def _ensure_major_index(embeddings):
+    # 로컬 인덱스 디스크립터의 호스트로 인덱스 핸들을 만들고 재사용
+    # Index(host=...)는 describe_index를 호출하지 않으므로 디스크립터가 있으면 기동 시 control-plane 호출이 없음
+    global _MAJOR_INDEX_CACHE
+    metrics.cache_access("pinecone_index", hit=_MAJOR_INDEX_CACHE is not None)
+    if _MAJOR_INDEX_CACHE is not None:
+        return _MAJOR_INDEX_CACHE
+
+    with _MAJOR_INDEX_LOCK:
+        if _MAJOR_INDEX_CACHE is not None:
+            return _MAJOR_INDEX_CACHE
+
+        descriptor = _get_index_descriptor(embeddings)
+        _MAJOR_INDEX_CACHE = _get_pinecone_client().Index(host=descriptor.host)
+        return _MAJOR_INDEX_CACHE
 
 
 def _get_major_namespace() -> str | None:
@@ -134,6 +204,10 @@ def _get_major_namespace() -> str | None:
     return namespace or None
 
 
+def _use_local_backend() -> bool:
+    return get_settings().vector_backend.strip().lower() == "local"
+
+
 def get_major_index():
     # LangChain 외부에서 직접 인덱스 핸들이 필요할 때 사용합니다.
     embeddings = get_embeddings()
@@ -150,12 +224,21 @@ def get_major_vectorstore():
     # LangChain VectorStore 인터페이스를 재사용하기 위해 싱글톤으로 구성
     global _MAJOR_VECTORSTORE_CACHE
     with _MAJOR_VECTORSTORE_LOCK:
+        metrics.cache_access("major_vectorstore", hit=_MAJOR_VECTORSTORE_CACHE is not None)
         if _MAJOR_VECTORSTORE_CACHE is not None:
             return _MAJOR_VECTORSTORE_CACHE
 
         embeddings = get_embeddings()
-        index = _ensure_major_index(embeddings)
         namespace = _get_major_namespace()
+        if _use_local_backend():
+            from .local_index import get_local_vectorstore
+
+            _MAJOR_VECTORSTORE_CACHE = get_local_vectorstore(namespace, embeddings)
+            return _MAJOR_VECTORSTORE_CACHE
+
+        from langchain_pinecone import PineconeVectorStore
+
+        index = _ensure_major_index(embeddings)
         _MAJOR_VECTORSTORE_CACHE = PineconeVectorStore(
             index=index,
             embedding=embeddings,
@@ -173,6 +256,8 @@ def clear_major_index(namespace: str | None = None):
         namespace: 비우고 싶은 네임스페이스. None이면 기본값을 사용.
     """
     # 인덱스를 재구축하기 전 기존 벡터를 깨끗하게 제거
+    from pinecone.exceptions import NotFoundException
+
     index = get_major_index()
     delete_kwargs: dict[str, Any] = {"deleteAll": True}
     namespace = namespace if namespace is not None else _get_major_namespace()
@@ -185,65 +270,108 @@ def clear_major_index(namespace: str | None = None):
         pass
 
 
-def index_major_docs(docs: list[MajorDoc]) -> int:
+def delete_docs(ids: list[str], namespace: str | None = None) -> int:
     """
-    MajorDoc 리스트를 Pinecone 인덱스에 업서트하고 실제로 업로드한 문서 수를 반환한다.
+    지정한 문서 ID들의 벡터를 삭제하고 삭제 요청한 개수를 반환한다.
 
     Args:
-        docs: Pinecone에 저장할 전공 문서(요약, 과목, 진로 등) 목록
-
-    Returns:
-        업서트된 문서 수 (int)
+        ids: 삭제할 Pinecone 문서 ID 목록
+        namespace: 대상 네임스페이스. None이면 기본값을 사용.
     """
-    vectorstore = get_major_vectorstore()
+    from pinecone.exceptions import NotFoundException
 
-    texts: list[str] = []
-    metadatas: list[dict[str, Any]] = []
-    ids: list[str] = []
+    index = get_major_index()
+    namespace = namespace if namespace is not None else _get_major_namespace()
+    delete_kwargs: dict[str, Any] = {}
+    if namespace:
+        delete_kwargs["namespace"] = namespace
 
-    for doc in docs:
-        texts.append(doc.text)
-        ids.append(doc.doc_id)
+    # Pinecone delete는 요청당 ID 1000개까지 허용
+    for start in range(0, len(ids), 1000):
+        try:
+            index.delete(ids=ids[start : start + 1000], **delete_kwargs)
+        except NotFoundException:
+            pass
+    return len(ids)
 
-        meta: dict[str, Any] = {
-            "major_id": doc.major_id,
-            "major_name": doc.major_name,
-            "doc_type": doc.doc_type,
-        }
 
-        # cluster: None이면 넣지 않기
-        if doc.cluster is not None and doc.cluster != "":
-            meta["cluster"] = doc.cluster
+def major_doc_metadata(doc: MajorDoc) -> dict[str, Any]:
+    """MajorDoc을 Pinecone 메타데이터 dict로 변환한다 (값이 없는 필드는 제외)."""
+    meta: dict[str, Any] = {
+        "major_id": doc.major_id,
+        "major_name": doc.major_name,
+        "doc_type": doc.doc_type,
+    }
 
-        # salary: None이 아닐 때만 숫자로 넣기
-        if doc.salary is not None:
-            meta["salary"] = float(doc.salary)
+    # cluster: None이면 넣지 않기
+    if doc.cluster is not None and doc.cluster != "":
+        meta["cluster"] = doc.cluster
 
-        if doc.employment_rate is not None:
-            meta["employment_rate"] = float(doc.employment_rate)
+    # salary: None이 아닐 때만 숫자로 넣기
+    if doc.salary is not None:
+        meta["salary"] = float(doc.salary)
 
-        if doc.acceptance_rate is not None:
-            meta["acceptance_rate"] = float(doc.acceptance_rate)
+    if doc.employment_rate is not None:
+        meta["employment_rate"] = float(doc.employment_rate)
 
-        # 태그 리스트: 비어있지 않을 때만 넣기 (list[str] 형태 유지)
-        if getattr(doc, "relate_subject_tags", None):
-            meta["relate_subject_tags"] = doc.relate_subject_tags
+    if doc.acceptance_rate is not None:
+        meta["acceptance_rate"] = float(doc.acceptance_rate)
 
-        if getattr(doc, "job_tags", None):
-            meta["job_tags"] = doc.job_tags
+    # 태그 리스트: 비어있지 않을 때만 넣기 (list[str] 형태 유지)
+    if getattr(doc, "relate_subject_tags", None):
+        meta["relate_subject_tags"] = doc.relate_subject_tags
 
-        metadatas.append(meta)
+    if getattr(doc, "job_tags", None):
+        meta["job_tags"] = doc.job_tags
 
-    vectorstore.add_texts(texts=texts, metadatas=metadatas, ids=ids)
-    return len(docs)
+    return meta
 
 
-def index_university_majors(docs: list[Any]) -> int:
+def index_major_docs(
+    docs: list[MajorDoc], checkpoint_path: str | Path | None = None
+) -> int:
+    """
+    MajorDoc 리스트를 Pinecone 인덱스에 업서트하고 실제로 업로드한 문서 수를 반환한다.
+    배치 단위 임베딩/업서트 파이프라인(ingest_pipeline)을 사용한다.
+
+    Args:
+        docs: Pinecone에 저장할 전공 문서(요약, 과목, 진로 등) 목록
+        checkpoint_path: 지정하면 중간에 실패해도 이어서 실행할 수 있도록 진행 상황을 기록
+
+    Returns:
+        업서트된 문서 수 (int)
+    """
+    embeddings = get_embeddings()
+    index = _ensure_major_index(embeddings)
+
+    items = [
+        IngestItem(doc_id=doc.doc_id, text=doc.text, metadata=major_doc_metadata(doc))
+        for doc in docs
+    ]
+    stats = run_embed_upsert(
+        items,
+        embeddings=embeddings,
+        index=index,
+        namespace=_get_major_namespace(),
+        checkpoint_path=checkpoint_path,
+        label="majors",
+    )
+    return stats.upserted + stats.skipped
+
+
+def index_university_majors(
+    docs: list[Any],
+    checkpoint_path: str | Path | None = None,
+    batch_size: int | None = None,
+    max_workers: int | None = None,
+) -> int:
     """
     UniversityMajorDoc 리스트를 Pinecone의 university_majors 네임스페이스에 인덱싱한다.
 
     Args:
         docs: UniversityMajorDoc 리스트 (loader.py에서 정의됨)
+        checkpoint_path: 지정하면 중간에 실패해도 이어서 실행할 수 있도록 진행 상황을 기록
+        batch_size / max_workers: None이면 .env 설정(INGEST_BATCH_SIZE, INGEST_MAX_WORKERS) 사용
     """
     # 순환 참조 방지를 위해 여기서 임포트하거나 Any로 받음
     # docs: list[UniversityMajorDoc]
@@ -255,22 +383,8 @@ def index_university_majors(docs: list[Any]) -> int:
     embeddings = get_embeddings()
     index = _ensure_major_index(embeddings)
 
-    # 별도의 VectorStore 인스턴스 생성 (네임스페이스가 다르므로)
-    vectorstore = PineconeVectorStore(
-        index=index,
-        embedding=embeddings,
-        text_key="text",
-        namespace=target_namespace,
-    )
-
-    texts: list[str] = []
-    metadatas: list[dict[str, Any]] = []
-    ids: list[str] = []
-
+    items: list[IngestItem] = []
     for doc in docs:
-        texts.append(doc.text)
-        ids.append(doc.doc_id)
-
         meta = {
             "major_id": doc.major_id,
             "university": doc.university,
@@ -278,17 +392,39 @@ def index_university_majors(docs: list[Any]) -> int:
             "major_name": doc.major_name,  # 대분류
             "doc_type": "university_major",
         }
-        metadatas.append(meta)
-
-    vectorstore.add_texts(texts=texts, metadatas=metadatas, ids=ids)
-    return len(docs)
+        # 여러 표준 학과에 속한 텍스트는 전체 목록을 함께 저장 (collapse_university_major_docs)
+        if getattr(doc, "major_ids", None):
+            meta["major_ids"] = doc.major_ids
+        if getattr(doc, "major_names", None):
+            meta["major_names"] = doc.major_names
+        items.append(IngestItem(doc_id=doc.doc_id, text=doc.text, metadata=meta))
+
+    # 수만 건 규모이므로 배치/병렬/재시도/체크포인트를 지원하는 파이프라인으로 업서트
+    stats = run_embed_upsert(
+        items,
+        embeddings=embeddings,
+        index=index,
+        namespace=target_namespace,
+        batch_size=batch_size,
+        max_workers=max_workers,
+        checkpoint_path=checkpoint_path,
+        label="university_majors",
+    )
+    return stats.upserted + stats.skipped
 
 
-def get_university_majors_vectorstore() -> PineconeVectorStore:
+def get_university_majors_vectorstore():
     """
     대학-학과 검색용 VectorStore 반환 (Namespace: university_majors)
     """
     embeddings = get_embeddings()
+    if _use_local_backend():
+        from .local_index import get_local_vectorstore
+
+        return get_local_vectorstore("university_majors", embeddings)
+
+    from langchain_pinecone import PineconeVectorStore
+
     index = _ensure_major_index(embeddings)
     return PineconeVectorStore(
         index=index,
@@ -298,11 +434,18 @@ def get_university_majors_vectorstore() -> PineconeVectorStore:
     )
 
 
-def get_major_category_vectorstore() -> PineconeVectorStore:
+def get_major_category_vectorstore():
     """
     대분류(표준 학과명) 검색용 VectorStore 반환 (Namespace: major_categories)
     """
     embeddings = get_embeddings()
+    if _use_local_backend():
+        from .local_index import get_local_vectorstore
+
+        return get_local_vectorstore("major_categories", embeddings)
+
+    from langchain_pinecone import PineconeVectorStore
+
     index = _ensure_major_index(embeddings)
     return PineconeVectorStore(
         index=index,
@@ -0,0 +1,258 @@
+# backend/scheduler.py
+"""
+LLM 호출 admission control / 우선순위 스케줄러
+
+chat_api, onboarding_api, summarize_conversation이 LLM 제공자를 조율 없이 호출하면
+트래픽이 몰릴 때 제공자 쪽 429/타임아웃이 모든 사용자에게 발생합니다.
+이 모듈은 프로세스 단위로 LLM 호출 수를 제한하고, 대기열이 가득 차면 즉시 거절합니다.
+
+** 규칙 **
+1. 전역 동시 실행 제한 (LLM_MAX_CONCURRENCY)
+2. 사용자별 동시 실행 제한 (LLM_PER_USER_CONCURRENCY), 같은 수만큼만 추가 대기 가능
+3. 우선순위: 채팅(PRIORITY_CHAT) > 온보딩(PRIORITY_ONBOARDING) > 요약(PRIORITY_SUMMARY)
+   - 슬롯이 비면 대기 중인 요청 중 우선순위가 가장 높은(같으면 먼저 온) 요청부터 실행
+4. 우선순위 클래스별 대기열 길이 제한 (LLM_QUEUE_SIZE), 대기 시간 제한 (LLM_QUEUE_TIMEOUT)
+   - 초과 시 AdmissionRejected 발생 → views에서 429로 변환
+
+** 사용 예시 **
+    # views: 요청 단위로 우선순위와 사용자 지정
+    with scheduling_context(PRIORITY_SUMMARY, user_key="user:1"):
+        summarize_conversation_history(history)
+
+    # LLM 호출부: 현재 컨텍스트의 우선순위/사용자로 슬롯 획득
+    with llm_slot():
+        response = llm.invoke(messages)
+"""
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import count
+from typing import Optional
+
+from backend import metrics
+from backend.config import get_settings
+
+# 우선순위 클래스 (값이 작을수록 먼저 실행)
+PRIORITY_CHAT = 0
+PRIORITY_ONBOARDING = 1
+PRIORITY_SUMMARY = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_CHAT: "chat",
+    PRIORITY_ONBOARDING: "onboarding",
+    PRIORITY_SUMMARY: "summary",
+}
+
+# 현재 요청의 우선순위/사용자 (views에서 설정, LLM 호출부에서 참조)
+current_priority: ContextVar[int] = ContextVar("llm_priority", default=PRIORITY_CHAT)
+current_user: ContextVar[Optional[str]] = ContextVar("llm_user", default=None)
+
+
+class AdmissionRejected(Exception):
+    """대기열이 가득 찼거나 대기 시간이 초과되어 LLM 호출이 거절된 경우"""
+
+    def __init__(self, reason: str, retry_after: int = 1):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class LLMScheduler:
+    """
+    전역/사용자별 동시 실행 제한과 우선순위 대기열을 가진 스케줄러.
+
+    대기열 길이는 설정값으로 제한되므로(수십 개 수준) 다음 실행할 요청은 매번 선형 탐색으로 찾습니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        per_user_limit: int = 2,
+        max_queue: int = 32,
+        queue_timeout: float = 30.0,
+    ):
+        self.max_concurrency = max(max_concurrency, 1)
+        self.per_user_limit = max(per_user_limit, 1)
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._cond = threading.Condition()
+        self._running = 0
+        self._user_running: Counter = Counter()
+        self._user_waiting: Counter = Counter()
+        self._waiting: list[tuple[int, int, Optional[str]]] = []
+        self._seq = count()
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiting)
+
+    def _reject_reason(self, priority: int, user_key: Optional[str]) -> Optional[str]:
+        queued = sum(1 for p, _, _ in self._waiting if p == priority)
+        if queued >= self.max_queue:
+            return "queue_full"
+        if user_key is not None:
+            pending = self._user_running[user_key] + self._user_waiting[user_key]
+            if pending >= self.per_user_limit * 2:
+                return "user_limit"
+        return None
+
+    def _next_runnable(self):
+        """실행 가능한(사용자 제한에 걸리지 않은) 대기 요청 중 우선순위가 가장 높은 것"""
+        candidates = [
+            entry
+            for entry in self._waiting
+            if entry[2] is None or self._user_running[entry[2]] < self.per_user_limit
+        ]
+        return min(candidates) if candidates else None
+
+    def check_admission(self, priority: int, user_key: Optional[str] = None) -> None:
+        """
+        대기열에 넣지 않고 지금 요청을 받을 수 있는지만 확인합니다.
+        스트리밍 응답처럼 실제 LLM 호출 전에 429를 반환해야 하는 경우에 사용합니다.
+        """
+        with self._cond:
+            reason = self._reject_reason(priority, user_key)
+        if reason:
+            self._record_rejection(priority, reason)
+            raise AdmissionRejected(reason)
+
+    def acquire(
+        self,
+        priority: int = PRIORITY_CHAT,
+        user_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        실행 슬롯을 획득할 때까지 대기합니다.
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나 timeout 내에 슬롯을 얻지 못한 경우
+        """
+        timeout = self.queue_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        with self._cond:
+            reason = self._reject_reason(priority, user_key)
+            if reason:
+                self._record_rejection(priority, reason)
+                raise AdmissionRejected(reason)
+
+            entry = (priority, next(self._seq), user_key)
+            self._waiting.append(entry)
+            if user_key is not None:
+                self._user_waiting[user_key] += 1
+            try:
+                while not (
+                    self._running < self.max_concurrency
+                    and self._next_runnable() == entry
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._record_rejection(priority, "timeout")
+                        raise AdmissionRejected("timeout")
+                    self._cond.wait(remaining)
+            finally:
+                self._waiting.remove(entry)
+                if user_key is not None:
+                    self._user_waiting[user_key] -= 1
+                    if not self._user_waiting[user_key]:
+                        del self._user_waiting[user_key]
+                # 이 요청이 빠지면서 다른 요청이 실행 가능해질 수 있음
+                self._cond.notify_all()
+
+            self._running += 1
+            if user_key is not None:
+                self._user_running[user_key] += 1
+
+        metrics.observe(
+            "llm_queue_wait_seconds",
+            time.monotonic() - started,
+            labels={"priority": PRIORITY_NAMES.get(priority, str(priority))},
+        )
+
+    def release(self, user_key: Optional[str] = None) -> None:
+        with self._cond:
+            self._running -= 1
+            if user_key is not None:
+                self._user_running[user_key] -= 1
+                if not self._user_running[user_key]:
+                    del self._user_running[user_key]
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, priority: int = PRIORITY_CHAT, user_key: Optional[str] = None):
+        self.acquire(priority, user_key)
+        try:
+            yield
+        finally:
+            self.release(user_key)
+
+    @staticmethod
+    def _record_rejection(priority: int, reason: str) -> None:
+        metrics.inc(
+            "llm_admission_rejected_total",
+            labels={
+                "priority": PRIORITY_NAMES.get(priority, str(priority)),
+                "reason": reason,
+            },
+        )
+
+
+# 프로세스 전역 스케줄러 (최초 사용 시 .env 설정으로 생성)
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> LLMScheduler:
+    """프로세스 전역 LLMScheduler 인스턴스를 반환합니다 (싱글톤)."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                settings = get_settings()
+                _scheduler = LLMScheduler(
+                    max_concurrency=settings.llm_max_concurrency,
+                    per_user_limit=settings.llm_per_user_concurrency,
+                    max_queue=settings.llm_queue_size,
+                    queue_timeout=settings.llm_queue_timeout,
+                )
+                # 실행 중/대기 중인 LLM 호출 수 (/metrics 조회 시점에 계산)
+                metrics.register_gauge("llm_scheduler_running", lambda: _scheduler.running)
+                metrics.register_gauge("llm_scheduler_waiting", lambda: _scheduler.waiting)
+    return _scheduler
+
+
+def bind(priority: int, user_key: Optional[str] = None) -> None:
+    """
+    현재 컨텍스트의 우선순위/사용자를 설정합니다.
+    copy_context()로 만든 백그라운드 스레드처럼 컨텍스트가 요청 단위로 버려지는 경우에 사용합니다.
+    """
+    current_priority.set(priority)
+    current_user.set(user_key)
+
+
+@contextmanager
+def scheduling_context(priority: int, user_key: Optional[str] = None):
+    """with 블록 안에서만 우선순위/사용자를 설정합니다 (요청 스레드용)."""
+    priority_token = current_priority.set(priority)
+    user_token = current_user.set(user_key)
+    try:
+        yield
+    finally:
+        current_priority.reset(priority_token)
+        current_user.reset(user_token)
+
+
+@contextmanager
+def llm_slot():
+    """현재 컨텍스트의 우선순위/사용자로 LLM 실행 슬롯을 획득합니다."""
+    with get_scheduler().slot(current_priority.get(), current_user.get()):
+        yield
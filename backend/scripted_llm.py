@@ -0,0 +1,190 @@
+"""
+부하 테스트용 스크립트 기반 가짜 ChatModel (LLM_PROVIDER=scripted)
+
+OpenAI 없이 /api/chat 전체 경로(그래프 → 툴 실행 → SSE 스트리밍)를 실행하기 위한 모델입니다.
+get_llm()을 통해 연결되므로 graph/nodes.py의 bind_tools()와 LangGraph "messages" 스트림 모드가
+실제 모델과 같은 방식으로 동작합니다.
+
+대화의 진행 상황(마지막 사용자 메시지 이후의 AI 메시지 수)에 따라 스크립트의 턴을 하나 골라 응답합니다.
+- tool_calls 턴: 바인딩된 툴 중 스크립트에 지정된 툴을 호출 (첫 토큰 지연 후 한 번에 전송)
+- content 턴: 답변을 토큰 단위로 나눠 토큰 간 지연을 두고 스트리밍
+
+스크립트 파일(SCRIPTED_LLM_SCRIPT, JSON) 예시:
+    {
+      "first_token_ms": 300,
+      "token_ms": 20,
+      "turns": [
+        {"tool_calls": [{"name": "get_major_career_info", "args": {"major_name": "컴퓨터공학과"}}]},
+        {"content": "컴퓨터공학과는 ...", "tokens": 200}
+      ]
+    }
+스크립트 파일이 없으면 SCRIPTED_LLM_* 환경 변수로 "툴 1회 호출 → 답변" 스크립트를 만듭니다.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import re
+import time
+import uuid
+from typing import Any, Iterator, List, Optional
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import (
+    BaseChatModel,
+    generate_from_stream,
+)
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    HumanMessage,
+)
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+DEFAULT_ANSWER = (
+    "## 추천 전공 안내\n\n"
+    "관심 분야와 적성을 바탕으로 살펴볼 만한 전공을 정리했습니다. "
+    "각 전공의 주요 과목과 진출 분야를 비교해 보고, 궁금한 점이 있으면 더 물어봐 주세요.\n\n"
+    "- **진출 분야**: 기업 및 산업체, 연구소, 공공기관 등 다양한 분야로 진출할 수 있습니다.\n"
+    "- **관련 자격**: 전공과 관련된 자격증을 미리 준비하면 도움이 됩니다.\n"
+)
+
+_TOKEN_PATTERN = re.compile(r"\s*\S+|\s+")
+
+
+def _tokenize(text: str, count: int = 0) -> List[str]:
+    """공백을 앞에 붙인 단어 단위 토큰으로 나눕니다. count가 있으면 문장을 반복하거나 잘라 count개로 맞춥니다."""
+    tokens = _TOKEN_PATTERN.findall(text) or [text]
+    if count > 0:
+        tokens = list(itertools.islice(itertools.cycle(tokens), count))
+    return tokens
+
+
+def default_script(settings) -> dict:
+    """SCRIPTED_LLM_* 환경 변수로 기본 스크립트(툴 1회 호출 → 답변)를 만듭니다."""
+    turns: List[dict] = []
+    if settings.scripted_llm_tool:
+        turns.append({"tool_calls": [{"name": settings.scripted_llm_tool, "args": {}}]})
+    turns.append({"content": DEFAULT_ANSWER, "tokens": settings.scripted_llm_answer_tokens})
+    return {
+        "first_token_ms": settings.scripted_llm_first_token_ms,
+        "token_ms": settings.scripted_llm_token_ms,
+        "turns": turns,
+    }
+
+
+class ScriptedChatModel(BaseChatModel):
+    """스크립트대로 tool_calls / 토큰 스트림을 지연 시간과 함께 내보내는 ChatModel"""
+
+    turns: List[dict]
+    first_token_ms: float = 200.0
+    token_ms: float = 15.0
+
+    @classmethod
+    def from_settings(cls, settings) -> "ScriptedChatModel":
+        script = default_script(settings)
+        if settings.scripted_llm_script:
+            with open(settings.scripted_llm_script, "r", encoding="utf-8") as f:
+                script = {**script, **json.load(f)}
+        if not script.get("turns"):
+            raise ValueError("Scripted LLM script must define at least one turn.")
+        return cls(
+            turns=script["turns"],
+            first_token_ms=float(script.get("first_token_ms", 200.0)),
+            token_ms=float(script.get("token_ms", 15.0)),
+        )
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        return self.bind(tools=[convert_to_openai_tool(t) for t in tools], **kwargs)
+
+    def _select_turn(self, messages: List[BaseMessage], tool_names: set[str]) -> dict:
+        """마지막 사용자 메시지 이후 AI 응답 수로 턴을 고릅니다. (툴이 없으면 답변 턴만 사용)"""
+        answered = 0
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                break
+            if isinstance(message, AIMessage):
+                answered += 1
+
+        content_turns = [turn for turn in self.turns if "tool_calls" not in turn]
+        fallback = content_turns[-1] if content_turns else {"content": DEFAULT_ANSWER}
+        if answered >= len(self.turns):
+            return fallback
+
+        turn = self.turns[answered]
+        if "tool_calls" in turn:
+            calls = [call for call in turn["tool_calls"] if call.get("name") in tool_names]
+            return {"tool_calls": calls} if calls else fallback
+        return turn
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        tool_names = {tool["function"]["name"] for tool in kwargs.get("tools") or []}
+        turn = self._select_turn(messages, tool_names)
+        input_tokens = sum(len(str(m.content).split()) for m in messages)
+
+        time.sleep(self.first_token_ms / 1000)
+
+        if turn.get("tool_calls"):
+            chunk = ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[
+                        {
+                            "name": call["name"],
+                            "args": json.dumps(call.get("args", {}), ensure_ascii=False),
+                            "id": f"call_{uuid.uuid4().hex[:12]}",
+                            "index": i,
+                        }
+                        for i, call in enumerate(turn["tool_calls"])
+                    ],
+                    usage_metadata={
+                        "input_tokens": input_tokens,
+                        "output_tokens": len(turn["tool_calls"]),
+                        "total_tokens": input_tokens + len(turn["tool_calls"]),
+                    },
+                )
+            )
+            if run_manager:
+                run_manager.on_llm_new_token("", chunk=chunk)
+            yield chunk
+            return
+
+        tokens = _tokenize(turn.get("content") or DEFAULT_ANSWER, int(turn.get("tokens", 0)))
+        for i, token in enumerate(tokens):
+            if i:
+                time.sleep(self.token_ms / 1000)
+            usage = None
+            if i == len(tokens) - 1:
+                usage = {
+                    "input_tokens": input_tokens,
+                    "output_tokens": len(tokens),
+                    "total_tokens": input_tokens + len(tokens),
+                }
+            chunk = ChatGenerationChunk(
+                message=AIMessageChunk(content=token, usage_metadata=usage)
+            )
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return generate_from_stream(self._stream(messages, stop, run_manager, **kwargs))
@@ -0,0 +1,65 @@
+"""
+Pinecone 인덱스 디스크립터(이름, 차원, 메트릭, 호스트) 조회/갱신 스크립트
+
+워커는 {VECTORSTORE_DIR}/manifests/{index_name}.index.json의 호스트로 인덱스에 바로 연결하므로
+기동 시 list_indexes/describe_index나 차원 추론용 임베딩 호출을 하지 않습니다.
+인덱스를 다시 만들었거나 호스트가 바뀌었으면 refresh로 갱신합니다.
+
+사용법:
+    python backend/scripts/index_descriptor.py show                  # 로컬 디스크립터 출력 (네트워크 호출 없음)
+    python backend/scripts/index_descriptor.py refresh               # describe_index로 갱신 (인덱스가 없으면 생성)
+    python backend/scripts/index_descriptor.py refresh --no-create   # 인덱스가 없으면 에러
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to sys.path
+current_dir = Path(__file__).resolve().parent
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from backend.config import get_settings
+from backend.rag.index_manifest import descriptor_path, load_index_descriptor
+
+
+def show_descriptor(descriptor, path) -> None:
+    print(f"📇 Index descriptor: {path}")
+    print(f"   name={descriptor.name}, dimension={descriptor.dimension}, metric={descriptor.metric}")
+    print(f"   host={descriptor.host}")
+    print(f"   embedding_model={descriptor.embedding_model or '-'}, refreshed_at={descriptor.refreshed_at or '-'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show/refresh the cached Pinecone index descriptor")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("show", help="로컬 디스크립터 출력")
+    refresh_parser = subparsers.add_parser("refresh", help="Pinecone control-plane에서 다시 조회하여 저장")
+    refresh_parser.add_argument(
+        "--no-create", action="store_true", help="인덱스가 없으면 만들지 않고 에러"
+    )
+
+    args = parser.parse_args()
+    index_name = get_settings().pinecone_index_name
+    path = descriptor_path(index_name)
+
+    if args.command == "show":
+        descriptor = load_index_descriptor(index_name)
+        if descriptor is None:
+            print(f"⚠️ No index descriptor for '{index_name}' ({path}). Run 'refresh' first.")
+            sys.exit(1)
+        show_descriptor(descriptor, path)
+    elif args.command == "refresh":
+        from backend.rag.vectorstore import refresh_index_descriptor
+
+        previous = load_index_descriptor(index_name)
+        descriptor = refresh_index_descriptor(create=not args.no_create)
+        show_descriptor(descriptor, path)
+        if previous and previous.host != descriptor.host:
+            print(f"   (host changed: {previous.host} → {descriptor.host})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""
+전체 적재 오케스트레이터 (DB 시딩 → 벡터 인덱싱)
+
+새 환경을 준비할 때 seed_all.py, build_major_index.py, ingest_university_majors.py,
+ingest_major_categories.py를 순서대로 직접 실행하던 과정을 하나의 CLI로 묶습니다.
+
+** 단계(Stage) 의존 관계 **
+    seed ──> load_records ──┬──> major_index
+                            ├──> university_majors
+                            └──> major_categories
+
+- load_records에서 MySQL 전공 데이터를 한 번만 로드하여 이후 단계가 공유
+- 의존 관계가 없는 단계(인덱싱 3종)는 스레드 풀에서 동시에 실행
+- 완료된 단계는 체크포인트 파일에 기록하여, 실패 후 다시 실행하면 남은 단계부터 이어서 실행
+  (모든 단계가 성공하면 체크포인트 삭제)
+- 마지막에 단계별 상태/소요 시간 요약 출력
+
+사용법:
+    python backend/scripts/ingest_all.py
+    python backend/scripts/ingest_all.py --reset                 # 체크포인트 무시하고 처음부터
+    python backend/scripts/ingest_all.py --only major_index      # 지정한 단계(+필요한 선행 단계)만
+    python backend/scripts/ingest_all.py --skip seed             # 지정한 단계 제외
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+# Add project root to sys.path
+current_dir = Path(__file__).resolve().parent
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from backend.rag.ingest_pipeline import default_checkpoint_path
+
+
+@dataclass
+class Stage:
+    name: str
+    func: Callable[[dict[str, Any]], Any]
+    deps: list[str] = field(default_factory=list)
+    # False면 결과를 메모리로만 공유하는 단계 (체크포인트에 기록하지 않고 필요할 때마다 실행)
+    checkpoint: bool = True
+    description: str = ""
+
+
+@dataclass
+class StageResult:
+    name: str
+    status: str = "pending"  # done | resumed | failed | blocked | skipped
+    elapsed: float = 0.0
+    detail: str = ""
+
+
+# ==================== Stage 구현 ====================
+
+
+def _stage_seed(context: dict[str, Any]) -> str:
+    from backend.db.seed_all import seed_all
+
+    results = seed_all(parallel=True)
+    failed = [name for name, result in results.items() if result is None]
+    if failed:
+        raise RuntimeError(f"Seeding failed: {', '.join(failed)}")
+    return ", ".join(
+        f"{name}={result['succeeded'] if isinstance(result, dict) else result.total}"
+        for name, result in results.items()
+    )
+
+
+def _stage_load_records(context: dict[str, Any]) -> str:
+    from backend.rag.loader import load_major_detail
+
+    context["records"] = load_major_detail()
+    return f"{len(context['records'])} records"
+
+
+def _stage_major_index(context: dict[str, Any]) -> str:
+    from backend.rag.build_major_index import rebuild_major_index
+
+    diff = rebuild_major_index(records=context["records"])
+    return diff.summary()
+
+
+def _stage_university_majors(context: dict[str, Any]) -> str:
+    from backend.scripts.ingest_university_majors import ingest_university_majors
+
+    count = ingest_university_majors(records=context["records"])
+    return f"{count} docs"
+
+
+def _stage_major_categories(context: dict[str, Any]) -> str:
+    from backend.scripts.ingest_major_categories import index_major_categories
+
+    count = index_major_categories(
+        [record.major_name for record in context["records"]]
+    )
+    return f"{count} categories"
+
+
+STAGES = [
+    Stage("seed", _stage_seed, description="MySQL 시딩 (전공/카테고리/대학)"),
+    Stage(
+        "load_records",
+        _stage_load_records,
+        deps=["seed"],
+        checkpoint=False,
+        description="MajorRecord 로드 (이후 단계 공유)",
+    ),
+    Stage(
+        "major_index",
+        _stage_major_index,
+        deps=["load_records"],
+        description="전공 인덱스 증분 재구축",
+    ),
+    Stage(
+        "university_majors",
+        _stage_university_majors,
+        deps=["load_records"],
+        description="대학-학과 문서 인덱싱",
+    ),
+    Stage(
+        "major_categories",
+        _stage_major_categories,
+        deps=["load_records"],
+        description="표준 학과명 인덱싱",
+    ),
+]
+
+
+# ==================== 체크포인트 ====================
+
+
+def _load_checkpoint(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_checkpoint(path: Path, completed: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(completed, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+# ==================== DAG 실행 ====================
+
+
+def _select_stages(
+    stages: list[Stage], only: list[str] | None, skip: list[str] | None
+) -> list[Stage]:
+    by_name = {stage.name: stage for stage in stages}
+    for name in (only or []) + (skip or []):
+        if name not in by_name:
+            raise SystemExit(f"Unknown stage: {name} (choices: {', '.join(by_name)})")
+
+    if only:
+        # 지정한 단계 + 공유 데이터 단계(checkpoint=False)인 선행 단계만 포함
+        selected: set[str] = set()
+
+        def include(name: str) -> None:
+            if name in selected:
+                return
+            selected.add(name)
+            for dep in by_name[name].deps:
+                if not by_name[dep].checkpoint:
+                    include(dep)
+
+        for name in only:
+            include(name)
+    else:
+        selected = set(by_name)
+    selected -= set(skip or [])
+    return [stage for stage in stages if stage.name in selected]
+
+
+def run_pipeline(
+    stages: list[Stage],
+    checkpoint_path: Path,
+    max_workers: int = 3,
+) -> list[StageResult]:
+    """
+    의존 관계를 지키며 단계를 실행하고 단계별 결과를 반환합니다.
+    선택되지 않은 선행 단계는 이미 완료된 것으로 간주합니다.
+    """
+    completed = _load_checkpoint(checkpoint_path)
+    selected = {stage.name for stage in stages}
+    results = {stage.name: StageResult(stage.name) for stage in stages}
+    context: dict[str, Any] = {}
+
+    def needs_run(stage: Stage) -> bool:
+        if stage.checkpoint:
+            return stage.name not in completed
+        # 공유 데이터 단계는 실행할 후속 단계가 있을 때만 실행
+        return any(
+            stage.name in other.deps and needs_run(other) for other in stages
+        )
+
+    finished: set[str] = set()
+    for stage in stages:
+        if not needs_run(stage):
+            result = results[stage.name]
+            result.status = "resumed" if stage.checkpoint else "skipped"
+            result.detail = "completed in a previous run" if stage.checkpoint else ""
+            finished.add(stage.name)
+
+    def deps_state(stage: Stage) -> str:
+        for dep in stage.deps:
+            if dep not in selected:
+                continue
+            if results[dep].status in ("failed", "blocked"):
+                return "blocked"
+            if dep not in finished:
+                return "waiting"
+        return "ready"
+
+    def run_stage(stage: Stage) -> tuple[str, float]:
+        started = time.perf_counter()
+        print(f"\n▶️  [{stage.name}] {stage.description}")
+        detail = stage.func(context)
+        return str(detail or ""), time.perf_counter() - started
+
+    pending = [stage for stage in stages if stage.name not in finished]
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        running: dict[Any, Stage] = {}
+        while pending or running:
+            for stage in list(pending):
+                state = deps_state(stage)
+                if state == "blocked":
+                    results[stage.name].status = "blocked"
+                    pending.remove(stage)
+                elif state == "ready":
+                    running[executor.submit(run_stage, stage)] = stage
+                    pending.remove(stage)
+
+            if not running:
+                # 실행 가능한 단계가 없으면 남은 단계는 모두 막힌 상태
+                for stage in pending:
+                    results[stage.name].status = "blocked"
+                break
+
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                result = results[stage.name]
+                try:
+                    result.detail, result.elapsed = future.result()
+                    result.status = "done"
+                    finished.add(stage.name)
+                    if stage.checkpoint:
+                        completed[stage.name] = {
+                            "finished_at": datetime.now(timezone.utc).isoformat(),
+                            "elapsed": round(result.elapsed, 2),
+                        }
+                        _save_checkpoint(checkpoint_path, completed)
+                    print(f"✅ [{stage.name}] done ({result.elapsed:.1f}s)")
+                except Exception as e:
+                    result.status = "failed"
+                    result.detail = str(e)
+                    print(f"❌ [{stage.name}] failed: {e}")
+                    traceback.print_exc()
+
+    return [results[stage.name] for stage in stages]
+
+
+def print_summary(results: list[StageResult], total_elapsed: float) -> None:
+    icons = {"done": "✅", "resumed": "⏭️ ", "skipped": "⏭️ ", "failed": "❌", "blocked": "⛔"}
+    width = max(len(result.name) for result in results)
+    print("\n" + "=" * 60)
+    print("📊 Ingestion Summary")
+    print("-" * 60)
+    for result in results:
+        elapsed = f"{result.elapsed:7.1f}s" if result.status == "done" else " " * 8
+        print(
+            f"{icons.get(result.status, '  ')} {result.name:<{width}}  "
+            f"{result.status:<8} {elapsed}  {result.detail}"
+        )
+    print("-" * 60)
+    print(f"Total: {total_elapsed:.1f}s")
+    print("=" * 60)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run seed and index stages as a DAG")
+    stage_names = [stage.name for stage in STAGES]
+    parser.add_argument(
+        "--only", nargs="+", choices=stage_names, help="실행할 단계만 지정"
+    )
+    parser.add_argument("--skip", nargs="+", choices=stage_names, help="제외할 단계")
+    parser.add_argument(
+        "--reset", action="store_true", help="체크포인트를 무시하고 모든 단계 실행"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=3, help="동시에 실행할 단계 수 (기본값: 3)"
+    )
+    args = parser.parse_args()
+
+    checkpoint_path = default_checkpoint_path("ingest_all").with_suffix(".json")
+    if args.reset and checkpoint_path.exists():
+        checkpoint_path.unlink()
+
+    stages = _select_stages(STAGES, args.only, args.skip)
+    print("🚀 Starting ingestion pipeline: " + ", ".join(s.name for s in stages))
+
+    started = time.perf_counter()
+    results = run_pipeline(stages, checkpoint_path, max_workers=args.workers)
+    print_summary(results, time.perf_counter() - started)
+
+    if any(result.status in ("failed", "blocked") for result in results):
+        print(f"⚠️ Some stages did not finish. Re-run to resume ({checkpoint_path}).")
+        return 1
+
+    # 모든 단계가 성공하면 다음 실행은 처음부터 (각 단계는 증분 처리이므로 비용이 적음)
+    if checkpoint_path.exists():
+        checkpoint_path.unlink()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import sys
 
@@ -12,10 +13,40 @@ from backend.rag.vectorstore import get_major_category_vectorstore
 from backend.rag.embeddings import get_embeddings
 
 
+def index_major_categories(major_names: list[str]) -> int:
+    """
+    표준 학과명 목록을 major_categories 네임스페이스에 인덱싱하고 문서 수를 반환합니다.
+    실패하면 예외를 그대로 발생시킵니다.
+    """
+    # 중복/빈 값 제거 (순서 유지)
+    major_names = list(dict.fromkeys(name for name in major_names if name))
+    if not major_names:
+        print("⚠️ No majors found. Exiting.")
+        return 0
+
+    # 1. VectorStore 준비
+    vectorstore = get_major_category_vectorstore()
+
+    # 2. 데이터 준비 (Text itself is the major name)
+    texts = major_names
+    metadatas = [{"major_name": name, "doc_type": "category"} for name in major_names]
+    # Pinecone IDs must be ASCII (safe). Use MD5 hash of the name.
+    ids = [hashlib.md5(name.encode("utf-8")).hexdigest() for name in major_names]
+
+    # 3. 업로드 (배치 처리 권장하지만 300개라 한 번에 가능)
+    print(
+        "Wait... Embedding and Uploading to Pinecone (namespace='major_categories')..."
+    )
+    vectorstore.add_texts(texts=texts, metadatas=metadatas, ids=ids)
+
+    print(f"🎉 Successfully indexed {len(texts)} major categories.")
+    return len(texts)
+
+
 def ingest_major_categories():
     print("🚀 Starting Major Category Ingestion...")
 
-    # 1. DB에서 모든 표준 학과명(major_name) 가져오기
+    # DB에서 모든 표준 학과명(major_name) 가져오기
     db = next(get_db())
     try:
         # DISTINCT major_name 조회
@@ -23,30 +54,7 @@ def ingest_major_categories():
         major_names = [m[0] for m in majors if m[0]]
         print(f"✅ Found {len(major_names)} unique major categories in DB.")
 
-        if not major_names:
-            print("⚠️ No majors found. Exiting.")
-            return
-
-        # 2. VectorStore 준비
-        vectorstore = get_major_category_vectorstore()
-
-        import hashlib
-
-        # 3. 데이터 준비 (Text itself is the major name)
-        texts = major_names
-        metadatas = [
-            {"major_name": name, "doc_type": "category"} for name in major_names
-        ]
-        # Pinecone IDs must be ASCII (safe). Use MD5 hash of the name.
-        ids = [hashlib.md5(name.encode("utf-8")).hexdigest() for name in major_names]
-
-        # 4. 업로드 (배치 처리 권장하지만 300개라 한 번에 가능)
-        print(
-            "Wait... Embedding and Uploading to Pinecone (namespace='major_categories')..."
-        )
-        vectorstore.add_texts(texts=texts, metadatas=metadatas, ids=ids)
-
-        print(f"🎉 Successfully indexed {len(texts)} major categories.")
+        index_major_categories(major_names)
 
     except Exception as e:
         print(f"❌ Error during ingestion: {e}")
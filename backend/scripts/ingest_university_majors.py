@@ -1,3 +1,4 @@
+import argparse
 import sys
 import os
 from pathlib import Path
@@ -7,16 +8,33 @@ current_dir = Path(__file__).resolve().parent
 project_root = current_dir.parent.parent
 sys.path.append(str(project_root))
 
-from backend.rag.loader import load_major_detail, build_university_major_docs
+from backend.rag.loader import (
+    MajorRecord,
+    load_major_detail,
+    build_university_major_docs,
+    collapse_university_major_docs,
+)
+from backend.rag.ingest_pipeline import default_checkpoint_path
 from backend.rag.vectorstore import index_university_majors
 
 
-def main():
-    print("🚀 Starting University-Major Ingestion (Full)...")
+def ingest_university_majors(
+    records: list[MajorRecord] | None = None,
+    reset_checkpoint: bool = False,
+    batch_size: int | None = None,
+    workers: int | None = None,
+) -> int:
+    """
+    대학-학과 문서를 만들어 university_majors 네임스페이스에 인덱싱하고 문서 수를 반환합니다.
+    실패하면 예외를 그대로 발생시킵니다 (체크포인트는 유지).
 
+    Args:
+        records: 이미 로드한 MajorRecord 목록 (없으면 DB에서 로드)
+    """
     # 1. Load Data
-    print("📥 Loading major details...")
-    records = load_major_detail()
+    if records is None:
+        print("📥 Loading major details...")
+        records = load_major_detail()
     print(f"✅ Loaded {len(records)} major records.")
 
     # 2. Build Documents
@@ -28,20 +46,65 @@ def main():
 
     print(f"✅ Generated {len(all_univ_docs)} university-major documents.")
 
+    # 코퍼스 전체에서 같은 텍스트를 하나로 합쳐 텍스트당 한 번만 임베딩
+    all_univ_docs, report = collapse_university_major_docs(all_univ_docs)
+    print(f"🧹 Dedup: {report.summary()}")
+
     # 3. Indexing
-    if all_univ_docs:
-        print(f"📤 Indexing to Pinecone (Namespace: university_majors)...")
-        try:
-            count = index_university_majors(all_univ_docs)
-            print(f"✨ Successfully indexed {count} documents.")
-        except Exception as e:
-            print(f"❌ Indexing Failed: {e}")
-            import traceback
-
-            traceback.print_exc()
-    else:
+    if not all_univ_docs:
         print("⚠️ No documents to index.")
+        return 0
+
+    print(f"📤 Indexing to Pinecone (Namespace: university_majors)...")
+    # 중간에 실패하면 체크포인트에 기록된 문서를 건너뛰고 이어서 실행
+    checkpoint_path = default_checkpoint_path("university_majors")
+    if reset_checkpoint and checkpoint_path.exists():
+        checkpoint_path.unlink()
+    count = index_university_majors(
+        all_univ_docs,
+        checkpoint_path=checkpoint_path,
+        batch_size=batch_size,
+        max_workers=workers,
+    )
+    print(f"✨ Successfully indexed {count} documents.")
+    return count
+
+
+def main(
+    reset_checkpoint: bool = False,
+    batch_size: int | None = None,
+    workers: int | None = None,
+):
+    print("🚀 Starting University-Major Ingestion (Full)...")
+    try:
+        ingest_university_majors(
+            reset_checkpoint=reset_checkpoint,
+            batch_size=batch_size,
+            workers=workers,
+        )
+    except Exception as e:
+        print(f"❌ Indexing Failed: {e}")
+        import traceback
+
+        traceback.print_exc()
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Ingest university-major documents")
+    parser.add_argument(
+        "--batch-size", type=int, help="배치당 문서 수 (기본값: INGEST_BATCH_SIZE)"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="동시 처리 배치 수 (기본값: INGEST_MAX_WORKERS)"
+    )
+    parser.add_argument(
+        "--reset-checkpoint",
+        action="store_true",
+        help="이전 실행의 체크포인트를 무시하고 처음부터 실행",
+    )
+    args = parser.parse_args()
+    main(
+        reset_checkpoint=args.reset_checkpoint,
+        batch_size=args.batch_size,
+        workers=args.workers,
+    )
@@ -0,0 +1,157 @@
+"""
+트레이싱 JSON Lines(TRACE_EXPORT_PATH) 요약/변환 스크립트
+
+사용법:
+    python backend/scripts/trace_report.py traces.jsonl                      # span 이름별 시간 분포 요약
+    python backend/scripts/trace_report.py traces.jsonl --conversation 42    # 특정 대화의 턴만
+    python backend/scripts/trace_report.py traces.jsonl --tree               # 최근 트레이스 하나를 트리로 출력
+    python backend/scripts/trace_report.py traces.jsonl --otlp out.json      # OTLP/JSON 페이로드로 변환
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+
+def _attributes(span: dict) -> dict:
+    result = {}
+    for item in span.get("attributes", []):
+        value = item["value"]
+        result[item["key"]] = next(iter(value.values())) if value else None
+    return result
+
+
+def _duration_ms(span: dict) -> float:
+    return (int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])) / 1e6
+
+
+def load_spans(path: Path, conversation: str | None = None) -> dict[str, list[dict]]:
+    """traceId별 span 목록"""
+    traces: dict[str, list[dict]] = defaultdict(list)
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            span = json.loads(line)
+            if conversation and _attributes(span).get("conversation.id") != conversation:
+                continue
+            traces[span["traceId"]].append(span)
+    return traces
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def print_summary(traces: dict[str, list[dict]]) -> None:
+    """트레이스마다 span 이름별 합계를 구하고, 트레이스 간 평균/p95와 루트 대비 비율을 출력"""
+    per_name: dict[str, list[float]] = defaultdict(list)
+    counts: dict[str, int] = defaultdict(int)
+    roots: list[float] = []
+
+    for spans in traces.values():
+        totals: dict[str, float] = defaultdict(float)
+        for span in spans:
+            if not span.get("parentSpanId"):
+                roots.append(_duration_ms(span))
+                continue
+            totals[span["name"]] += _duration_ms(span)
+            counts[span["name"]] += 1
+        for name, total in totals.items():
+            per_name[name].append(total)
+
+    if not roots:
+        print("No complete traces found.")
+        return
+
+    mean_root = sum(roots) / len(roots)
+    print(
+        f"traces={len(roots)}  turn mean={mean_root:.1f} ms  "
+        f"p95={_percentile(roots, 0.95):.1f} ms\n"
+    )
+    width = max(len(name) for name in per_name) if per_name else 10
+    header = f"{'span':<{width}}  {'calls/turn':>10} {'mean ms':>9} {'p95 ms':>9} {'% of turn':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, totals in sorted(per_name.items(), key=lambda kv: -sum(kv[1])):
+        mean = sum(totals) / len(roots)
+        print(
+            f"{name:<{width}}  {counts[name] / len(roots):>10.1f} {mean:>9.1f} "
+            f"{_percentile(totals, 0.95):>9.1f} {mean / mean_root * 100:>8.1f}%"
+        )
+    print("\n(span 시간은 자식 span을 포함하므로 비율의 합은 100%를 넘을 수 있습니다)")
+
+
+def print_tree(spans: list[dict]) -> None:
+    children: dict[str, list[dict]] = defaultdict(list)
+    roots = []
+    for span in spans:
+        parent = span.get("parentSpanId")
+        (children[parent] if parent else roots).append(span)
+
+    def walk(span: dict, depth: int, base: int) -> None:
+        offset = (int(span["startTimeUnixNano"]) - base) / 1e6
+        attrs = _attributes(span)
+        detail = attrs.get("db.statement") or attrs.get("tool.outcome") or ""
+        status = " ❌" if span.get("status", {}).get("code") == 2 else ""
+        print(
+            f"{'  ' * depth}{span['name']}  +{offset:.1f}ms  {_duration_ms(span):.1f}ms{status}"
+            + (f"  {' '.join(str(detail).split())[:80]}" if detail else "")
+        )
+        for child in sorted(children[span["spanId"]], key=lambda s: int(s["startTimeUnixNano"])):
+            walk(child, depth + 1, base)
+
+    for root in roots:
+        walk(root, 0, int(root["startTimeUnixNano"]))
+
+
+def write_otlp(traces: dict[str, list[dict]], out_path: Path) -> None:
+    """OTLP/HTTP JSON(ExportTraceServiceRequest) 형식으로 저장 → 수집기의 /v1/traces에 POST 가능"""
+    payload = {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [{"key": "service.name", "value": {"stringValue": "unigo"}}]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "backend.tracing"},
+                        "spans": [span for spans in traces.values() for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Summarize tracing JSON Lines")
+    parser.add_argument("path", type=Path, help="TRACE_EXPORT_PATH 파일")
+    parser.add_argument("--conversation", help="conversation.id로 필터링")
+    parser.add_argument("--tree", action="store_true", help="마지막 트레이스를 트리로 출력")
+    parser.add_argument("--otlp", type=Path, help="OTLP/JSON 페이로드로 저장할 경로")
+    args = parser.parse_args()
+
+    traces = load_spans(args.path, args.conversation)
+    if not traces:
+        print("No spans found.")
+        return 1
+
+    if args.otlp:
+        write_otlp(traces, args.otlp)
+        print(f"Saved {sum(len(s) for s in traces.values())} spans to {args.otlp}")
+    elif args.tree:
+        latest = max(traces.values(), key=lambda spans: max(int(s["endTimeUnixNano"]) for s in spans))
+        print_tree(latest)
+    else:
+        print_summary(traces)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
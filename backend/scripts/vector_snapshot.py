@@ -0,0 +1,83 @@
+"""
+임베딩 스냅샷 내보내기/가져오기 스크립트
+
+사용법:
+    python backend/scripts/vector_snapshot.py export                     # 모든 네임스페이스 내보내기
+    python backend/scripts/vector_snapshot.py export --namespace majors
+    python backend/scripts/vector_snapshot.py info [--path DIR]          # 스냅샷 정보 출력
+    python backend/scripts/vector_snapshot.py import [--path DIR]        # Pinecone에 재적재 (임베딩 호출 없음)
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to sys.path
+current_dir = Path(__file__).resolve().parent
+project_root = current_dir.parent.parent
+sys.path.append(str(project_root))
+
+from backend.rag.snapshot import export_snapshot, load_snapshot, restore_snapshot
+
+
+def show_info(path=None):
+    started = time.perf_counter()
+    snapshot = load_snapshot(path)
+    for name in snapshot.namespaces:
+        snapshot.namespace(name)  # mmap 열기
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    manifest = snapshot.manifest
+    print(f"📦 Snapshot: {snapshot.path}")
+    print(f"   version={snapshot.version}, created_at={manifest['created_at']}")
+    print(
+        f"   embedding={manifest['embedding_provider']}/{manifest['embedding_model']}, "
+        f"dimension={snapshot.dimension}"
+    )
+    for name, info in manifest["namespaces"].items():
+        print(f"   - {name or '(default)'}: {info['count']} vectors")
+    print(f"   loaded in {elapsed_ms:.1f} ms (mmap)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export/import embedding snapshots")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Pinecone → 스냅샷 파일")
+    export_parser.add_argument(
+        "--namespace", action="append", help="내보낼 네임스페이스 (여러 번 지정 가능)"
+    )
+    export_parser.add_argument("--out", type=Path, help="스냅샷 기본 디렉토리")
+    export_parser.add_argument("--version", help="버전 이름 (기본값: UTC 타임스탬프)")
+
+    info_parser = subparsers.add_parser("info", help="스냅샷 정보 출력")
+    info_parser.add_argument("--path", type=Path, help="스냅샷 디렉토리 (기본값: 최신)")
+
+    import_parser = subparsers.add_parser("import", help="스냅샷 → Pinecone 재적재")
+    import_parser.add_argument("--path", type=Path, help="스냅샷 디렉토리 (기본값: 최신)")
+    import_parser.add_argument(
+        "--namespace", action="append", help="재적재할 네임스페이스 (여러 번 지정 가능)"
+    )
+    import_parser.add_argument("--batch-size", type=int, help="업서트 배치 크기")
+
+    args = parser.parse_args()
+
+    if args.command == "export":
+        path = export_snapshot(
+            namespaces=args.namespace, out_root=args.out, version=args.version
+        )
+        show_info(path)
+    elif args.command == "info":
+        show_info(args.path)
+    elif args.command == "import":
+        snapshot = load_snapshot(args.path)
+        print(f"📥 Restoring snapshot {snapshot.version} into Pinecone...")
+        count = restore_snapshot(
+            snapshot, namespaces=args.namespace, batch_size=args.batch_size
+        )
+        print(f"✨ Restored {count} vectors.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+# backend/tracing.py
+"""
+요청 단위 트레이싱(span) 모듈
+
+채팅 한 턴의 지연 시간이 어디에서 발생하는지(그래프 노드, 툴, DB, 임베딩, 벡터 검색) 확인하기 위해
+실행 구간(span)을 기록하고 JSON Lines로 내보냅니다.
+각 줄은 OpenTelemetry OTLP/JSON의 Span 형식(traceId, spanId, parentSpanId, startTimeUnixNano, attributes ...)을
+따르므로 trace_report.py로 요약하거나 OTLP 페이로드로 변환해 수집기(collector)에 보낼 수 있습니다.
+
+** 규칙 **
+1. TRACE_EXPORT_PATH가 비어 있으면 비활성화 (span()은 아무것도 기록하지 않음)
+2. 트레이스는 start_trace()로만 시작 (views의 채팅 턴). 트레이스 밖의 span()은 기록하지 않음
+   → 시딩/인덱싱 스크립트의 SQL 문은 기록되지 않음
+3. 현재 span은 ContextVar로 전달되므로 LangGraph 노드/툴 스레드(컨텍스트 복사)까지 부모-자식 관계가 이어짐
+4. start_trace()에 전달한 baggage(예: conversation.id)는 모든 하위 span의 속성에 복사됨
+5. TRACE_SAMPLE_RATE(0~1) 비율의 트레이스만 기록
+
+** 사용 예시 **
+    with tracing.start_trace("chat.turn", baggage={"conversation.id": 12}):
+        with tracing.span("tool.list_departments", query="컴퓨터"):
+            ...
+            tracing.set_attribute("tool.outcome", "10개 학과 정보 반환")
+"""
+
+import functools
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from backend.config import get_settings
+
+# OTLP/JSON enum 값
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_UNSET = 0
+STATUS_ERROR = 2
+
+SERVICE_NAME = "unigo"
+
+
+class Span:
+    """진행 중인 실행 구간 하나"""
+
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "name",
+        "kind",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "baggage",
+        "error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: str = "",
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Optional[dict] = None,
+        baggage: Optional[dict] = None,
+    ):
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = dict(attributes or {})
+        self.baggage = baggage or {}
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_otlp(self) -> dict:
+        """OTLP/JSON Span 형식의 dict (ID는 hex, 시간은 문자열 나노초)"""
+        data = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in {**self.baggage, **self.attributes}.items()
+                if value is not None
+            ],
+            "status": {"code": STATUS_UNSET},
+        }
+        if self.parent_span_id:
+            data["parentSpanId"] = self.parent_span_id
+        if self.error:
+            data["status"] = {"code": STATUS_ERROR, "message": self.error}
+        return data
+
+
+def _otlp_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+# 현재 실행 중인 span (트레이스 밖이면 None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_trace_span", default=None)
+
+
+class _JsonLinesExporter:
+    """종료된 span을 JSON Lines 파일에 한 줄씩 추가합니다. (프로세스 내 스레드 간 공유)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_otlp(), ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+            self._file.write(line + "\n")
+
+
+settings = get_settings()
+_exporter = (
+    _JsonLinesExporter(settings.trace_export_path) if settings.trace_export_path else None
+)
+
+
+def is_enabled() -> bool:
+    return _exporter is not None
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    """현재 컨텍스트의 트레이스 ID (트레이스 밖이면 None)"""
+    span = _current_span.get()
+    return span.trace_id if span else None
+
+
+def set_attribute(key: str, value: Any) -> None:
+    """현재 span에 속성을 추가합니다. (트레이스 밖이면 무시)"""
+    span = _current_span.get()
+    if span is not None:
+        span.set_attribute(key, value)
+
+
+def start_span(
+    name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any
+) -> Optional[Span]:
+    """
+    현재 span의 자식 span을 시작합니다. 트레이스 밖이면 None을 반환합니다.
+    컨텍스트 관리자를 쓸 수 없는 곳(SQLAlchemy 이벤트 등)에서 end_span()과 짝으로 사용합니다.
+    (이 함수는 현재 span을 바꾸지 않으므로 그 안의 작업은 자식 span이 되지 않습니다)
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return None
+    return Span(
+        name,
+        parent.trace_id,
+        parent_span_id=parent.span_id,
+        kind=kind,
+        attributes=attributes,
+        baggage=parent.baggage,
+    )
+
+
+def end_span(span: Optional[Span], error: Optional[BaseException] = None) -> None:
+    if span is None:
+        return
+    span.end_ns = time.time_ns()
+    if error is not None:
+        span.error = f"{type(error).__name__}: {error}"
+    if _exporter is not None:
+        _exporter.export(span)
+
+
+@contextmanager
+def _activate(span: Optional[Span]):
+    if span is None:
+        yield None
+        return
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        end_span(span, e)
+        raise
+    else:
+        end_span(span)
+    finally:
+        _current_span.reset(token)
+
+
+def start_trace(name: str, baggage: Optional[dict] = None, **attributes: Any):
+    """
+    새 트레이스의 루트 span을 시작하는 컨텍스트 관리자.
+    비활성화되었거나 샘플링에서 제외되면 아무것도 기록하지 않습니다.
+    """
+    if _exporter is None or random.random() >= settings.trace_sample_rate:
+        return _activate(None)
+    span = Span(
+        name,
+        f"{random.getrandbits(128):032x}",
+        attributes={"service.name": SERVICE_NAME, **attributes},
+        baggage=dict(baggage or {}),
+    )
+    return _activate(span)
+
+
+def span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any):
+    """현재 span의 자식 span을 여는 컨텍스트 관리자 (트레이스 밖이면 아무것도 하지 않음)"""
+    return _activate(start_span(name, kind, **attributes))
+
+
+def traced(name: str, kind: int = SPAN_KIND_INTERNAL):
+    """함수 실행 전체를 span으로 감싸는 데코레이터"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name, kind):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
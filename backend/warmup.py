@@ -0,0 +1,282 @@
+# backend/warmup.py
+"""
+워커 워밍업 (첫 요청 지연 제거)
+
+gunicorn 워커의 첫 채팅은 LangGraph 컴파일, LLM 클라이언트 생성, Pinecone 인덱스 핸들 생성(list_indexes 호출),
+MySQL 카테고리 로딩을 모두 요청 처리 중에 수행해서 느렸습니다.
+run_warmup()은 이 작업들을 요청을 받기 전에 실행하고, 마지막으로 검색 질의 하나를 끝까지 실행합니다.
+
+    단계          내용
+    database      엔진 생성 + SELECT 1 (커넥션 풀에 커넥션 하나 확보)
+    graphs        react/major 그래프 컴파일 (main.get_graph)
+    llm           에이전트 LLM 생성 + bind_tools (nodes._get_llms)
+    embeddings    임베딩 모델 생성 (get_embeddings)
+    categories    전공 카테고리 로딩 + CategoryMatcher 컴파일
+    vectorstores  전공/대학-학과/카테고리 VectorStore (Pinecone 인덱스 핸들 또는 로컬 스냅샷)
+    snapshot      VECTOR_BACKEND=local일 때 네임스페이스 mmap, 메타데이터, 벡터 크기 미리 읽기
+    query         list_departments(WARMUP_QUERY) 실행 (임베딩 API, 벡터 검색, DB 조회까지)
+
+호출 위치:
+- unigo/gunicorn.conf.py의 post_worker_init 훅: 워커가 요청을 받기 전에 실행 (워커별 1회)
+- python manage.py warmup: 같은 단계를 실행하고 결과를 출력 (배포 전 점검용)
+
+워커의 상태는 get_status()로 조회하며 /readyz가 이 값을 반환합니다.
+- query 단계는 선택 단계: 실패해도(일시적인 임베딩/OpenAI 오류 등) warning으로 기록하고 준비 상태를 막지 않습니다.
+- 필수 단계가 실패한 워커는 /readyz 요청 시 retry_failed_steps()로 실패한 단계만 백그라운드에서 다시 실행합니다.
+  (재시도 간격은 RETRY_BASE_SECONDS부터 두 배씩, 최대 RETRY_MAX_SECONDS)
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from backend import metrics
+from backend.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# cold(실행 전) → warming → ready | failed (→ 재시도 후 ready), 또는 disabled (WARMUP_ON_BOOT=False)
+_state: dict[str, Any] = {
+    "status": "cold",
+    "started_at": None,
+    "duration_ms": None,
+    "steps": [],
+    "retries": 0,
+    "next_retry_at": None,
+}
+_state_lock = threading.Lock()
+_run_lock = threading.Lock()
+
+READY_STATUSES = ("ready", "disabled")
+# 실패해도 준비 상태를 막지 않는 단계 (warning으로 기록)
+OPTIONAL_STEPS = ("query",)
+RETRY_BASE_SECONDS = 5.0
+RETRY_MAX_SECONDS = 300.0
+
+
+# ==================== 단계 ====================
+
+
+def _warm_database() -> str:
+    from backend.db.connection import get_engine
+
+    engine = get_engine()
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SELECT 1")
+    return engine.dialect.name
+
+
+def _warm_graphs() -> str:
+    from backend.main import get_graph
+
+    get_graph("react")
+    get_graph("major")
+    return "react, major"
+
+
+def _warm_llm() -> str:
+    from backend.graph.nodes import _get_llms
+
+    llm, _ = _get_llms()
+    return type(llm).__name__
+
+
+def _warm_embeddings() -> str:
+    from backend.rag.embeddings import get_embeddings
+
+    embeddings = get_embeddings()
+    # TracedEmbeddings면 감싼 모델의 이름
+    return type(getattr(embeddings, "model", embeddings)).__name__
+
+
+def _warm_categories() -> str:
+    from backend.rag.tools import get_category_matcher, get_main_categories
+
+    get_category_matcher()
+    categories = get_main_categories()
+    if not categories:
+        # _load_major_categories()는 실패 시 빈 dict를 캐싱하므로 여기서 실패로 표시
+        raise RuntimeError("major categories not loaded")
+    return f"{len(categories)} categories"
+
+
+def _warm_vectorstores() -> str:
+    from backend.rag.vectorstore import (
+        get_major_category_vectorstore,
+        get_major_vectorstore,
+        get_university_majors_vectorstore,
+    )
+
+    get_major_vectorstore()
+    get_university_majors_vectorstore()
+    get_major_category_vectorstore()
+    return get_settings().vector_backend
+
+
+def _warm_snapshot() -> str:
+    if get_settings().vector_backend.lower() != "local":
+        return "skipped (VECTOR_BACKEND != local)"
+
+    from backend.rag.local_index import get_snapshot
+
+    snapshot = get_snapshot()
+    for name in snapshot.namespaces:
+        namespace = snapshot.namespace(name)
+        namespace.metadata
+        namespace.norms
+    return f"{snapshot.version} ({len(snapshot.namespaces)} namespaces)"
+
+
+def _warm_query() -> str:
+    from backend.rag.tools import list_departments
+
+    query = get_settings().warmup_query
+    result = list_departments.invoke({"query": query, "top_k": 3})
+    return f"{query!r} → {len(result)} chars"
+
+
+STEPS: list[tuple[str, Callable[[], str]]] = [
+    ("database", _warm_database),
+    ("graphs", _warm_graphs),
+    ("llm", _warm_llm),
+    ("embeddings", _warm_embeddings),
+    ("categories", _warm_categories),
+    ("vectorstores", _warm_vectorstores),
+    ("snapshot", _warm_snapshot),
+    ("query", _warm_query),
+]
+
+
+# ==================== 실행 / 상태 ====================
+
+
+def _run_step(name: str, step: Callable[[], str]) -> dict:
+    result: dict[str, Any] = {"name": name}
+    step_started = time.perf_counter()
+    try:
+        result.update(status="ok", detail=step())
+    except Exception as e:
+        status = "warning" if name in OPTIONAL_STEPS else "error"
+        result.update(status=status, error=f"{type(e).__name__}: {e}")
+        logger.warning(f"⚠️ Warm-up step '{name}' failed{' (optional)' if status == 'warning' else ''}: {e}")
+    elapsed = time.perf_counter() - step_started
+    result["duration_ms"] = round(elapsed * 1000, 1)
+    metrics.set_gauge("warmup_step_seconds", elapsed, {"step": name})
+    return result
+
+
+def _retry_delay(retries: int) -> float:
+    return min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2**retries)
+
+
+def _finish(failed: bool, duration: Optional[float] = None) -> None:
+    # duration은 전체 실행일 때만 기록 (재시도는 단계별 시간만 갱신)
+    with _state_lock:
+        _state["status"] = "failed" if failed else "ready"
+        _state["next_retry_at"] = time.time() + _retry_delay(_state["retries"]) if failed else None
+        if duration is not None:
+            _state["duration_ms"] = round(duration * 1000, 1)
+    if duration is not None:
+        metrics.set_gauge("warmup_duration_seconds", duration)
+    metrics.set_gauge("worker_ready", 0 if failed else 1)
+
+
+def run_warmup(
+    skip: Optional[Iterable[str]] = None,
+    on_step: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """
+    워밍업 단계를 순서대로 실행하고 상태를 반환합니다.
+    한 단계가 실패해도 나머지 단계는 계속 실행하며, 필수 단계가 하나라도 실패하면 status는 failed입니다.
+
+    Args:
+        skip: 건너뛸 단계 이름 (None이면 WARMUP_SKIP 설정 사용)
+        on_step: 단계가 끝날 때마다 단계 결과 dict로 호출 (gunicorn 워커 heartbeat 등)
+    """
+    if skip is None:
+        skip = [name.strip() for name in get_settings().warmup_skip.split(",") if name.strip()]
+    skip = set(skip)
+
+    with _run_lock:
+        started = time.perf_counter()
+        with _state_lock:
+            _state.update(
+                status="warming", started_at=time.time(), duration_ms=None, steps=[],
+                retries=0, next_retry_at=None,
+            )
+        metrics.set_gauge("worker_ready", 0)
+
+        failed = False
+        for name, step in STEPS:
+            if name in skip:
+                result = {"name": name, "status": "skipped"}
+            else:
+                result = _run_step(name, step)
+                failed = failed or result["status"] == "error"
+
+            with _state_lock:
+                _state["steps"].append(result)
+            if on_step:
+                on_step(result)
+
+        _finish(failed, time.perf_counter() - started)
+        return get_status()
+
+
+def _retry_worker() -> None:
+    try:
+        steps = dict(STEPS)
+        with _state_lock:
+            _state["retries"] += 1
+            retries = _state["retries"]
+            targets = [i for i, step in enumerate(_state["steps"]) if step["status"] == "error"]
+        for i in targets:
+            with _state_lock:
+                name = _state["steps"][i]["name"]
+            result = _run_step(name, steps[name])
+            with _state_lock:
+                _state["steps"][i] = result
+        with _state_lock:
+            failed = any(step["status"] == "error" for step in _state["steps"])
+        _finish(failed)
+        logger.info(f"Warm-up retry #{retries}: {'failed' if failed else 'ready'}")
+    finally:
+        _run_lock.release()
+
+
+def retry_failed_steps() -> bool:
+    """
+    워밍업이 failed이고 재시도 시각이 지났으면 실패한 단계만 백그라운드 스레드에서 다시 실행합니다.
+    요청 스레드를 막지 않으며, 재시도를 시작했는지 여부를 반환합니다. (/readyz에서 호출)
+    """
+    with _state_lock:
+        due = _state["status"] == "failed" and time.time() >= (_state["next_retry_at"] or 0)
+    if not due or not _run_lock.acquire(blocking=False):
+        return False
+    with _state_lock:
+        # 락을 얻는 사이에 다른 스레드가 재시도를 마쳤으면 건너뜀
+        if _state["status"] != "failed":
+            _run_lock.release()
+            return False
+        _state["next_retry_at"] = None
+    threading.Thread(target=_retry_worker, name="warmup-retry", daemon=True).start()
+    return True
+
+
+def mark_disabled() -> None:
+    """워밍업 없이 바로 요청을 받는 워커 (WARMUP_ON_BOOT=False)"""
+    with _state_lock:
+        _state.update(status="disabled")
+    metrics.set_gauge("worker_ready", 1)
+
+
+def get_status() -> dict:
+    """현재 워커의 워밍업 상태 (복사본)"""
+    with _state_lock:
+        return {**_state, "steps": [dict(step) for step in _state["steps"]]}
+
+
+def is_ready() -> bool:
+    with _state_lock:
+        return _state["status"] in READY_STATUSES
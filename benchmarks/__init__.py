@@ -0,0 +1 @@
+"""Offline benchmark scripts for the Unigo backend and streaming pipeline."""
@@ -0,0 +1,208 @@
+"""
+Major JSON 컬럼 저장 형식 벤치마크 (LONGTEXT JSON vs json_packed)
+
+backend.db.packed와 같은 코드로 두 형식을 비교합니다.
+- disk: 행당 JSON 컬럼 저장 크기 (JSON: 7개 LONGTEXT 합계, packed: json_packed + university LONGTEXT)
+- wire: `SELECT *`에서 JSON 관련 컬럼으로 전송되는 바이트
+        (json: LONGTEXT 7개, packed: --drop-text 이후 json_packed + university)
+- decode: 행 하나를 MajorRecord로 만들 때의 파싱 시간 (json.loads × 7 vs unpack × 1)
+- encode: 시딩 시 직렬화 시간
+
+기본은 major_detail.json과 같은 구조의 합성 데이터를 사용하며 결과가 결정적입니다.
+--database-url을 주면 실제 majors 테이블(LONGTEXT 컬럼)의 행으로 측정합니다.
+
+실행:
+    python -m benchmarks.major_json_encoding --rows 1500
+    python -m benchmarks.major_json_encoding --database-url mysql+pymysql://user:pw@host/unigo_db
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(PROJECT_ROOT))
+
+from backend.db.packed import (  # noqa: E402
+    PACKED_MAJOR_FIELDS,
+    TEXT_KEPT_FIELDS,
+    pack,
+    unpack,
+)
+
+SUBJECTS = ["자료구조", "알고리즘", "운영체제", "컴퓨터네트워크", "데이터베이스", "선형대수", "확률과 통계", "미적분"]
+JOBS = ["소프트웨어 개발자", "데이터 엔지니어", "보안 전문가", "웹 개발자", "연구원", "교사", "공무원"]
+SCHOOLS = ["서울대학교", "연세대학교", "고려대학교", "한양대학교", "성균관대학교", "부산대학교", "경북대학교", "전남대학교"]
+AREAS = ["서울특별시", "부산광역시", "대구광역시", "광주광역시", "경기도", "강원도"]
+SENTENCE = "이 학과는 기초 이론과 실무 역량을 함께 기르며, 다양한 분야로 진출할 수 있습니다. "
+
+
+def _make_values(rng: random.Random, i: int) -> dict:
+    """major_detail.json 항목 하나와 비슷한 크기/구조의 JSON 컬럼 값"""
+    university = [
+        {
+            "schoolName": rng.choice(SCHOOLS),
+            "majorName": f"{rng.choice(SUBJECTS)}학과",
+            "campus_nm": "본교",
+            "area": rng.choice(AREAS),
+            "schoolURL": f"https://www.univ{rng.randint(1, 400)}.ac.kr",
+            "totalCount": str(rng.randint(10, 300)),
+        }
+        for _ in range(rng.randint(20, 120))
+    ]
+    chart_data = [
+        {
+            "employment_rate": [{"item": "전체", "data": f"{rng.uniform(40, 90):.1f}"}],
+            "applicant": [
+                {"item": "지원자", "data": str(rng.randint(100, 5000))},
+                {"item": "입학자", "data": str(rng.randint(10, 500))},
+            ],
+            "gender": [{"item": "남", "data": "60"}, {"item": "여", "data": "40"}],
+            "satisfaction": [{"item": label, "data": f"{rng.uniform(0, 50):.1f}"} for label in ("매우만족", "만족", "보통", "불만족")],
+            "salary": [{"item": f"{y}년", "data": str(rng.randint(150, 500))} for y in range(2015, 2024)],
+        }
+    ]
+    values = {
+        "relate_subject": [
+            {"subject_name": rng.choice(["공통과목", "일반선택", "진로선택"]), "subject_description": ", ".join(rng.sample(SUBJECTS, 4))}
+            for _ in range(3)
+        ],
+        "enter_field": [
+            {"gradeuate": rng.choice(["기업체", "연구소", "공공기관"]), "description": SENTENCE * 2}
+            for _ in range(3)
+        ],
+        "career_act": [
+            {"act_name": "학과 체험", "act_description": SENTENCE * 3} for _ in range(2)
+        ],
+        "main_subject": [
+            {"SBJECT_NM": s, "SBJECT_SUMRY": SENTENCE} for s in rng.sample(SUBJECTS, 5)
+        ],
+        "university": university,
+        "chart_data": chart_data,
+    }
+    values["raw_data"] = {
+        "dataSearch": {
+            "content": [
+                {
+                    "major": f"전공{i}",
+                    "summary": SENTENCE * 4,
+                    "job": ", ".join(rng.sample(JOBS, 4)),
+                    **values,
+                }
+            ]
+        }
+    }
+    return values
+
+
+def load_synthetic_rows(count: int) -> list[dict]:
+    rng = random.Random(0)
+    return [_make_values(rng, i) for i in range(count)]
+
+
+def load_db_rows(database_url: str, limit: int) -> list[dict]:
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine(database_url)
+    columns = ", ".join(PACKED_MAJOR_FIELDS)
+    with engine.connect() as conn:
+        result = conn.execute(text(f"SELECT {columns} FROM majors LIMIT :limit"), {"limit": limit})
+        return [
+            {name: json.loads(value) for name, value in row._mapping.items() if value}
+            for row in result
+        ]
+
+
+def _timeit(func, rows, repeat: int) -> list[float]:
+    """행 단위 처리 시간(µs) 목록"""
+    samples = []
+    for _ in range(repeat):
+        for row in rows:
+            started = time.perf_counter()
+            func(row)
+            samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1500, help="측정할 행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="decode/encode 반복 횟수")
+    parser.add_argument("--database-url", help="실제 majors 테이블에서 행을 읽어 측정")
+    args = parser.parse_args()
+
+    if args.database_url:
+        values_rows = load_db_rows(args.database_url, args.rows)
+    else:
+        values_rows = load_synthetic_rows(args.rows)
+    if not values_rows:
+        print("No rows to benchmark.")
+        return
+
+    # 저장 형식별 행 표현 (DB에 저장되는 값 그대로)
+    json_rows = [
+        {name: json.dumps(values[name], ensure_ascii=False) for name in values}
+        for values in values_rows
+    ]
+    packed_rows = [
+        {
+            "json_packed": pack(values),
+            **{name: json_row[name] for name in TEXT_KEPT_FIELDS if name in json_row},
+        }
+        for values, json_row in zip(values_rows, json_rows)
+    ]
+
+    json_bytes = sum(len(v.encode("utf-8")) for row in json_rows for v in row.values())
+    packed_blob_bytes = sum(len(row["json_packed"]) for row in packed_rows)
+    kept_bytes = sum(
+        len(row[name].encode("utf-8"))
+        for row in packed_rows
+        for name in TEXT_KEPT_FIELDS
+        if name in row
+    )
+    packed_bytes = packed_blob_bytes + kept_bytes
+
+    def decode_json(row):
+        return {name: json.loads(value) for name, value in row.items()}
+
+    def decode_packed(row):
+        return unpack(row["json_packed"])
+
+    def encode_json(values):
+        return {name: json.dumps(v, ensure_ascii=False) for name, v in values.items()}
+
+    # 디코딩 결과가 같은지 확인
+    assert decode_packed(packed_rows[0]) == decode_json(json_rows[0])
+
+    decode_json_us = _timeit(decode_json, json_rows, args.repeat)
+    decode_packed_us = _timeit(decode_packed, packed_rows, args.repeat)
+    encode_json_us = _timeit(encode_json, values_rows, args.repeat)
+    encode_packed_us = _timeit(pack, values_rows, args.repeat)
+
+    n = len(values_rows)
+    source = "database" if args.database_url else "synthetic"
+    print(f"rows={n} source={source} repeat={args.repeat}")
+    print(f"{'metric':<28}{'json (LONGTEXT)':>18}{'packed':>14}{'ratio':>9}")
+
+    def line(label, a, b, unit=""):
+        print(f"{label:<28}{a:>16.1f}{unit:>2}{b:>12.1f}{unit:>2}{b / a * 100 if a else 0:>8.1f}%")
+
+    line("disk bytes/row", json_bytes / n, packed_bytes / n, "B")
+    line("wire bytes/row (drop-text)", json_bytes / n, packed_bytes / n, "B")
+    line("wire bytes/row (keep text)", json_bytes / n, (json_bytes + packed_blob_bytes) / n, "B")
+    line("decode µs/row (mean)", statistics.mean(decode_json_us), statistics.mean(decode_packed_us))
+    line("decode µs/row (p95)", _p95(decode_json_us), _p95(decode_packed_us))
+    line("encode µs/row (mean)", statistics.mean(encode_json_us), statistics.mean(encode_packed_us))
+
+
+def _p95(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+if __name__ == "__main__":
+    main()
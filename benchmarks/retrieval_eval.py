@@ -0,0 +1,276 @@
+"""
+검색 품질(recall@k, MRR)과 지연 시간 회귀 벤치마크 (골든 질의 세트)
+
+golden_queries.json의 질의/온보딩 프로필을 벡터 검색 백엔드(VECTOR_BACKEND)별로 실행하고
+다음 세 경로의 결과를 기대 전공 목록과 비교하여 나란히 보고합니다.
+- find_majors: tools._find_majors(query) (대학-학과 검색 + LLM 검증 + 이름/별칭/벡터/토큰 검색)
+- search_docs: search_major_docs(embed(query)) + aggregate_major_scores() 점수순
+- recommend:   recommend_majors_node({"onboarding_answers": profile})의 recommended_majors
+
+backend.config는 임포트 시점에 환경 변수를 읽으므로 백엔드마다 별도 프로세스(--worker)에서 실행합니다.
+pinecone 백엔드는 실제 Pinecone/임베딩/LLM API를 호출합니다(_find_majors의 후보 검증 포함).
+
+실행:
+    python -m benchmarks.retrieval_eval                                  # local, pinecone 나란히
+    python -m benchmarks.retrieval_eval --backends local --k 5 10
+    python -m benchmarks.retrieval_eval --fixture                        # 오프라인 픽스처로 코드 경로만 확인 (품질 값은 의미 없음)
+    python -m benchmarks.retrieval_eval --save baseline.json
+    python -m benchmarks.retrieval_eval --compare baseline.json --max-drop 0.05 --tolerance 1.5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+GOLDEN_PATH = Path(__file__).resolve().parent / "golden_queries.json"
+PIPELINES = ("find_majors", "search_docs", "recommend")
+
+
+@dataclass
+class GoldenCase:
+    id: str
+    kind: str  # query | profile
+    expected: list[str]
+    query: str = ""
+    profile: dict = field(default_factory=dict)
+    note: str = ""
+
+
+def load_golden(path: Path) -> list[GoldenCase]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return [GoldenCase(**case) for case in data["cases"]]
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _dedupe(names: list[str]) -> list[str]:
+    seen: set[str] = set()
+    return [n for n in names if n and not (n in seen or seen.add(n))]
+
+
+# ==================== 파이프라인 (워커 프로세스) ====================
+
+
+def build_pipelines(k: int) -> dict[str, tuple[str, Callable[[GoldenCase], list[str]]]]:
+    """파이프라인 이름 → (대상 case 종류, case → 순위별 전공명 목록)"""
+    from backend.graph.nodes import MAJOR_DOC_WEIGHTS, recommend_majors_node
+    from backend.rag import tools
+    from backend.rag.embeddings import get_embeddings
+    from backend.rag.retriever import aggregate_major_scores, search_major_docs
+
+    def find_majors(case: GoldenCase) -> list[str]:
+        return [record.major_name for record in tools._find_majors(case.query, limit=k)]
+
+    def search_docs(case: GoldenCase) -> list[str]:
+        hits = search_major_docs(get_embeddings().embed_query(case.query), top_k=50)
+        scores = aggregate_major_scores(hits, MAJOR_DOC_WEIGHTS)
+        names = {hit.major_id: hit.major_name for hit in hits}
+        ranked = sorted(scores, key=scores.get, reverse=True)
+        return _dedupe([names[major_id] for major_id in ranked])
+
+    def recommend(case: GoldenCase) -> list[str]:
+        result = recommend_majors_node({"onboarding_answers": case.profile})
+        return _dedupe([item["major_name"] for item in result["recommended_majors"]])
+
+    return {
+        "find_majors": ("query", find_majors),
+        "search_docs": ("query", search_docs),
+        "recommend": ("profile", recommend),
+    }
+
+
+def evaluate(
+    cases: list[GoldenCase], ks: list[int], repeat: int
+) -> dict[str, Any]:
+    """백엔드 하나에 대해 파이프라인별 recall@k, MRR, 지연 시간과 case별 결과를 계산"""
+    pipelines = build_pipelines(max(ks))
+    report: dict[str, Any] = {}
+
+    for name, (kind, run) in pipelines.items():
+        targets = [case for case in cases if case.kind == kind]
+        if not targets:
+            continue
+        # 캐시/커넥션 워밍업 (측정에서 제외)
+        run(targets[0])
+
+        latencies: list[float] = []
+        recalls: dict[int, list[float]] = {k: [] for k in ks}
+        reciprocal_ranks: list[float] = []
+        per_case = []
+        for case in targets:
+            for _ in range(repeat):
+                started = time.perf_counter()
+                ranked = run(case)
+                latencies.append((time.perf_counter() - started) * 1000)
+
+            expected = set(case.expected)
+            for k in ks:
+                recalls[k].append(len(expected & set(ranked[:k])) / len(expected))
+            rank = next((i + 1 for i, n in enumerate(ranked) if n in expected), None)
+            reciprocal_ranks.append(1 / rank if rank else 0.0)
+            per_case.append({"id": case.id, "rank": rank, "top": ranked[: max(ks)]})
+
+        report[name] = {
+            "cases": len(targets),
+            **{f"recall@{k}": round(statistics.mean(v), 4) for k, v in recalls.items()},
+            "mrr": round(statistics.mean(reciprocal_ranks), 4),
+            "p50_ms": round(_percentile(latencies, 0.50), 2),
+            "p95_ms": round(_percentile(latencies, 0.95), 2),
+            "per_case": per_case,
+        }
+    return report
+
+
+def run_worker(args: argparse.Namespace) -> int:
+    """현재 프로세스의 VECTOR_BACKEND로 평가하고 결과를 --output에 저장"""
+    if args.fixture:
+        from benchmarks.tool_fixture import build_fixture, install_stand_ins, prepare_environment
+
+        workdir = Path(tempfile.mkdtemp(prefix="unigo-eval-"))
+        prepare_environment(workdir)
+        install_stand_ins()
+        build_fixture(workdir)
+
+    report = evaluate(load_golden(args.golden), args.k, args.repeat)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False)
+    return 0
+
+
+# ==================== 실행/보고 (부모 프로세스) ====================
+
+
+def run_backend(backend: str, args: argparse.Namespace) -> dict[str, Any] | None:
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
+        output = Path(tmp.name)
+    command = [
+        sys.executable, "-m", "benchmarks.retrieval_eval", "--worker",
+        "--output", str(output), "--golden", str(args.golden),
+        "--repeat", str(args.repeat), "--k", *map(str, args.k),
+    ]
+    if args.fixture:
+        command.append("--fixture")
+    env = {**os.environ, "VECTOR_BACKEND": backend}
+
+    print(f"▶ {backend} ...", flush=True)
+    # 백엔드 초기화/툴 로그는 표(stdout)와 섞이지 않도록 stderr로만 보냄
+    completed = subprocess.run(command, env=env, stdout=sys.stderr)
+    try:
+        if completed.returncode != 0:
+            print(f"❌ {backend}: worker exited with {completed.returncode}")
+            return None
+        with open(output, "r", encoding="utf-8") as f:
+            return json.load(f)
+    finally:
+        output.unlink(missing_ok=True)
+
+
+def print_report(results: dict[str, dict], ks: list[int], show_misses: bool) -> None:
+    backends = list(results)
+    metrics = [*(f"recall@{k}" for k in ks), "mrr", "p50_ms", "p95_ms"]
+    header = f"{'pipeline':<12} {'metric':<10}" + "".join(f"{b:>12}" for b in backends)
+    print("\n" + header)
+    print("-" * len(header))
+    for pipeline in PIPELINES:
+        if not any(pipeline in results[b] for b in backends):
+            continue
+        for i, metric in enumerate(metrics):
+            label = pipeline if i == 0 else ""
+            cells = "".join(
+                f"{results[b][pipeline][metric]:>12.3f}" if pipeline in results[b] else f"{'-':>12}"
+                for b in backends
+            )
+            print(f"{label:<12} {metric:<10}{cells}")
+
+    if show_misses:
+        for backend in backends:
+            for pipeline, report in results[backend].items():
+                misses = [c for c in report["per_case"] if c["rank"] is None]
+                for case in misses:
+                    print(f"\n[{backend}/{pipeline}] miss {case['id']}: {', '.join(case['top']) or '(결과 없음)'}")
+
+
+def find_regressions(
+    results: dict[str, dict], baseline: dict[str, dict], ks: list[int], max_drop: float, tolerance: float
+) -> list[str]:
+    """recall@k/MRR이 max_drop보다 많이 떨어졌거나 p95가 tolerance배를 넘은 항목"""
+    regressions = []
+    for backend, pipelines in results.items():
+        for pipeline, report in pipelines.items():
+            base = baseline.get(backend, {}).get(pipeline)
+            if not base:
+                continue
+            for metric in [*(f"recall@{k}" for k in ks), "mrr"]:
+                if metric in base and report[metric] < base[metric] - max_drop:
+                    regressions.append(
+                        f"{backend}/{pipeline} {metric} {base[metric]:.3f} → {report[metric]:.3f}"
+                    )
+            if report["p95_ms"] > base["p95_ms"] * tolerance:
+                regressions.append(
+                    f"{backend}/{pipeline} p95 {base['p95_ms']:.1f}ms → {report['p95_ms']:.1f}ms"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", default=["local", "pinecone"], help="VECTOR_BACKEND 값 목록")
+    parser.add_argument("--golden", type=Path, default=GOLDEN_PATH, help="골든 질의 세트 JSON")
+    parser.add_argument("--k", type=int, nargs="+", default=[5, 10], help="recall@k의 k 값")
+    parser.add_argument("--repeat", type=int, default=1, help="case별 반복 실행 횟수 (지연 시간 표본)")
+    parser.add_argument("--fixture", action="store_true", help="오프라인 픽스처(로컬 백엔드)로 실행")
+    parser.add_argument("--show-misses", action="store_true", help="기대 전공을 하나도 찾지 못한 case 출력")
+    parser.add_argument("--save", type=Path, help="결과를 JSON으로 저장")
+    parser.add_argument("--compare", type=Path, help="기준 결과(JSON)와 비교")
+    parser.add_argument("--max-drop", type=float, default=0.05, help="--compare 시 허용하는 recall/MRR 하락폭")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="--compare 시 허용하는 p95 배율")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--output", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        return run_worker(args)
+
+    backends = ["local"] if args.fixture else args.backends
+    results = {}
+    for backend in backends:
+        report = run_backend(backend, args)
+        if report is not None:
+            results[backend] = report
+    if not results:
+        return 1
+
+    cases = load_golden(args.golden)
+    print(f"\ngolden: {args.golden.name} ({len(cases)} cases)")
+    print_report(results, args.k, args.show_misses)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"k": args.k, "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"\nSaved results to {args.save}")
+
+    exit_code = 0 if len(results) == len(backends) else 1
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = find_regressions(results, baseline, args.k, args.max_drop, args.tolerance)
+        if regressions:
+            print("\n❌ Regression:\n  " + "\n  ".join(regressions))
+            exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
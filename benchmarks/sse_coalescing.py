@@ -0,0 +1,131 @@
+"""
+SSE delta coalescing 벤치마크
+
+stream_chat_responses와 동일한 프레이밍 코드(unigo_app.streaming)를 사용하여
+답변 하나를 스트리밍할 때의 write 횟수(≈ send syscall)와 전송 바이트를 비교합니다.
+
+- baseline: 토큰마다 `json.dumps` 기본 옵션으로 프레임 1개 (기존 구현)
+- coalesced: DeltaCoalescer + compact JSON 프레임 (window별 비교)
+
+네트워크/LLM 없이 가상 시계로 토큰 도착 간격을 재현하므로 결과가 결정적입니다.
+
+실행:
+    python -m benchmarks.sse_coalescing --tokens 1500 --interval-ms 15
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# unigo_app 모듈 임포트를 위해 Django 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(PROJECT_ROOT / "unigo"))
+
+from unigo_app.streaming import DeltaCoalescer, format_sse  # noqa: E402
+
+SAMPLE_ANSWER = (
+    "컴퓨터공학과는 소프트웨어와 하드웨어 전반을 다루는 학과입니다. "
+    "주요 과목으로는 자료구조, 알고리즘, 운영체제, 컴퓨터네트워크가 있으며 "
+    "졸업 후에는 소프트웨어 개발자, 데이터 엔지니어, 보안 전문가 등으로 진출합니다.\n\n"
+    "- **취업률**: 커리어넷 기준 약 70%\n"
+    "- **평균 연봉**: 약 3,500만원\n\n"
+)
+
+
+class VirtualClock:
+    """토큰 도착 시각을 재현하기 위한 가상 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_tokens(count: int) -> list[str]:
+    # 실제 LLM 스트림과 비슷하게 1~3글자 단위의 토큰으로 분할
+    text = SAMPLE_ANSWER * (count // 40 + 1)
+    tokens: list[str] = []
+    pos = 0
+    sizes = (1, 2, 3, 2)
+    while len(tokens) < count:
+        size = sizes[len(tokens) % len(sizes)]
+        tokens.append(text[pos : pos + size])
+        pos += size
+    return tokens
+
+
+def run_baseline(tokens: list[str], interval: float) -> dict:
+    frames = 0
+    total_bytes = 0
+    first_frame_at = None
+    for i, token in enumerate(tokens):
+        frame = f"data: {json.dumps({'type': 'delta', 'content': token})}\n\n"
+        frames += 1
+        total_bytes += len(frame.encode("utf-8"))
+        if first_frame_at is None:
+            first_frame_at = i * interval
+    return {"frames": frames, "bytes": total_bytes, "ttft_ms": first_frame_at * 1000}
+
+
+def run_coalesced(tokens: list[str], interval: float, window_ms: int, max_bytes: int) -> dict:
+    clock = VirtualClock()
+    coalescer = DeltaCoalescer(window_ms=window_ms, max_bytes=max_bytes, clock=clock)
+    frames = 0
+    total_bytes = 0
+    first_frame_at = None
+    received = []
+
+    def emit(text: str):
+        nonlocal frames, total_bytes, first_frame_at
+        frame = format_sse({"type": "delta", "content": text})
+        frames += 1
+        total_bytes += len(frame.encode("utf-8"))
+        received.append(text)
+        if first_frame_at is None:
+            first_frame_at = clock.now
+
+    for i, token in enumerate(tokens):
+        clock.now = i * interval
+        pending = coalescer.push(token)
+        if pending:
+            emit(pending)
+    pending = coalescer.flush()
+    if pending:
+        emit(pending)
+
+    # 묶어서 보내더라도 내용은 손실 없이 동일해야 함
+    assert "".join(received) == "".join(tokens)
+    return {"frames": frames, "bytes": total_bytes, "ttft_ms": first_frame_at * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tokens", type=int, default=1500, help="답변 하나의 토큰 수")
+    parser.add_argument("--interval-ms", type=float, default=15.0, help="토큰 도착 간격")
+    parser.add_argument("--windows", type=str, default="0,20,40,50", help="비교할 window(ms)")
+    parser.add_argument("--max-bytes", type=int, default=2048)
+    args = parser.parse_args()
+
+    tokens = _make_tokens(args.tokens)
+    interval = args.interval_ms / 1000.0
+
+    rows = [("baseline (json.dumps/token)", run_baseline(tokens, interval))]
+    for window in [int(w) for w in args.windows.split(",") if w.strip()]:
+        label = f"coalesced window={window}ms"
+        rows.append((label, run_coalesced(tokens, interval, window, args.max_bytes)))
+
+    base = rows[0][1]
+    print(f"tokens={len(tokens)} interval={args.interval_ms}ms")
+    print(f"{'mode':<32}{'writes':>10}{'bytes':>12}{'bytes/answer %':>16}{'TTFT(ms)':>10}")
+    for label, result in rows:
+        ratio = result["bytes"] / base["bytes"] * 100
+        print(
+            f"{label:<32}{result['frames']:>10}{result['bytes']:>12}"
+            f"{ratio:>15.1f}%{result['ttft_ms']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
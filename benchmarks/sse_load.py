@@ -0,0 +1,232 @@
+"""
+/api/chat SSE 부하 테스트 (동시 클라이언트 N개)
+
+실행 중인 서버(들)에 동시 클라이언트를 붙여 채팅 요청을 보내고, 서빙 방식(target)별로 다음을 보고합니다.
+- TTFD: 요청 전송 → 첫 delta 이벤트까지의 시간 (ms)
+- 전체 지연 시간: 요청 전송 → done 이벤트까지의 시간 (ms)
+- 처리량: 성공한 채팅 수 / 전체 경과 시간 (chats/s)
+- 오류율: HTTP 오류, error 이벤트, done 없이 끊긴 스트림, 429(LLM 대기열 거절)
+
+OpenAI 없이 측정하려면 서버를 LLM_PROVIDER=scripted로 실행합니다. (docs/1019_sse_load_test.md 참고)
+
+실행:
+    python -m benchmarks.sse_load --target gunicorn-gthread=http://127.0.0.1:8001 \\
+        --target uvicorn=http://127.0.0.1:8002 --clients 20 --requests 5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+
+DEFAULT_MESSAGE = "컴퓨터공학과 졸업 후 진로가 궁금해요"
+
+
+@dataclass
+class ChatSample:
+    ok: bool
+    status: int
+    ttfd_ms: Optional[float] = None
+    total_ms: Optional[float] = None
+    deltas: int = 0
+    error: str = ""
+
+
+@dataclass
+class TargetResult:
+    label: str
+    url: str
+    samples: list[ChatSample] = field(default_factory=list)
+    wall_s: float = 0.0
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _parse_target(value: str) -> tuple[str, str]:
+    label, sep, url = value.partition("=")
+    if not sep:
+        label, url = value, value
+    return label, url.rstrip("/")
+
+
+async def _fetch_csrf_token(client: httpx.AsyncClient) -> str:
+    """채팅 페이지를 열어 csrftoken 쿠키를 받습니다. (chat_api는 CSRF 검사를 거침)"""
+    response = await client.get("/chat/", follow_redirects=True)
+    response.raise_for_status()
+    token = client.cookies.get("csrftoken")
+    if not token:
+        raise RuntimeError(f"csrftoken cookie not set by {client.base_url}/chat/")
+    return token
+
+
+async def _run_chat(client: httpx.AsyncClient, csrf_token: str, message: str) -> ChatSample:
+    """채팅 요청 하나를 보내고 SSE 스트림을 끝까지 읽습니다. (요청마다 새 session_id)"""
+    started = time.perf_counter()
+    headers = {"X-CSRFToken": csrf_token, "Referer": f"{client.base_url}/chat/"}
+    body = {"message": message, "session_id": str(uuid.uuid4())}
+
+    try:
+        async with client.stream("POST", "/api/chat", json=body, headers=headers) as response:
+            if response.status_code != 200:
+                await response.aread()
+                return ChatSample(ok=False, status=response.status_code, error=f"HTTP {response.status_code}")
+
+            sample = ChatSample(ok=False, status=200)
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue  # id:, keep-alive 주석(:), 프레임 구분 빈 줄
+                event = json.loads(line[5:])
+                kind = event.get("type")
+                if kind == "delta":
+                    sample.deltas += 1
+                    if sample.ttfd_ms is None:
+                        sample.ttfd_ms = (time.perf_counter() - started) * 1000
+                elif kind == "error":
+                    sample.error = f"error event: {event.get('content', '')}"
+                elif kind == "done":
+                    sample.total_ms = (time.perf_counter() - started) * 1000
+                    sample.ok = not sample.error
+                    return sample
+
+            sample.error = sample.error or "stream closed before done"
+            return sample
+    except (httpx.HTTPError, json.JSONDecodeError) as e:
+        return ChatSample(ok=False, status=0, error=f"{type(e).__name__}: {e}")
+
+
+async def _client_loop(
+    url: str, requests: int, message: str, timeout: float, samples: list[ChatSample]
+) -> None:
+    async with httpx.AsyncClient(base_url=url, timeout=timeout) as client:
+        try:
+            csrf_token = await _fetch_csrf_token(client)
+        except (httpx.HTTPError, RuntimeError) as e:
+            samples.extend(
+                ChatSample(ok=False, status=0, error=f"csrf: {e}") for _ in range(requests)
+            )
+            return
+        for _ in range(requests):
+            samples.append(await _run_chat(client, csrf_token, message))
+
+
+async def run_target(
+    label: str, url: str, clients: int, requests: int, message: str, timeout: float
+) -> TargetResult:
+    """동시 클라이언트 clients개가 각각 requests회씩 순차적으로 채팅을 보냅니다."""
+    result = TargetResult(label=label, url=url)
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _client_loop(url, requests, message, timeout, result.samples)
+            for _ in range(clients)
+        )
+    )
+    result.wall_s = time.perf_counter() - started
+    return result
+
+
+def summarize(result: TargetResult) -> dict[str, Any]:
+    samples = result.samples
+    ok = [s for s in samples if s.ok]
+    ttfd = [s.ttfd_ms for s in ok if s.ttfd_ms is not None]
+    total = [s.total_ms for s in ok if s.total_ms is not None]
+    errors: dict[str, int] = {}
+    for s in samples:
+        if not s.ok:
+            errors[s.error] = errors.get(s.error, 0) + 1
+    return {
+        "url": result.url,
+        "requests": len(samples),
+        "ok": len(ok),
+        "rejected_429": sum(1 for s in samples if s.status == 429),
+        "error_rate": (len(samples) - len(ok)) / len(samples) if samples else 0.0,
+        "ttfd_p50_ms": _percentile(ttfd, 0.50),
+        "ttfd_p95_ms": _percentile(ttfd, 0.95),
+        "ttfd_p99_ms": _percentile(ttfd, 0.99),
+        "total_p50_ms": _percentile(total, 0.50),
+        "total_p95_ms": _percentile(total, 0.95),
+        "total_p99_ms": _percentile(total, 0.99),
+        "mean_deltas": statistics.mean(s.deltas for s in ok) if ok else 0.0,
+        "throughput_per_s": len(ok) / result.wall_s if result.wall_s else 0.0,
+        "wall_s": result.wall_s,
+        "errors": errors,
+    }
+
+
+def print_report(summaries: dict[str, dict[str, Any]]) -> None:
+    width = max(len("target"), *(len(label) for label in summaries))
+    header = (
+        f"{'target':<{width}}  {'reqs':>5} {'err%':>6} {'429':>4}"
+        f"  {'ttfd p50':>9} {'p95':>8} {'p99':>8}"
+        f"  {'total p50':>9} {'p95':>8} {'p99':>8}  {'chats/s':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for label, s in summaries.items():
+        print(
+            f"{label:<{width}}  {s['requests']:>5} {s['error_rate'] * 100:>5.1f}% {s['rejected_429']:>4}"
+            f"  {s['ttfd_p50_ms']:>9.1f} {s['ttfd_p95_ms']:>8.1f} {s['ttfd_p99_ms']:>8.1f}"
+            f"  {s['total_p50_ms']:>9.1f} {s['total_p95_ms']:>8.1f} {s['total_p99_ms']:>8.1f}"
+            f"  {s['throughput_per_s']:>8.2f}"
+        )
+    print("(latency in ms)")
+    for label, s in summaries.items():
+        for error, count in sorted(s["errors"].items(), key=lambda kv: -kv[1])[:5]:
+            print(f"  [{label}] {count}x {error}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--target",
+        action="append",
+        required=True,
+        help="측정할 서버 (label=http://host:port, 여러 번 지정 가능)",
+    )
+    parser.add_argument("--clients", type=int, default=10, help="동시 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=5, help="클라이언트당 채팅 요청 수")
+    parser.add_argument("--message", default=DEFAULT_MESSAGE, help="보낼 사용자 메시지")
+    parser.add_argument("--timeout", type=float, default=120.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--save", type=Path, help="결과를 JSON으로 저장")
+    args = parser.parse_args()
+
+    summaries = {}
+    for value in args.target:
+        label, url = _parse_target(value)
+        print(f"▶ {label}: {args.clients} clients x {args.requests} requests → {url}")
+        result = asyncio.run(
+            run_target(label, url, args.clients, args.requests, args.message, args.timeout)
+        )
+        summaries[label] = summarize(result)
+
+    print()
+    print_report(summaries)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(
+                {"clients": args.clients, "requests": args.requests, "results": summaries},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        print(f"\nSaved results to {args.save}")
+
+    return 0 if all(s["ok"] for s in summaries.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+툴 벤치마크용 오프라인 픽스처 (SQLite + 로컬 벡터 스냅샷 + 가짜 임베딩/LLM)
+
+MySQL, Pinecone, OpenAI 없이 backend/rag/tools.py의 툴을 실행할 수 있도록
+작업 디렉토리에 다음을 만듭니다.
+
+- SQLite DB: majors / major_categories / universities
+  - major_categories, universities: 저장소의 backend/data JSON을 seed_categories/seed_universities로 시딩
+  - majors: 카테고리 key(표준 학과명)마다 major_detail.json 형식의 합성 항목을 만들어 seed_majors로 시딩
+- 벡터 스냅샷(VECTOR_BACKEND=local): 전공 문서 / 대학-학과 문서 / 표준 학과명 3개 네임스페이스
+- 임베딩: langchain_core DeterministicFakeEmbedding (텍스트 해시 기반, 결과가 결정적)
+- LLM: langchain_core FakeListChatModel (후보 검증 응답 "1" 고정)
+
+backend.config의 설정은 임포트 시점에 환경 변수를 읽으므로,
+prepare_environment()를 backend 모듈을 임포트하기 전에 호출해야 합니다.
+"""
+
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import sys
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(PROJECT_ROOT))
+
+EMBEDDING_DIMENSION = 256
+SNAPSHOT_VERSION = "bench"
+DATA_DIR = PROJECT_ROOT / "backend" / "data"
+
+SUBJECTS = ["자료구조", "알고리즘", "운영체제", "선형대수", "확률과 통계", "미적분", "일반화학", "경영학원론"]
+JOBS = ["소프트웨어 개발자", "데이터 엔지니어", "연구원", "교사", "공무원", "회계사", "간호사", "디자이너"]
+CERTS = ["정보처리기사", "빅데이터분석기사", "전기기사", "사회조사분석사", "컴퓨터활용능력"]
+SENTENCE = "이 학과는 <strong>기초 이론</strong>과 실무 역량을 함께 기르며, 다양한 분야로 진출할 수 있습니다. "
+
+
+def prepare_environment(workdir: Path) -> None:
+    """픽스처 DB/스냅샷을 가리키도록 환경 변수를 설정합니다. (backend 임포트 전에 호출)"""
+    workdir.mkdir(parents=True, exist_ok=True)
+    os.environ["DATABASE_URL"] = f"sqlite:///{(workdir / 'bench.db').resolve()}"
+    os.environ["VECTOR_BACKEND"] = "local"
+    os.environ["VECTOR_SNAPSHOT_PATH"] = str((workdir / "snapshot").resolve())
+    os.environ["MAJOR_JSON_STORAGE"] = "json"
+    os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+    # SQLite에는 MySQL LONGTEXT 타입이 없으므로 TEXT로 생성
+    from sqlalchemy.dialects.mysql import LONGTEXT
+    from sqlalchemy.ext.compiler import compiles
+
+    @compiles(LONGTEXT, "sqlite")
+    def _longtext_sqlite(type_, compiler, **kw):
+        return "TEXT"
+
+
+def install_stand_ins() -> None:
+    """임베딩/LLM을 네트워크 없이 동작하는 결정적 구현으로 교체합니다."""
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+    from langchain_core.language_models import FakeListChatModel
+
+    from backend.rag import embeddings, tools
+
+    embeddings._EMBEDDINGS_CACHE = DeterministicFakeEmbedding(size=EMBEDDING_DIMENSION)
+    llm = FakeListChatModel(responses=["1"])
+    tools.get_llm = lambda: llm
+
+
+def _make_item(rng: random.Random, major: str, departments: list[str], schools: list[str]) -> dict:
+    """major_detail.json 항목 하나와 같은 구조의 합성 데이터"""
+    university = [
+        {
+            "schoolName": school,
+            "majorName": rng.choice(departments) if departments else major,
+            "campus_nm": "본교",
+            "area": rng.choice(["서울특별시", "부산광역시", "경기도", "강원도"]),
+            "schoolURL": f"https://www.univ{rng.randint(1, 400)}.ac.kr",
+            "totalCount": str(rng.randint(10, 300)),
+        }
+        for school in rng.sample(schools, min(len(schools), rng.randint(5, 40)))
+    ]
+    content = {
+        "major": major,
+        "department": ", ".join(departments[:10]),
+        "summary": SENTENCE * 3,
+        "interest": SENTENCE,
+        "property": SENTENCE,
+        "job": ", ".join(rng.sample(JOBS, 4)),
+        "employment": f"<strong>{rng.randint(40, 90)}</strong>%",
+        "salary": str(rng.randint(180, 400)),
+        "qualifications": ", ".join(rng.sample(CERTS, 3)),
+        "relate_subject": [
+            {"subject_name": "일반선택", "subject_description": ", ".join(rng.sample(SUBJECTS, 4))}
+        ],
+        "enter_field": [
+            {"gradeuate": name, "description": SENTENCE * 2}
+            for name in ("기업 및 산업체", "연구소", "공공기관")
+        ],
+        "career_act": [{"act_name": "학과 체험", "act_description": SENTENCE * 2}],
+        "main_subject": [
+            {"SBJECT_NM": s, "SBJECT_SUMRY": SENTENCE} for s in rng.sample(SUBJECTS, 4)
+        ],
+        "university": university,
+        "chartData": [
+            {
+                "employment_rate": [{"item": "전체", "data": f"{rng.uniform(40, 90):.1f}"}],
+                "applicant": [
+                    {"item": "지원자", "data": str(rng.randint(100, 5000))},
+                    {"item": "입학자", "data": str(rng.randint(10, 500))},
+                ],
+                "gender": [{"item": "남", "data": "55"}, {"item": "여", "data": "45"}],
+                "satisfaction": [{"item": "만족", "data": f"{rng.uniform(20, 60):.1f}"}],
+            }
+        ],
+    }
+    return {"dataSearch": {"content": [content]}}
+
+
+def _write_major_detail(path: Path, seed: int) -> int:
+    with open(DATA_DIR / "major_categories.json", "r", encoding="utf-8") as f:
+        categories = json.load(f)
+    with open(DATA_DIR / "university_data_cleaned.json", "r", encoding="utf-8") as f:
+        schools = list(json.load(f))
+
+    rng = random.Random(seed)
+    items = [
+        _make_item(rng, major, departments, schools)
+        for major, departments in categories.items()
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(items, f, ensure_ascii=False)
+    return len(items)
+
+
+def _embed_records(texts: list[str], ids: list[str], metadatas: list[dict]) -> list[dict[str, Any]]:
+    from backend.rag.embeddings import get_embeddings
+
+    vectors = get_embeddings().embed_documents(texts)
+    return [
+        {"id": doc_id, "values": vector, "metadata": {**meta, "text": text}}
+        for doc_id, vector, meta, text in zip(ids, vectors, metadatas, texts)
+    ]
+
+
+def build_fixture(workdir: Path, seed: int = 0) -> dict[str, int]:
+    """
+    SQLite DB와 벡터 스냅샷을 새로 만들고 테이블/네임스페이스별 건수를 반환합니다.
+    prepare_environment()와 install_stand_ins() 이후에 호출합니다.
+    """
+    from backend.db.connection import Base, engine
+    from backend.db.seed_categories import seed_categories
+    from backend.db.seed_majors import seed_majors
+    from backend.db.seed_universities import seed_universities
+    from backend.rag.loader import (
+        build_all_major_docs,
+        build_university_major_docs,
+        collapse_university_major_docs,
+        load_major_detail,
+    )
+    from backend.rag.snapshot import write_snapshot
+    from backend.rag.vectorstore import _get_major_namespace, major_doc_metadata
+
+    detail_path = workdir / "major_detail.json"
+    counts = {"majors_source": _write_major_detail(detail_path, seed)}
+
+    # 시딩 스크립트의 진행 로그는 숨김
+    with contextlib.redirect_stdout(io.StringIO()):
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        counts["major_categories"] = seed_categories().total
+        counts["universities"] = seed_universities().total
+        counts["majors"] = seed_majors(detail_path, workers=0)["succeeded"]
+        records = load_major_detail()
+
+    major_docs = build_all_major_docs(records)
+    univ_docs, _ = collapse_university_major_docs(
+        [doc for record in records for doc in build_university_major_docs(record)]
+    )
+    univ_meta = [
+        {
+            "major_id": doc.major_id,
+            "university": doc.university,
+            "department": doc.department,
+            "major_name": doc.major_name,
+            "major_names": doc.major_names or [doc.major_name],
+            "doc_type": "university_major",
+        }
+        for doc in univ_docs
+    ]
+    category_names = [record.major_name for record in records]
+
+    namespaces = {
+        _get_major_namespace() or "": _embed_records(
+            [doc.text for doc in major_docs],
+            [doc.doc_id for doc in major_docs],
+            [major_doc_metadata(doc) for doc in major_docs],
+        ),
+        "university_majors": _embed_records(
+            [doc.text for doc in univ_docs], [doc.doc_id for doc in univ_docs], univ_meta
+        ),
+        "major_categories": _embed_records(
+            category_names,
+            [f"category-{i}" for i in range(len(category_names))],
+            [{"major_name": name, "doc_type": "category"} for name in category_names],
+        ),
+    }
+    snapshot_root = Path(os.environ["VECTOR_SNAPSHOT_PATH"])
+    if (snapshot_root / SNAPSHOT_VERSION).exists():
+        shutil.rmtree(snapshot_root / SNAPSHOT_VERSION)
+    write_snapshot(namespaces, EMBEDDING_DIMENSION, out_root=snapshot_root, version=SNAPSHOT_VERSION)
+
+    counts.update({f"vectors:{name or 'default'}": len(rows) for name, rows in namespaces.items()})
+    return counts
@@ -0,0 +1,215 @@
+"""
+backend/rag/tools.py 툴 지연 시간/메모리 할당 벤치마크 (오프라인)
+
+tool_fixture.py로 SQLite DB + 로컬 벡터 스냅샷 + 가짜 임베딩/LLM을 준비한 뒤
+툴(및 _find_majors)을 시나리오별로 반복 실행하여 다음을 보고합니다.
+- p50 / p95 / p99 지연 시간 (ms)
+- 호출당 최대 할당량(peak KiB, tracemalloc)과 호출 후 남은 할당량(retained KiB)
+
+네트워크 없이 동작하므로 _find_majors, get_universities_by_department 등의 회귀를 로컬/CI에서 확인할 수 있습니다.
+(임베딩이 해시 기반이라 검색 결과의 품질은 의미가 없고, 코드 경로와 비용만 측정합니다)
+
+실행:
+    python -m benchmarks.tool_latency
+    python -m benchmarks.tool_latency --iterations 200 --save baseline.json
+    python -m benchmarks.tool_latency --compare baseline.json --tolerance 1.3   # p95가 기준의 1.3배를 넘으면 exit 1
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.tool_fixture import (
+    DATA_DIR,
+    build_fixture,
+    install_stand_ins,
+    prepare_environment,
+)
+
+
+@dataclass
+class Scenario:
+    name: str
+    func: Callable[[], Any]
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def build_scenarios() -> list[Scenario]:
+    """픽스처 데이터(backend/data)에서 결정적으로 고른 입력으로 시나리오를 만듭니다."""
+    from backend.rag import tools
+
+    with open(DATA_DIR / "major_categories.json", "r", encoding="utf-8") as f:
+        categories = json.load(f)
+    with open(DATA_DIR / "university_data_cleaned.json", "r", encoding="utf-8") as f:
+        universities = list(json.load(f))
+
+    majors = sorted(categories)
+    major = majors[len(majors) // 2]
+    department = categories[major][0] if categories[major] else major
+    university = universities[0]
+
+    return [
+        Scenario("list_departments(all)", lambda: tools.list_departments.invoke({"query": ""})),
+        Scenario(
+            "list_departments(category)",
+            lambda: tools.list_departments.invoke({"query": major}),
+        ),
+        Scenario(
+            "list_departments(keyword)",
+            lambda: tools.list_departments.invoke({"query": "컴퓨터"}),
+        ),
+        Scenario("_find_majors(name)", lambda: tools._find_majors(major)),
+        Scenario("_find_majors(miss)", lambda: tools._find_majors("없는학과명")),
+        Scenario(
+            "get_major_career_info",
+            lambda: tools.get_major_career_info.invoke({"major_name": major}),
+        ),
+        Scenario(
+            "get_universities_by_department",
+            lambda: tools.get_universities_by_department.invoke({"department_name": department}),
+        ),
+        Scenario(
+            "get_university_admission_info",
+            lambda: tools.get_university_admission_info.invoke({"university_name": university}),
+        ),
+        Scenario("get_search_help", lambda: tools.get_search_help.invoke({})),
+    ]
+
+
+def measure(scenario: Scenario, iterations: int, warmup: int, alloc_iterations: int) -> dict[str, float]:
+    """시나리오 하나의 지연 시간 분포와 할당량을 측정합니다. (툴 로그 출력은 숨김)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            scenario.func()
+
+        latencies = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            scenario.func()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        # tracemalloc은 실행을 느리게 하므로 지연 시간 측정과 분리
+        peaks = []
+        retained = []
+        tracemalloc.start()
+        try:
+            for _ in range(alloc_iterations):
+                before, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                scenario.func()
+                after, peak = tracemalloc.get_traced_memory()
+                peaks.append((peak - before) / 1024)
+                retained.append((after - before) / 1024)
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "iterations": iterations,
+        "p50_ms": _percentile(latencies, 0.50),
+        "p95_ms": _percentile(latencies, 0.95),
+        "p99_ms": _percentile(latencies, 0.99),
+        "mean_ms": statistics.mean(latencies),
+        "peak_kib": statistics.mean(peaks) if peaks else 0.0,
+        "retained_kib": statistics.mean(retained) if retained else 0.0,
+    }
+
+
+def print_report(results: dict[str, dict[str, float]], baseline: dict[str, Any] | None) -> None:
+    width = max(len(name) for name in results)
+    header = f"{'scenario':<{width}}  {'p50':>8} {'p95':>8} {'p99':>8}  {'peak KiB':>9} {'kept KiB':>9}"
+    if baseline:
+        header += f"  {'p95 vs base':>11}"
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        line = (
+            f"{name:<{width}}  {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f}"
+            f"  {r['peak_kib']:>9.1f} {r['retained_kib']:>9.1f}"
+        )
+        if baseline and name in baseline:
+            line += f"  {r['p95_ms'] / baseline[name]['p95_ms']:>10.2f}x"
+        print(line)
+    print("(latency in ms)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=50, help="시나리오별 측정 횟수")
+    parser.add_argument("--warmup", type=int, default=3, help="측정 전 워밍업 횟수")
+    parser.add_argument("--alloc-iterations", type=int, default=5, help="tracemalloc 측정 횟수")
+    parser.add_argument("--only", nargs="+", help="이름에 해당 문자열이 포함된 시나리오만 실행")
+    parser.add_argument("--workdir", type=Path, help="픽스처 디렉토리 (기본값: 임시 디렉토리)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 시드")
+    parser.add_argument("--save", type=Path, help="결과를 JSON으로 저장")
+    parser.add_argument("--compare", type=Path, help="기준 결과(JSON)와 p95 비교")
+    parser.add_argument(
+        "--tolerance", type=float, default=1.5, help="--compare 시 허용하는 p95 배율"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="unigo-bench-") as tmp:
+        workdir = args.workdir or Path(tmp)
+        prepare_environment(workdir)
+        install_stand_ins()
+
+        started = time.perf_counter()
+        counts = build_fixture(workdir, seed=args.seed)
+        print(
+            f"fixture: {', '.join(f'{k}={v}' for k, v in counts.items())} "
+            f"({time.perf_counter() - started:.1f}s)\n"
+        )
+
+        scenarios = build_scenarios()
+        if args.only:
+            scenarios = [s for s in scenarios if any(key in s.name for key in args.only)]
+
+        results = {
+            scenario.name: measure(
+                scenario, args.iterations, args.warmup, args.alloc_iterations
+            )
+            for scenario in scenarios
+        }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    print_report(results, baseline)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(
+                {"iterations": args.iterations, "seed": args.seed, "results": results},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        print(f"\nSaved results to {args.save}")
+
+    if baseline:
+        regressions = [
+            name
+            for name, r in results.items()
+            if name in baseline and r["p95_ms"] > baseline[name]["p95_ms"] * args.tolerance
+        ]
+        if regressions:
+            print(f"\n❌ p95 regression (> {args.tolerance}x): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""
+gunicorn 설정 파일
+
+gunicorn은 실행 디렉토리의 ./gunicorn.conf.py를 자동으로 읽습니다.
+(Dockerfile/docker-compose의 `gunicorn unigo.wsgi:application`은 unigo/에서 실행되므로 별도 옵션 불필요)
+bind, workers 등은 기존처럼 명령행 옵션으로 지정합니다.
+
+post_worker_init: Django 앱을 로드한 뒤, 워커가 요청을 받기 전에 backend.warmup.run_warmup()을 실행합니다.
+워밍업 중에도 단계마다 worker.notify()를 호출하므로 --timeout에 걸려 워커가 재시작되지 않습니다.
+(post_fork는 앱 로드 전에 실행되어 Django 설정/백엔드를 쓸 수 없으므로 post_worker_init을 사용)
+"""
+
+
+def post_worker_init(worker):
+    try:
+        from backend import warmup
+        from backend.config import get_settings
+    except ImportError as e:
+        worker.log.warning(f"Warm-up skipped (backend import failed): {e}")
+        return
+
+    if not get_settings().warmup_on_boot:
+        warmup.mark_disabled()
+        return
+
+    def on_step(step):
+        worker.notify()
+        timing = f" {step['duration_ms']}ms" if "duration_ms" in step else ""
+        detail = step.get("detail") or step.get("error") or ""
+        worker.log.info(f"Warm-up {step['name']}: {step['status']}{timing} {detail}".rstrip())
+
+    worker.log.info(f"Warm-up started (pid {worker.pid})")
+    status = warmup.run_warmup(on_step=on_step)
+    worker.log.info(f"Warm-up {status['status']} in {status['duration_ms']}ms (pid {worker.pid})")
@@ -42,6 +42,9 @@ markedOptions.renderer.link = function(href, title, text) {
 // APIs
 const API_CHAT_URL = '/api/chat';
 const API_ONBOARDING_URL = '/api/onboarding';
+const API_CHAT_RESUME_URL = '/api/chat/resume';
+const STREAM_RESUME_MAX_RETRIES = 3;
+const STREAM_RESUME_BASE_DELAY_MS = 500;
 
 // Onboarding Questions Definition
 const ONBOARDING_QUESTIONS = [
@@ -519,6 +522,88 @@ const restoreResultPanel = () => {
     sessionStorage.setItem(STORAGE_KEY_RESULT_PANEL, defaultHtml);
 };
 
+// -- SSE Stream Parser --
+
+// 스트리밍 중인 답변 말풍선 렌더링
+// 서버가 보낸 완성 블록(state.blocks)은 그대로 두고, 아직 열려 있는 마지막 부분만 marked로 다시 렌더링
+const renderStreamingBubble = (aiBubble, state) => {
+    let blocksEl = aiBubble.querySelector(':scope > .md-blocks');
+    if (!blocksEl) {
+        // 첫 렌더링이거나 상태 메시지(스피너)로 교체된 경우 구조를 다시 만듦
+        aiBubble.innerHTML = '<div class="md-blocks"></div><div class="md-open"></div>';
+        blocksEl = aiBubble.firstElementChild;
+        blocksEl.innerHTML = state.blocks.join('');
+    }
+    aiBubble.lastElementChild.innerHTML = marked.parse(state.finalResponse.slice(state.blockEnd), markedOptions);
+};
+
+// SSE 응답 하나를 끝까지 읽으면서 말풍선을 갱신합니다.
+// state.lastEventId: 마지막으로 받은 이벤트 ID (재연결 시 Last-Event-ID로 전송)
+// state.done: 서버가 완료(done) 이벤트를 보냈는지 여부
+const consumeEventStream = async (response, aiBubble, state) => {
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+
+        buffer += value;
+        let boundary = buffer.indexOf('\n\n');
+
+        while (boundary !== -1) {
+            const chunk = buffer.substring(0, boundary);
+            buffer = buffer.substring(boundary + 2);
+
+            let eventId = null;
+            let jsonString = null;
+            for (const line of chunk.split('\n')) {
+                if (line.startsWith('id: ')) eventId = line.substring(4);
+                else if (line.startsWith('data: ')) jsonString = line.substring(6);
+                // ':' 로 시작하는 keep-alive 주석은 무시
+            }
+
+            if (jsonString !== null) {
+                try {
+                    const data = JSON.parse(jsonString);
+
+                    if (data.type === 'status') {
+                        // 상태 메시지도 스피너와 함께 표시
+                        aiBubble.innerHTML = createSpinner(data.content);
+                    } else if (data.type === 'delta') {
+                        state.finalResponse += data.content;
+                        renderStreamingBubble(aiBubble, state);
+                    } else if (data.type === 'block') {
+                        // 서버에서 렌더링된 완성 블록: 순서대로 도착한 경우에만 반영
+                        if (data.index === state.blocks.length) {
+                            state.blocks.push(data.html);
+                            state.blockEnd = data.end;
+                            const blocksEl = aiBubble.querySelector(':scope > .md-blocks');
+                            if (blocksEl) blocksEl.insertAdjacentHTML('beforeend', data.html);
+                            renderStreamingBubble(aiBubble, state);
+                        }
+                    } else if (data.type === 'content') {
+                        state.finalResponse = data.content;
+                        state.blocks = [];
+                        state.blockEnd = 0;
+                        aiBubble.innerHTML = marked.parse(state.finalResponse);
+                    } else if (data.type === 'error') {
+                        state.finalResponse = data.content;
+                        aiBubble.innerHTML = `<span style="color:red;">${data.content}</span>`;
+                    } else if (data.type === 'done') {
+                        state.done = true;
+                    }
+                    if (eventId) state.lastEventId = eventId;
+                } catch (e) {
+                    console.error('Failed to parse JSON chunk:', jsonString, e);
+                }
+            }
+            boundary = buffer.indexOf('\n\n');
+        }
+        chatCanvas.scrollTop = chatCanvas.scrollHeight;
+    }
+};
+
 // -- Main Chat Logic (STREAMING) --
 
 const handleChatInput = async (text) => {
@@ -552,60 +637,54 @@ const handleChatInput = async (text) => {
             console.log('Conversation started with ID:', currentConversationId);
         }
 
+        const turnId = response.headers.get('X-Turn-Id');
+        const sessionId = response.headers.get('X-Session-Id');
+
+        if (response.status === 429) {
+            // 서버 LLM 대기열 초과: 서버가 보낸 안내 메시지 표시
+            const err = await response.json().catch(() => ({}));
+            throw Object.assign(new Error('Too many requests'), { userMessage: err.error });
+        }
         if (!response.ok) throw new Error(`Network error: ${response.statusText}`);
         if (!response.body) throw new Error("No response body");
 
-        // 4. Read the stream
-        const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
-        let buffer = '';
-        let isFirstContent = true; // 첫 컨텐츠 수신 시 스피너 제거용
+        // 4. Read the stream (연결이 끊기면 Last-Event-ID로 이어받기)
+        const streamState = { finalResponse: "", lastEventId: null, done: false, blocks: [], blockEnd: 0 };
+        let streamResponse = response;
+        let attempt = 0;
 
         while (true) {
-            const { value, done } = await reader.read();
-            if (done) break;
-
-            buffer += value;
-            let boundary = buffer.indexOf('\n\n');
-
-            while (boundary !== -1) {
-                const chunk = buffer.substring(0, boundary);
-                buffer = buffer.substring(boundary + 2);
-
-                if (chunk.startsWith('data: ')) {
-                    const jsonString = chunk.substring(6);
-                    try {
-                        const data = JSON.parse(jsonString);
-
-                        if (data.type === 'status') {
-                            // 상태 메시지도 스피너와 함께 표시
-                            aiBubble.innerHTML = createSpinner(data.content);
-                        } else if (data.type === 'delta') {
-                            // 첫 델타 수신 시 스피너 제거
-                            if (isFirstContent) {
-                                isFirstContent = false;
-                            }
-                            finalResponse += data.content;
-                            aiBubble.innerHTML = marked.parse(finalResponse, markedOptions);
-                        } else if (data.type === 'content') {
-                            finalResponse = data.content;
-                            aiBubble.innerHTML = marked.parse(finalResponse);
-
-                        } else if (data.type === 'error') {
-                            finalResponse = data.content;
-                            aiBubble.innerHTML = `<span style="color:red;">${data.content}</span>`;
-                        }
-                    } catch (e) {
-                        console.error('Failed to parse JSON chunk:', jsonString, e);
-                    }
-                }
-                boundary = buffer.indexOf('\n\n');
+            try {
+                if (streamResponse) await consumeEventStream(streamResponse, aiBubble, streamState);
+            } catch (e) {
+                console.warn('Chat stream interrupted:', e);
             }
-            chatCanvas.scrollTop = chatCanvas.scrollHeight;
+            if (streamState.done || !turnId || attempt >= STREAM_RESUME_MAX_RETRIES) break;
+
+            // 재연결 (지수 백오프)
+            attempt += 1;
+            await new Promise(r => setTimeout(r, STREAM_RESUME_BASE_DELAY_MS * 2 ** (attempt - 1)));
+            const params = new URLSearchParams();
+            if (sessionId) params.set('session_id', sessionId);
+            try {
+                streamResponse = await fetch(`${API_CHAT_RESUME_URL}?${params}`, {
+                    headers: { 'Last-Event-ID': streamState.lastEventId || `${turnId}-0` }
+                });
+            } catch (e) {
+                console.warn('Chat stream resume failed:', e);
+                streamResponse = null;
+                continue;
+            }
+            if (streamResponse.status === 404) break;
+            if (!streamResponse.ok || !streamResponse.body) streamResponse = null;
         }
 
+        finalResponse = streamState.finalResponse;
+        if (!streamState.done && !finalResponse) throw new Error("Stream ended before completion");
+
     } catch (error) {
         console.error('Chat stream failed:', error);
-        finalResponse = "오류가 발생했습니다.";
+        finalResponse = error.userMessage || "오류가 발생했습니다.";
         aiBubble.innerHTML = `<span style="color:red;">${finalResponse}</span>`;
     }
 
@@ -187,9 +187,39 @@ LOGGING = {
             "level": "DEBUG",
             "propagate": False,
         },
+        # backend 패키지(툴, 검색 등)의 로그 (BACKEND_LOG_SAMPLE_RATE로 INFO 이하 샘플링)
+        "backend": {
+            "handlers": ["file"],
+            "level": os.getenv("BACKEND_LOG_LEVEL", "INFO"),
+            "propagate": False,
+        },
+        # DEBUG로 설정하면 (DJANGO_DEBUG=True일 때) Django ORM의 모든 SQL을 기록
         "django.db.backends": {
             "handlers": ["file"],
-            "level": "DEBUG",
+            "level": os.getenv("DJANGO_SQL_LOG_LEVEL", "INFO"),
         },
     },
 }
+
+# 위 로거들의 파일 기록은 백그라운드 스레드에서 수행 (unigo_app.apps에서 QueueListener로 전환)
+LOG_QUEUE_LOGGERS = ["django", "unigo_app", "backend", "django.db.backends"]
+
+# Chat SSE Streaming
+# 토큰 delta를 묶어서 전송하는 시간 창(ms)과 최대 버퍼 크기(bytes). 0ms면 토큰마다 즉시 전송
+CHAT_STREAM_COALESCE_MS = int(os.getenv("CHAT_STREAM_COALESCE_MS", "40"))
+CHAT_STREAM_COALESCE_BYTES = int(os.getenv("CHAT_STREAM_COALESCE_BYTES", "2048"))
+# 연결이 끊긴 스트림을 Last-Event-ID로 이어받기 위한 replay 버퍼 설정 (프로세스 내 메모리)
+CHAT_STREAM_REPLAY_RUNS = int(os.getenv("CHAT_STREAM_REPLAY_RUNS", "200"))
+CHAT_STREAM_REPLAY_EVENTS = int(os.getenv("CHAT_STREAM_REPLAY_EVENTS", "2000"))
+CHAT_STREAM_REPLAY_TTL = int(os.getenv("CHAT_STREAM_REPLAY_TTL", "300"))
+CHAT_STREAM_KEEPALIVE = float(os.getenv("CHAT_STREAM_KEEPALIVE", "15"))
+# 클라이언트 연결이 모두 끊긴 뒤 재연결을 기다리는 시간 (초과 시 LLM 생성/툴 실행 취소)
+CHAT_STREAM_CANCEL_GRACE = float(os.getenv("CHAT_STREAM_CANCEL_GRACE", "10"))
+# 완성된 마크다운 블록을 서버에서 HTML로 렌더링하여 전송 (markdown 패키지 필요, 없으면 자동 비활성화)
+CHAT_STREAM_MARKDOWN_BLOCKS = os.getenv("CHAT_STREAM_MARKDOWN_BLOCKS", "True") == "True"
+
+# 운영 지표 (/metrics, Prometheus 텍스트 형식)
+# 기본값은 DEBUG일 때만 활성화 (운영 환경에서는 METRICS_ENABLED=True + METRICS_TOKEN으로 명시적으로 켬)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", str(DEBUG)) == "True"
+# 설정 시 Authorization: Bearer <token> 헤더가 일치하는 요청만 허용
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
@@ -1,4 +1,9 @@
+import csv
+
 from django.contrib import admin
+from django.db.models import Count, F
+from django.http import HttpResponse
+
 from .models import (
     Conversation,
     Message,
@@ -19,8 +24,29 @@ class MessageInline(admin.TabularInline):
 
     model = Message
     extra = 0
-    readonly_fields = ("created_at",)
-    fields = ("role", "content", "created_at")
+    readonly_fields = ("created_at", "metadata")
+    fields = ("role", "content", "metadata", "created_at")
+
+
+# CSV 내보내기 컬럼: (헤더, 값 함수)
+USAGE_EXPORT_COLUMNS = [
+    ("conversation_id", lambda c: c.id),
+    ("user", lambda c: c.user.username if c.user else f"guest:{c.session_id[:8]}"),
+    ("title", lambda c: c.title),
+    ("created_at", lambda c: c.created_at.isoformat()),
+    ("messages", lambda c: c.message_total),
+    ("usage_turns", lambda c: c.usage_turns),
+    ("llm_calls", lambda c: c.total_llm_calls),
+    ("tool_calls", lambda c: c.total_tool_calls),
+    ("input_tokens", lambda c: c.total_input_tokens),
+    ("output_tokens", lambda c: c.total_output_tokens),
+    ("total_tokens", lambda c: c.total_tokens),
+    (
+        "tokens_per_turn",
+        lambda c: round(c.total_tokens / c.usage_turns, 1) if c.usage_turns else 0,
+    ),
+    ("cost_usd", lambda c: c.total_cost_usd),
+]
 
 
 @admin.register(Conversation)
@@ -30,13 +56,38 @@ class ConversationAdmin(admin.ModelAdmin):
         "get_user_display",
         "title",
         "message_count",
+        "usage_turns",
+        "total_tool_calls",
+        "get_total_tokens",
+        "get_tokens_per_turn",
+        "total_cost_usd",
         "created_at",
         "updated_at",
     )
     list_filter = ("created_at", "updated_at")
     search_fields = ("title", "session_id", "user__username")
-    readonly_fields = ("created_at", "updated_at", "session_id")
+    readonly_fields = (
+        "created_at",
+        "updated_at",
+        "session_id",
+        "usage_turns",
+        "total_input_tokens",
+        "total_output_tokens",
+        "total_llm_calls",
+        "total_tool_calls",
+        "total_cost_usd",
+    )
     inlines = [MessageInline]
+    actions = ["export_usage_csv"]
+
+    def get_queryset(self, request):
+        # 목록의 메시지 수를 행마다 COUNT 쿼리로 세지 않도록 미리 집계
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("user")
+            .annotate(message_total=Count("messages"))
+        )
 
     def get_user_display(self, obj):
         if obj.user:
@@ -46,14 +97,53 @@ class ConversationAdmin(admin.ModelAdmin):
     get_user_display.short_description = "User"
 
     def message_count(self, obj):
-        return obj.get_message_count()
+        return obj.message_total
 
     message_count.short_description = "Messages"
+    message_count.admin_order_field = "message_total"
+
+    def get_total_tokens(self, obj):
+        return obj.total_tokens
+
+    get_total_tokens.short_description = "Tokens"
+    get_total_tokens.admin_order_field = F("total_input_tokens") + F("total_output_tokens")
+
+    def get_tokens_per_turn(self, obj):
+        if not obj.usage_turns:
+            return "-"
+        return round(obj.total_tokens / obj.usage_turns)
+
+    get_tokens_per_turn.short_description = "Tokens/turn"
+
+    @admin.action(description="선택한 대화의 토큰 사용량을 CSV로 내보내기")
+    def export_usage_csv(self, request, queryset):
+        response = HttpResponse(content_type="text/csv; charset=utf-8")
+        response["Content-Disposition"] = 'attachment; filename="conversation_usage.csv"'
+        # 엑셀에서 한글이 깨지지 않도록 BOM 추가
+        response.write("\ufeff")
+        writer = csv.writer(response)
+        writer.writerow([header for header, _ in USAGE_EXPORT_COLUMNS])
+        ordered = queryset.order_by(
+            (F("total_input_tokens") + F("total_output_tokens")).desc()
+        )
+        for conversation in ordered:
+            writer.writerow([value(conversation) for _, value in USAGE_EXPORT_COLUMNS])
+        return response
 
 
 @admin.register(Message)
 class MessageAdmin(admin.ModelAdmin):
-    list_display = ("id", "conversation", "role", "content_preview", "created_at")
+    list_display = (
+        "id",
+        "conversation",
+        "role",
+        "content_preview",
+        "input_tokens",
+        "output_tokens",
+        "tool_calls",
+        "latency_ms",
+        "created_at",
+    )
     list_filter = ("role", "created_at")
     search_fields = ("content", "conversation__title")
     readonly_fields = ("created_at",)
@@ -63,6 +153,27 @@ class MessageAdmin(admin.ModelAdmin):
 
     content_preview.short_description = "Content"
 
+    def _usage(self, obj, key):
+        usage = (obj.metadata or {}).get("usage") or {}
+        return usage.get(key, "-")
+
+    def input_tokens(self, obj):
+        return self._usage(obj, "input_tokens")
+
+    def output_tokens(self, obj):
+        return self._usage(obj, "output_tokens")
+
+    def tool_calls(self, obj):
+        return self._usage(obj, "tool_calls")
+
+    def latency_ms(self, obj):
+        return self._usage(obj, "latency_ms")
+
+    input_tokens.short_description = "In tokens"
+    output_tokens.short_description = "Out tokens"
+    tool_calls.short_description = "Tools"
+    latency_ms.short_description = "Latency (ms)"
+
 
 @admin.register(MajorRecommendation)
 class MajorRecommendationAdmin(admin.ModelAdmin):
@@ -1,5 +1,25 @@
+import sys
+from pathlib import Path
+
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class UnigoAppConfig(AppConfig):
     name = 'unigo_app'
+
+    def ready(self):
+        # 로그 파일 기록을 요청 처리 스레드에서 분리 (LOGGING의 핸들러를 백그라운드 QueueListener로 이동)
+        project_root = str(Path(__file__).resolve().parents[2])
+        if project_root not in sys.path:
+            sys.path.append(project_root)
+        try:
+            from backend.config import get_settings
+            from backend.log_pipeline import install_queue_logging
+        except ImportError:
+            return
+
+        install_queue_logging(
+            settings.LOG_QUEUE_LOGGERS,
+            sample_rates={"backend": get_settings().backend_log_sample_rate},
+        )
@@ -0,0 +1,45 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "워커 워밍업 단계(그래프 컴파일, LLM, 임베딩, 카테고리, 벡터 핸들, 검색 질의)를 실행하고 단계별 결과를 출력합니다. "
+        "gunicorn post_worker_init 훅과 같은 단계를 별도 프로세스에서 실행하므로 배포 전 점검용입니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--skip",
+            nargs="+",
+            default=None,
+            help="건너뛸 단계 (기본값: WARMUP_SKIP 설정)",
+        )
+        parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+
+    def handle(self, *args, **options):
+        try:
+            from backend import warmup
+        except ImportError as e:
+            raise CommandError(f"Backend import failed: {e}")
+
+        def on_step(step):
+            if options["json"]:
+                return
+            if step["status"] == "skipped":
+                self.stdout.write(f"  - {step['name']:<13} skipped")
+                return
+            line = f"  {step['name']:<15} {step['duration_ms']:>9.1f}ms  {step.get('detail') or step.get('error', '')}"
+            style = {"ok": self.style.SUCCESS, "warning": self.style.WARNING}.get(step["status"], self.style.ERROR)
+            self.stdout.write(style(line))
+
+        status = warmup.run_warmup(skip=options["skip"], on_step=on_step)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(status, ensure_ascii=False, indent=2))
+        else:
+            self.stdout.write(f"Warm-up {status['status']} in {status['duration_ms']}ms")
+
+        if status["status"] != "ready":
+            raise CommandError("Warm-up failed")
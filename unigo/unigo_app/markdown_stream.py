@@ -0,0 +1,151 @@
+"""
+스트리밍 답변의 증분(incremental) 마크다운 렌더링
+
+chat.js가 delta를 받을 때마다 누적된 답변 전체를 marked.parse()로 다시 렌더링하면
+답변 길이에 대해 O(n²) 비용이 들어 긴 답변에서 저사양 기기가 버벅입니다.
+이 모듈은 누적 텍스트에서 "더 이상 바뀌지 않는" 마크다운 블록을 찾아 서버에서 HTML로 미리 렌더링합니다.
+클라이언트는 완성된 블록은 그대로 붙이고, 아직 열려 있는 마지막 블록만 다시 렌더링합니다.
+
+** 블록 완성 기준 **
+- 코드 펜스(```, ~~~) 밖의 빈 줄 다음에, 이전 블록을 이어가지 않는 새 줄이 시작되었을 때
+  - 들여쓰기로 시작하는 줄, 목록 다음의 목록 항목은 이전 블록의 연속으로 봅니다.
+- 스트림이 끝나면 남은 텍스트 전체를 마지막 블록으로 렌더링합니다 (finish)
+
+`markdown` 패키지는 선택 의존성입니다. 설치되어 있지 않으면 is_available()이 False를 반환하고
+views는 기존처럼 delta만 전송합니다.
+"""
+
+import re
+
+try:
+    import markdown
+except ImportError:
+    markdown = None
+
+# marked(gfm: true, breaks: true) 설정과 최대한 같은 결과를 내도록 확장 선택
+MARKDOWN_EXTENSIONS = ["tables", "fenced_code", "nl2br", "sane_lists"]
+
+_LIST_ITEM_RE = re.compile(r"^\s*([-*+]|\d+[.)])\s")
+# 아직 줄이 다 오지 않아 목록 기호인지 판단할 수 없는 상태 (예: "1", "-", "12.")
+_UNDECIDED_PREFIX_RE = re.compile(r"^\s*(\d+[.)]?|[-*+])?$")
+_FENCE_PREFIXES = ("```", "~~~")
+_LINK_RE = re.compile(r"<a href=")
+
+
+def is_available() -> bool:
+    return markdown is not None
+
+
+def _utf16_len(text: str) -> int:
+    # JavaScript 문자열 인덱스(UTF-16 code unit)와 맞추기 위한 길이 (이모지는 2로 계산)
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _continues(first_line: str, line: str) -> bool:
+    """빈 줄 다음의 line이 first_line으로 시작한 블록을 이어가는지 여부"""
+    if line[:1] in (" ", "\t"):
+        return True
+    return bool(_LIST_ITEM_RE.match(first_line) and _LIST_ITEM_RE.match(line))
+
+
+def find_block_end(text: str, start: int = 0) -> int | None:
+    """
+    text[start:]에서 첫 번째 완성된 블록의 끝 위치(뒤따르는 빈 줄 포함)를 반환합니다.
+    아직 완성된 블록이 없으면 None.
+    """
+    in_fence = False
+    fence_marker = ""
+    first_line = None
+    blank_end = None
+    offset = start
+
+    for line in text[start:].splitlines(keepends=True):
+        line_start = offset
+        offset += len(line)
+        complete = line.endswith("\n")
+        stripped = line.strip()
+
+        if in_fence:
+            if not complete:
+                return None
+            if stripped.startswith(fence_marker):
+                in_fence = False
+            continue
+
+        if not stripped:
+            if not complete:
+                return None
+            if first_line is not None:
+                blank_end = offset
+            continue
+
+        if blank_end is not None:
+            if not complete and _UNDECIDED_PREFIX_RE.match(line):
+                return None
+            if not _continues(first_line, line):
+                return line_start
+            blank_end = None
+
+        if not complete:
+            return None
+        if first_line is None:
+            first_line = line
+        if stripped.startswith(_FENCE_PREFIXES):
+            in_fence = True
+            fence_marker = stripped[:3]
+
+    return None
+
+
+class IncrementalMarkdownRenderer:
+    """
+    delta를 받아 완성된 마크다운 블록을 {"type": "block", ...} 이벤트로 반환하는 렌더러.
+
+    이벤트 필드:
+    - index: 블록 순번 (0부터)
+    - end: 이 블록이 끝나는 위치 (누적 텍스트 기준, UTF-16 code unit)
+      → 클라이언트는 text.slice(end) 부분만 열린 블록으로 렌더링합니다.
+    - html: 렌더링된 HTML
+    """
+
+    def __init__(self):
+        self._md = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS, lazy_ol=False)
+        self._text = ""
+        self._start = 0  # 아직 완성되지 않은 블록의 시작 위치 (파이썬 문자열 인덱스)
+        self._end_utf16 = 0
+        self._index = 0
+
+    def _render(self, source: str) -> str:
+        self._md.reset()
+        html = self._md.convert(source)
+        # chat.js의 marked 렌더러와 같이 링크는 새 탭에서 열기
+        return _LINK_RE.sub('<a target="_blank" rel="noopener noreferrer" href=', html)
+
+    def _emit(self, end: int) -> dict:
+        source = self._text[self._start : end]
+        self._end_utf16 += _utf16_len(source)
+        self._start = end
+        event = {
+            "type": "block",
+            "index": self._index,
+            "end": self._end_utf16,
+            "html": self._render(source),
+        }
+        self._index += 1
+        return event
+
+    def feed(self, delta: str) -> list[dict]:
+        """delta를 추가하고 새로 완성된 블록 이벤트 목록을 반환합니다."""
+        self._text += delta
+        events = []
+        while True:
+            end = find_block_end(self._text, self._start)
+            if end is None:
+                return events
+            events.append(self._emit(end))
+
+    def finish(self) -> list[dict]:
+        """스트림 종료 시 남은 텍스트를 마지막 블록으로 반환합니다."""
+        if not self._text[self._start :].strip():
+            return []
+        return [self._emit(len(self._text))]
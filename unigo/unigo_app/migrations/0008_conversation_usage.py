@@ -0,0 +1,43 @@
+# Generated by Django 5.2.9 on 2026-10-19 07:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('unigo_app', '0007_major_majorcategory_university'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conversation',
+            name='total_cost_usd',
+            field=models.DecimalField(decimal_places=6, default=0, help_text='누적 추정 비용 (USD, LLM_*_COST_PER_1M 설정 시)', max_digits=12),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='total_input_tokens',
+            field=models.PositiveIntegerField(default=0, help_text='누적 입력(prompt) 토큰 수'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='total_llm_calls',
+            field=models.PositiveIntegerField(default=0, help_text='누적 LLM 호출 수'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='total_output_tokens',
+            field=models.PositiveIntegerField(default=0, help_text='누적 출력(completion) 토큰 수'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='total_tool_calls',
+            field=models.PositiveIntegerField(default=0, help_text='누적 툴 호출 수'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='usage_turns',
+            field=models.PositiveIntegerField(default=0, help_text='사용량이 기록된 답변(턴) 수'),
+        ),
+    ]
@@ -1,4 +1,8 @@
+from decimal import Decimal
+
 from django.db import models
+from django.db.models import F
+from django.utils import timezone
 from django.contrib.auth.models import User
 from django.db.models.signals import post_save
 from django.dispatch import receiver
@@ -37,6 +41,25 @@ class Conversation(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # LLM 사용량 누적 (assistant 메시지의 metadata["usage"] 합계)
+    usage_turns = models.PositiveIntegerField(
+        default=0, help_text="사용량이 기록된 답변(턴) 수"
+    )
+    total_input_tokens = models.PositiveIntegerField(
+        default=0, help_text="누적 입력(prompt) 토큰 수"
+    )
+    total_output_tokens = models.PositiveIntegerField(
+        default=0, help_text="누적 출력(completion) 토큰 수"
+    )
+    total_llm_calls = models.PositiveIntegerField(default=0, help_text="누적 LLM 호출 수")
+    total_tool_calls = models.PositiveIntegerField(default=0, help_text="누적 툴 호출 수")
+    total_cost_usd = models.DecimalField(
+        max_digits=12,
+        decimal_places=6,
+        default=0,
+        help_text="누적 추정 비용 (USD, LLM_*_COST_PER_1M 설정 시)",
+    )
+
     class Meta:
         ordering = ["-updated_at"]
         indexes = [
@@ -49,6 +72,29 @@ class Conversation(models.Model):
             return f"{self.user.username} - {self.title}"
         return f"Guest ({self.session_id[:8]}) - {self.title}"
 
+    @property
+    def total_tokens(self):
+        return self.total_input_tokens + self.total_output_tokens
+
+    def add_usage(self, usage):
+        """
+        답변 한 턴의 사용량(UsageTracker.summary())을 누적합니다.
+        동시에 여러 턴이 저장되어도 값이 유실되지 않도록 F() 표현식으로 DB에서 더합니다.
+        QuerySet.update()는 auto_now를 적용하지 않으므로 updated_at(최근 대화 정렬 기준)도 함께 갱신합니다.
+        """
+        now = timezone.now()
+        Conversation.objects.filter(pk=self.pk).update(
+            updated_at=now,
+            usage_turns=F("usage_turns") + 1,
+            total_input_tokens=F("total_input_tokens") + usage.get("input_tokens", 0),
+            total_output_tokens=F("total_output_tokens") + usage.get("output_tokens", 0),
+            total_llm_calls=F("total_llm_calls") + usage.get("llm_calls", 0),
+            total_tool_calls=F("total_tool_calls") + usage.get("tool_calls", 0),
+            total_cost_usd=F("total_cost_usd")
+            + Decimal(str(usage.get("cost_usd", 0))),
+        )
+        self.updated_at = now
+
     def get_message_count(self):
         """대화의 메시지 개수"""
         return self.messages.count()
@@ -0,0 +1,304 @@
+"""
+SSE(Server-Sent Events) 스트리밍 유틸리티
+
+views.stream_chat_responses에서 사용하는 프레이밍/버퍼링 로직을 모아둔 모듈입니다.
+Django에 의존하지 않는 순수 파이썬 코드로 작성하여 벤치마크 스크립트에서도 그대로 재사용합니다.
+
+** 주요 기능 **
+1. format_sse(): 페이로드를 compact JSON SSE 프레임으로 직렬화
+2. DeltaCoalescer: 토큰 단위 delta를 시간/바이트 기준으로 묶어서 전송 횟수를 줄임
+3. StreamRun / ReplayRegistry: 답변 스트림 이벤트를 버퍼링하여 재연결 시 Last-Event-ID 이후부터 replay
+4. StreamRun.attach()/detach(): 연결된 클라이언트가 없으면 grace 시간 후 생성 취소 콜백 호출
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+
+# 툴 실행 등으로 이벤트가 없을 때 연결 유지를 위해 보내는 SSE 주석 프레임
+SSE_KEEPALIVE = ": keep-alive\n\n"
+
+
+def format_sse(payload: dict, event_id: str | None = None) -> str:
+    """
+    페이로드를 SSE `data:` 프레임 문자열로 변환합니다.
+
+    - separators=(",", ":"): 불필요한 공백 제거
+    - ensure_ascii=False: 한글을 \\uXXXX(6바이트) 대신 UTF-8(3바이트) 그대로 전송
+      (JSON 문자열 내부의 줄바꿈은 \\n으로 이스케이프되므로 SSE 프레임이 깨지지 않음)
+    """
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    if event_id:
+        return f"id: {event_id}\ndata: {data}\n\n"
+    return f"data: {data}\n\n"
+
+
+def parse_event_id(value: str | None) -> tuple[int | None, int]:
+    """
+    "{turn_id}-{seq}" 형태의 SSE 이벤트 ID를 (turn_id, seq)로 분리합니다.
+    형식이 잘못된 경우 (None, 0)을 반환합니다.
+    """
+    turn, _, seq = (value or "").strip().partition("-")
+    try:
+        return int(turn), int(seq or 0)
+    except ValueError:
+        return None, 0
+
+
+class DeltaCoalescer:
+    """
+    LLM 토큰 delta를 일정 시간(window_ms) 또는 크기(max_bytes) 단위로 모아서 내보내는 버퍼.
+
+    토큰마다 SSE 프레임을 하나씩 보내면 gunicorn/nginx를 거치는 write 호출이 답변 하나당
+    수천 번 발생합니다. 이 버퍼는 delta를 모았다가 한 번에 내보내 write 횟수와 프레임
+    오버헤드를 줄입니다.
+
+    ** 동작 규칙 **
+    - 첫 delta는 버퍼링 없이 즉시 반환 (Time To First Token 유지)
+    - 이후 delta는 마지막 전송 시점부터 window_ms가 지났거나 버퍼가 max_bytes 이상이면 반환
+    - window_ms <= 0 이면 버퍼링을 끄고 매 delta를 그대로 반환
+    - 타이머 스레드가 없으므로 window 검사는 다음 delta가 도착할 때 이루어집니다.
+      상태 메시지 전송 전/스트림 종료 시에는 호출자가 flush()를 호출해야 합니다.
+    """
+
+    def __init__(self, window_ms: int = 40, max_bytes: int = 2048, clock=time.monotonic):
+        self.window = max(window_ms, 0) / 1000.0
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._parts: list[str] = []
+        self._size = 0
+        self._last_flush: float | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > 0
+
+    def push(self, text: str) -> str | None:
+        """delta를 버퍼에 추가하고, 내보낼 시점이면 누적된 문자열을 반환합니다."""
+        if not text:
+            return None
+
+        if not self.enabled or self._last_flush is None:
+            # 버퍼링 비활성화 또는 첫 토큰: 즉시 전송
+            self._last_flush = self._clock()
+            return text
+
+        self._parts.append(text)
+        self._size += len(text.encode("utf-8"))
+
+        if self._size >= self.max_bytes or self._clock() - self._last_flush >= self.window:
+            return self.flush()
+        return None
+
+    def flush(self) -> str | None:
+        """버퍼에 남아있는 delta를 모두 반환합니다. 비어있으면 None."""
+        if not self._parts:
+            return None
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        self._last_flush = self._clock()
+        return text
+
+
+class StreamRun:
+    """
+    하나의 답변(turn)에 대한 스트림 이벤트 버퍼.
+
+    LangGraph 실행은 백그라운드 스레드(producer)에서 publish()로 이벤트를 추가하고,
+    HTTP 응답(consumer)은 read_after()로 이벤트를 읽어갑니다. 클라이언트 연결이 끊겨도
+    producer는 계속 실행되므로, 재연결한 클라이언트는 마지막으로 받은 seq 이후부터 이어받습니다.
+
+    버퍼는 max_events 크기로 제한되며, 오래된 이벤트가 밀려나 이어받을 수 없는 경우
+    지금까지 누적된 답변 전체를 "content" 이벤트 하나로 대신 전달합니다.
+
+    연결된 consumer가 모두 떠난 뒤 abandon_grace초 안에 재연결이 없으면 on_abandon 콜백을
+    호출합니다 (producer 쪽에서 LLM 생성을 취소하는 데 사용).
+    """
+
+    def __init__(
+        self,
+        turn_id: int,
+        owner: dict,
+        max_events: int = 2000,
+        abandon_grace: float = 10.0,
+    ):
+        self.turn_id = turn_id
+        self.owner = owner  # conversation_id, user_id, session_id (재연결 권한 확인용)
+        self.text = ""  # 지금까지 전송된 delta 누적 텍스트
+        self.done = False
+        self.finished_at: float | None = None
+        self.abandon_grace = abandon_grace
+        self.on_abandon = None  # consumer가 모두 떠나고 grace가 지나면 호출할 콜백
+        self._events: deque = deque(maxlen=max_events)
+        self._next_seq = 1
+        self._consumers = 0
+        self._detach_generation = 0
+        self._cond = threading.Condition()
+
+    def event_id(self, seq: int) -> str:
+        return f"{self.turn_id}-{seq}"
+
+    def publish(self, payload: dict) -> int:
+        """이벤트를 버퍼에 추가하고 대기 중인 consumer를 깨웁니다."""
+        with self._cond:
+            seq = self._next_seq
+            self._next_seq += 1
+            self._events.append((seq, payload))
+            if payload.get("type") == "delta":
+                self.text += payload.get("content", "")
+            self._cond.notify_all()
+            return seq
+
+    def finish(self) -> None:
+        with self._cond:
+            self.done = True
+            self.finished_at = time.monotonic()
+            self._cond.notify_all()
+
+    def attach(self) -> None:
+        """HTTP 응답(consumer)이 스트림을 읽기 시작할 때 호출합니다."""
+        with self._cond:
+            self._consumers += 1
+            self._detach_generation += 1
+
+    def detach(self) -> None:
+        """
+        consumer 연결이 끝났을 때 호출합니다.
+        마지막 consumer가 떠났고 답변이 아직 생성 중이면 grace 타이머를 시작합니다.
+        """
+        with self._cond:
+            self._consumers -= 1
+            if self._consumers > 0 or self.done or self.on_abandon is None:
+                return
+            generation = self._detach_generation
+
+        if self.abandon_grace <= 0:
+            self._abandon_if_orphaned(generation)
+            return
+        timer = threading.Timer(
+            self.abandon_grace, self._abandon_if_orphaned, args=(generation,)
+        )
+        timer.daemon = True
+        timer.start()
+
+    def _abandon_if_orphaned(self, generation: int) -> None:
+        with self._cond:
+            # grace 동안 재연결(attach)이 있었거나 이미 완료되었으면 취소하지 않음
+            if (
+                self._consumers > 0
+                or self.done
+                or generation != self._detach_generation
+            ):
+                return
+            callback = self.on_abandon
+        if callback is not None:
+            callback()
+
+    def read_after(self, after_seq: int, timeout: float) -> tuple[list, bool]:
+        """
+        after_seq 이후의 이벤트 목록과 스트림 완료 여부를 반환합니다.
+        새 이벤트가 없으면 최대 timeout초 동안 대기합니다.
+        """
+        with self._cond:
+            if self._next_seq - 1 <= after_seq and not self.done:
+                self._cond.wait(timeout)
+
+            oldest = self._events[0][0] if self._events else self._next_seq
+            if after_seq + 1 < oldest:
+                # 버퍼에서 이미 밀려난 이벤트가 있음 → 누적 텍스트 스냅샷으로 대체하고
+                # 종료 이벤트(error/done)만 이어서 전달 (지나간 status는 의미가 없으므로 생략)
+                terminal = [
+                    (seq, p) for seq, p in self._events if p.get("type") in ("error", "done")
+                ]
+                # 스냅샷 id는 종료 이벤트보다 작아야 함 (SSE id 단조 증가, Last-Event-ID로 재연결 시 done 누락 방지)
+                # 종료 이벤트는 모든 delta 뒤에 발행되므로 그 직전 seq까지의 텍스트가 곧 누적 텍스트
+                snapshot_seq = terminal[0][0] - 1 if terminal else self._next_seq - 1
+                events = [(snapshot_seq, {"type": "content", "content": self.text})]
+                return events + terminal, self.done
+
+            return [(seq, p) for seq, p in self._events if seq > after_seq], self.done
+
+
+def iter_run_frames(run: StreamRun, after_seq: int = 0, keepalive: float = 15.0):
+    """
+    StreamRun의 이벤트를 SSE 프레임으로 변환하여 내보내는 제너레이터 (HTTP 응답용).
+    이벤트가 keepalive초 이상 없으면 keep-alive 주석 프레임을 보냅니다.
+
+    클라이언트 연결이 끊기면 WSGI 서버가 write 실패 후 응답을 close()하므로
+    finally 블록에서 detach()가 호출됩니다. keep-alive 프레임은 툴 실행처럼 이벤트가 없는
+    구간에서도 연결 끊김을 감지하는 역할을 겸합니다.
+    """
+    run.attach()
+    try:
+        last = after_seq
+        while True:
+            events, done = run.read_after(last, timeout=keepalive)
+            if not events:
+                if done:
+                    return
+                yield SSE_KEEPALIVE
+                continue
+            for seq, payload in events:
+                yield format_sse(payload, run.event_id(seq))
+            last = max(seq for seq, _ in events)
+    finally:
+        run.detach()
+
+
+class ReplayRegistry:
+    """
+    turn_id → StreamRun 매핑을 보관하는 프로세스 내 레지스트리.
+
+    - max_runs: 보관할 최대 스트림 수 (초과 시 완료된 스트림부터 오래된 순으로 제거)
+    - ttl: 완료된 스트림을 재연결용으로 보관하는 시간(초)
+    - max_events: 스트림 하나당 보관할 최대 이벤트 수
+    - abandon_grace: consumer가 모두 끊긴 뒤 재연결을 기다리는 시간(초)
+    """
+
+    def __init__(
+        self,
+        max_runs: int = 200,
+        ttl: float = 300.0,
+        max_events: int = 2000,
+        abandon_grace: float = 10.0,
+    ):
+        self.max_runs = max_runs
+        self.ttl = ttl
+        self.max_events = max_events
+        self.abandon_grace = abandon_grace
+        self._runs: "OrderedDict[int, StreamRun]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, turn_id: int, owner: dict) -> StreamRun:
+        run = StreamRun(
+            turn_id,
+            owner,
+            max_events=self.max_events,
+            abandon_grace=self.abandon_grace,
+        )
+        with self._lock:
+            self._evict()
+            self._runs[turn_id] = run
+        return run
+
+    def get(self, turn_id: int) -> StreamRun | None:
+        with self._lock:
+            self._evict()
+            return self._runs.get(turn_id)
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        expired = [
+            key
+            for key, run in self._runs.items()
+            if run.done and now - (run.finished_at or now) > self.ttl
+        ]
+        for key in expired:
+            del self._runs[key]
+
+        while self._runs and len(self._runs) >= self.max_runs:
+            finished = next((k for k, r in self._runs.items() if r.done), None)
+            # 모두 실행 중이면 가장 오래된 스트림을 제거 (이미 연결된 consumer는 참조를 유지하므로 안전)
+            self._runs.pop(finished if finished is not None else next(iter(self._runs)))
@@ -1,3 +1,261 @@
-from django.test import TestCase
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
 
-# Create your tests here.
+from django.conf import settings
+from django.test import SimpleTestCase
+
+# 임포트만으로 로딩되면 안 되는 모듈 (LLM/임베딩 클라이언트, Pinecone, LangGraph 그래프, DB 드라이버)
+LAZY_MODULES = (
+    "openai",
+    "langchain_openai",
+    "pinecone",
+    "langchain_pinecone",
+    "langgraph",
+    "backend.graph.nodes",
+    "pymysql",
+)
+
+IMPORT_PROBE = """
+import json, sys
+import django
+django.setup()
+import unigo_app.views
+from backend.db import connection
+print(json.dumps({"modules": sorted(sys.modules), "engine_created": connection._engine is not None}))
+"""
+
+
+def _profile_import():
+    """python -X importtime으로 unigo_app.views를 임포트하고 (누적 시간 ms, 프로브 결과)를 반환"""
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "unigo.settings")}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_PROBE],
+        cwd=settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if completed.returncode != 0:
+        raise AssertionError(completed.stderr[-2000:])
+
+    cumulative_us = None
+    for line in completed.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if line.startswith("import time:") and line.rstrip().endswith("| unigo_app.views"):
+            cumulative_us = int(line.split("|")[1])
+    # django.setup() 중에 이미 임포트되었으면 해당 줄이 없음 → 측정할 수 없으므로 명확하게 실패
+    if cumulative_us is None:
+        raise AssertionError("importtime 출력에 unigo_app.views가 없음 (django.setup() 중 이미 임포트되었을 수 있음)")
+    probe = json.loads(completed.stdout.strip().splitlines()[-1])
+    return cumulative_us / 1000, probe
+
+
+class ImportTimeBudgetTests(SimpleTestCase):
+    """unigo_app.views 임포트가 무거운 싱글톤을 만들지 않고 시간 예산 안에 끝나는지 확인"""
+
+    # -X importtime 측정값 기준 (측정 자체의 오버헤드 포함). 느린 환경에서는 IMPORT_TIME_BUDGET_MS로 조정
+    budget_ms = float(os.getenv("IMPORT_TIME_BUDGET_MS", "1500"))
+
+    def test_views_import_is_lazy(self):
+        _, probe = _profile_import()
+        loaded = [
+            name for name in LAZY_MODULES
+            if name in probe["modules"] or any(m.startswith(name + ".") for m in probe["modules"])
+        ]
+        self.assertEqual(loaded, [], f"임포트 시점에 로딩됨: {loaded}")
+        self.assertFalse(probe["engine_created"], "임포트 시점에 DB 엔진이 생성됨")
+
+    def test_views_import_time_budget(self):
+        # 디스크 캐시 등 잡음을 줄이기 위해 3회 중 최솟값으로 판단
+        elapsed_ms = min(_profile_import()[0] for _ in range(3))
+        self.assertLessEqual(
+            elapsed_ms,
+            self.budget_ms,
+            f"unigo_app.views 임포트 {elapsed_ms:.0f}ms > 예산 {self.budget_ms:.0f}ms",
+        )
+
+
+class JsonStreamTests(SimpleTestCase):
+    """backend.db.json_stream.iter_json_array: 청크 경계, 잘못된 배열"""
+
+    def _iter(self, text, read_size=4):
+        from backend.db.json_stream import iter_json_array
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.json"
+            path.write_text(text, encoding="utf-8")
+            return list(iter_json_array(path, read_size=read_size))
+
+    def test_elements_split_across_chunks(self):
+        items = [{"major_id": str(i), "name": "컴퓨터공학과" * i, "score": 12345.678} for i in range(20)]
+        text = json.dumps(items, ensure_ascii=False, indent=2)
+        for read_size in (1, 3, 7, 64):
+            self.assertEqual(self._iter(text, read_size), items)
+
+    def test_number_at_chunk_boundary(self):
+        # 숫자가 버퍼 끝에서 끝나면 다음 청크까지 읽어 이어지는지 확인
+        self.assertEqual(self._iter("[1234567, 89]", read_size=5), [1234567, 89])
+
+    def test_empty_array(self):
+        self.assertEqual(self._iter(" [ ] "), [])
+
+    def test_malformed_arrays(self):
+        for text in ('{"a": 1}', "[1,]", "[1,,2]", "[1 2]", "[1, 2", '[{"a": 1}', ""):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    self._iter(text)
+
+
+class BulkUpsertTests(SimpleTestCase):
+    """backend.db.bulk: SQLite ON CONFLICT 업서트, 복합 키 fallback, sync_rows"""
+
+    def setUp(self):
+        from sqlalchemy import Column, Integer, MetaData, String, Table, UniqueConstraint, create_engine
+
+        self.engine = create_engine("sqlite://")
+        metadata = MetaData()
+        self.single = Table(
+            "single", metadata, Column("key", String, unique=True), Column("value", String)
+        )
+        self.composite = Table(
+            "composite",
+            metadata,
+            Column("a", String),
+            Column("b", Integer),
+            Column("value", String),
+            UniqueConstraint("a", "b"),
+        )
+        metadata.create_all(self.engine)
+
+    def _rows(self, table):
+        from sqlalchemy import select
+
+        with self.engine.connect() as conn:
+            return sorted(tuple(row) for row in conn.execute(select(table)))
+
+    def test_sqlite_on_conflict_upsert(self):
+        from backend.db.bulk import bulk_upsert
+
+        with self.engine.begin() as conn:
+            bulk_upsert(conn, self.single, [{"key": "a", "value": "1"}, {"key": "b", "value": "2"}], ["key"])
+        with self.engine.begin() as conn:
+            # 같은 청크 안의 중복 키는 마지막 행 기준, chunk_size보다 많은 행도 처리
+            written = bulk_upsert(
+                conn,
+                self.single,
+                [{"key": "a", "value": "x"}, {"key": "a", "value": "9"}, {"key": "c", "value": "3"}],
+                ["key"],
+                chunk_size=2,
+            )
+        # 첫 청크([a, a])는 중복 제거 후 1행 + 두 번째 청크 1행
+        self.assertEqual(written, 2)
+        self.assertEqual(self._rows(self.single), [("a", "9"), ("b", "2"), ("c", "3")])
+
+    def test_fallback_upsert_composite_key(self):
+        from backend.db.bulk import _upsert_fallback
+
+        with self.engine.begin() as conn:
+            _upsert_fallback(
+                conn, self.composite,
+                [{"a": "x", "b": 1, "value": "1"}, {"a": "x", "b": 2, "value": "2"}],
+                ["a", "b"], ["value"],
+            )
+            _upsert_fallback(
+                conn, self.composite,
+                [{"a": "x", "b": 1, "value": "9"}, {"a": "y", "b": 1, "value": "3"}],
+                ["a", "b"], ["value"],
+            )
+        self.assertEqual(
+            self._rows(self.composite), [("x", 1, "9"), ("x", 2, "2"), ("y", 1, "3")]
+        )
+
+    def test_sync_rows_updates_only_changed(self):
+        from backend.db.bulk import sync_rows
+
+        with self.engine.begin() as conn:
+            sync_rows(conn, self.single, [{"key": "a", "value": "1"}, {"key": "b", "value": "2"}], "key")
+        with self.engine.begin() as conn:
+            result = sync_rows(
+                conn, self.single,
+                [{"key": "a", "value": "1"}, {"key": "b", "value": "5"}, {"key": "c", "value": "3"}],
+                "key",
+            )
+        self.assertEqual((result.inserted, result.updated, result.unchanged), (1, 1, 1))
+        self.assertEqual(self._rows(self.single), [("a", "1"), ("b", "5"), ("c", "3")])
+
+
+class LLMSchedulerTests(SimpleTestCase):
+    """backend.scheduler.LLMScheduler: 사용자별 제한, 우선순위, 슬롯 반환"""
+
+    def _wait_for_waiting(self, scheduler, count):
+        deadline = time.monotonic() + 5
+        while scheduler.waiting < count:
+            self.assertLess(time.monotonic(), deadline, "대기열에 들어가지 않음")
+            time.sleep(0.01)
+
+    def test_rejects_when_per_user_limit_exceeded(self):
+        from backend.scheduler import AdmissionRejected, LLMScheduler, PRIORITY_CHAT
+
+        scheduler = LLMScheduler(max_concurrency=4, per_user_limit=1, queue_timeout=5)
+        scheduler.acquire(PRIORITY_CHAT, "user:1")
+        # 실행 1 + 대기 1까지 허용 (per_user_limit * 2)
+        waiter = threading.Thread(target=scheduler.acquire, args=(PRIORITY_CHAT, "user:1"), daemon=True)
+        waiter.start()
+        self._wait_for_waiting(scheduler, 1)
+
+        with self.assertRaises(AdmissionRejected) as ctx:
+            scheduler.acquire(PRIORITY_CHAT, "user:1")
+        self.assertEqual(ctx.exception.reason, "user_limit")
+        with self.assertRaises(AdmissionRejected):
+            scheduler.check_admission(PRIORITY_CHAT, "user:1")
+        # 다른 사용자는 영향 없음
+        scheduler.check_admission(PRIORITY_CHAT, "user:2")
+
+        scheduler.release("user:1")
+        waiter.join(timeout=5)
+        self.assertFalse(waiter.is_alive())
+
+    def test_high_priority_waiter_runs_first(self):
+        from backend.scheduler import LLMScheduler, PRIORITY_CHAT, PRIORITY_SUMMARY
+
+        scheduler = LLMScheduler(max_concurrency=1, per_user_limit=4, queue_timeout=5)
+        scheduler.acquire(PRIORITY_CHAT)
+        order = []
+
+        def run(priority, name):
+            with scheduler.slot(priority):
+                order.append(name)
+
+        # 낮은 우선순위가 먼저 대기열에 들어가도 높은 우선순위가 먼저 실행되어야 함
+        low = threading.Thread(target=run, args=(PRIORITY_SUMMARY, "summary"), daemon=True)
+        low.start()
+        self._wait_for_waiting(scheduler, 1)
+        high = threading.Thread(target=run, args=(PRIORITY_CHAT, "chat"), daemon=True)
+        high.start()
+        self._wait_for_waiting(scheduler, 2)
+
+        scheduler.release()
+        low.join(timeout=5)
+        high.join(timeout=5)
+        self.assertEqual(order, ["chat", "summary"])
+
+    def test_slot_released_when_body_raises(self):
+        from backend.scheduler import LLMScheduler, PRIORITY_CHAT
+
+        scheduler = LLMScheduler(max_concurrency=1, per_user_limit=1, queue_timeout=0.1)
+        with self.assertRaises(RuntimeError):
+            with scheduler.slot(PRIORITY_CHAT, "user:1"):
+                raise RuntimeError("llm failed")
+
+        self.assertEqual(scheduler.running, 0)
+        self.assertEqual(scheduler.waiting, 0)
+        # 슬롯이 반환되었으므로 같은 사용자가 바로 다시 획득 가능
+        with scheduler.slot(PRIORITY_CHAT, "user:1"):
+            self.assertEqual(scheduler.running, 1)
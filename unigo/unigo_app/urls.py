@@ -35,6 +35,7 @@ urlpatterns = [
     path("api/setting/delete", views.delete_account, name="delete_account"),
     # 기능 API
     path("api/chat", views.chat_api, name="chat_api"),
+    path("api/chat/resume", views.chat_resume, name="chat_resume"),
     path("api/chat/history", views.chat_history, name="chat_history"),
     path("api/chat/save", views.save_chat_history, name="save_chat_history"),
     path("api/chat/list", views.list_conversations, name="list_conversations"),
@@ -51,4 +52,8 @@ urlpatterns = [
         name="delete_conversation",
     ),
     path("api/onboarding", views.onboarding_api, name="onboarding_api"),
+    # 운영 지표 (Prometheus)
+    path("metrics", views.prometheus_metrics, name="prometheus_metrics"),
+    # 워커 준비 상태 (워밍업 완료 여부)
+    path("readyz", views.readiness, name="readiness"),
 ]
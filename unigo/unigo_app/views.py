@@ -1,5 +1,5 @@
 from django.shortcuts import render, redirect
-from django.http import JsonResponse, StreamingHttpResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.contrib.auth import authenticate, login, logout, update_session_auth_hash
 from django.contrib.auth.models import User
 import json
@@ -8,12 +8,24 @@ import os
 import uuid
 import logging
 import time
+import threading
+import contextvars
+from django.conf import settings
+from django.db import close_old_connections
 from django.contrib.auth.decorators import login_required
 
 logger = logging.getLogger("unigo_app")
 
 # 모델
 from .models import Conversation, Message, MajorRecommendation, UserProfile
+from . import markdown_stream
+from .streaming import (
+    DeltaCoalescer,
+    ReplayRegistry,
+    format_sse,
+    iter_run_frames,
+    parse_event_id,
+)
 
 # 백엔드 임포트를 위해 프론트엔드 루트를 경로에 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -26,11 +38,61 @@ if frontend_dir not in sys.path:
 try:
     from backend.main import run_mentor_stream, run_major_recommendation
     from backend.rag.tools import summarize_conversation_history
+    from backend.graph.cancellation import (
+        CancellationCallbackHandler,
+        CancellationToken,
+        RunCancelled,
+        current_token,
+    )
+    from backend import metrics, tracing, warmup
+    from backend.llm_metrics import UsageTracker
+    from backend.scheduler import (
+        PRIORITY_CHAT,
+        PRIORITY_ONBOARDING,
+        PRIORITY_SUMMARY,
+        AdmissionRejected,
+        bind as bind_llm_scheduling,
+        get_scheduler,
+        scheduling_context,
+    )
 except ImportError as e:
     logger.error(f"Backend import failed: {e}")
     run_mentor_stream = None
     run_major_recommendation = None
     summarize_conversation_history = None
+    get_scheduler = None
+    warmup = None
+
+    class AdmissionRejected(Exception):
+        """백엔드 미연결 시 except 절에서 참조하기 위한 대체 클래스"""
+
+
+def _llm_user_key(request, session_id=None):
+    """
+    LLM 스케줄러의 사용자별 동시 실행 제한에 사용할 키
+    로그인 사용자는 user ID, 비로그인 사용자는 세션 ID 또는 클라이언트 IP를 사용합니다.
+    """
+    if request.user.is_authenticated:
+        return f"user:{request.user.id}"
+    if session_id:
+        return f"session:{session_id}"
+    # nginx가 X-Forwarded-For 마지막에 실제 접속 IP를 추가하므로 마지막 값을 사용
+    forwarded = request.META.get("HTTP_X_FORWARDED_FOR", "")
+    ip = forwarded.split(",")[-1].strip() or request.META.get("REMOTE_ADDR", "")
+    return f"ip:{ip}"
+
+
+def _too_many_requests(error):
+    """AdmissionRejected → 429 응답 변환"""
+    response = JsonResponse(
+        {
+            "error": "현재 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            "reason": error.reason,
+        },
+        status=429,
+    )
+    response["Retry-After"] = str(error.retry_after)
+    return response
 
 
 # ============================================
@@ -556,17 +618,89 @@ def delete_account(request):
 # ============================================
 
 
-def stream_chat_responses(conversation, message_text, chat_history_for_ai):
-    """채팅 응답을 스트리밍하는 제너레이터"""
-
-    if not run_mentor_stream:
-        error_msg = "챗봇 백엔드가 연결되지 않았습니다. 관리자에게 문의하세요."
+# 답변 스트림 replay 버퍼 (프로세스 내, 재연결 시 Last-Event-ID 이후부터 이어받기용)
+_replay_registry = ReplayRegistry(
+    max_runs=settings.CHAT_STREAM_REPLAY_RUNS,
+    ttl=settings.CHAT_STREAM_REPLAY_TTL,
+    max_events=settings.CHAT_STREAM_REPLAY_EVENTS,
+    abandon_grace=settings.CHAT_STREAM_CANCEL_GRACE,
+)
 
-        yield f"data: {json.dumps({'type': 'error', 'content': error_msg})}\n\n"
 
-        return
+def _publish_chat_events(
+    run, conversation, message_text, chat_history_for_ai, llm_user_key=None
+):
+    """
+    LangGraph 실행 결과를 StreamRun에 이벤트로 기록하는 producer (백그라운드 스레드에서 실행)
 
+    연결이 잠깐 끊긴 경우에는 답변 생성을 계속 진행하여 재연결한 클라이언트가 이어받을 수 있게 하고,
+    CHAT_STREAM_CANCEL_GRACE초 동안 재연결이 없으면 LLM 생성과 툴 실행을 취소합니다.
+    취소된 경우에도 그때까지 생성된 답변은 metadata={"cancelled": True}로 저장합니다.
+    저장하는 답변의 metadata["usage"]에는 이 턴의 토큰 사용량, 툴 호출 수, 지연 시간을 기록하고
+    대화(Conversation)의 누적 사용량에 더합니다.
+    """
     full_response_content = ""
+    generated_tokens = 0  # 수신한 토큰 청크 수 (절약한 토큰 추정용)
+    started = time.perf_counter()
+    first_delta_at = None
+    outcome = "completed"  # chat_turn_duration_seconds 라벨
+    metrics.add_gauge("chat_runs_active", 1)
+
+    # 클라이언트가 떠나면 취소 토큰을 설정 → 콜백 핸들러가 다음 토큰/툴 시작 시점에 실행 중단
+    token = CancellationToken()
+    run.on_abandon = lambda: token.cancel("client disconnected")
+    current_token.set(token)
+    stream = None
+    # 이 턴의 LLM/툴 호출 사용량 집계 (툴 내부의 LLM 호출 포함)
+    usage = UsageTracker()
+
+    # 이 스레드에서 발생하는 LLM 호출은 채팅 우선순위로 스케줄링
+    bind_llm_scheduling(PRIORITY_CHAT, llm_user_key)
+
+    # 토큰 delta를 시간/바이트 단위로 묶어서 전송 (write 횟수 감소, 첫 토큰은 즉시 전송)
+    coalescer = DeltaCoalescer(
+        window_ms=settings.CHAT_STREAM_COALESCE_MS,
+        max_bytes=settings.CHAT_STREAM_COALESCE_BYTES,
+    )
+
+    # 완성된 마크다운 블록을 HTML로 미리 렌더링하여 전송 (markdown 패키지가 있을 때만)
+    renderer = None
+    if settings.CHAT_STREAM_MARKDOWN_BLOCKS and markdown_stream.is_available():
+        renderer = markdown_stream.IncrementalMarkdownRenderer()
+
+    def publish_delta(text):
+        nonlocal first_delta_at
+        if first_delta_at is None:
+            first_delta_at = time.perf_counter()
+            metrics.observe("chat_first_delta_seconds", first_delta_at - started)
+        run.publish({"type": "delta", "content": text})
+        if renderer:
+            for block in renderer.feed(text):
+                run.publish(block)
+
+    def flush_pending():
+        pending = coalescer.flush()
+        if pending:
+            publish_delta(pending)
+
+    def save_answer(content, **metadata):
+        """답변을 사용량과 함께 저장하고 대화 누적 사용량을 갱신"""
+        now = time.perf_counter()
+        metadata["usage"] = usage.summary(
+            latency_ms=round((now - started) * 1000, 1),
+            first_delta_ms=(
+                round((first_delta_at - started) * 1000, 1)
+                if first_delta_at is not None
+                else None
+            ),
+        )
+        Message.objects.create(
+            conversation=conversation,
+            role="assistant",
+            content=content,
+            metadata=metadata,
+        )
+        conversation.add_usage(metadata["usage"])
 
     try:
         # [수정] stream_mode=["messages", "updates"] 로 토큰 스트리밍과 상태 업데이트를 모두 받음
@@ -575,9 +709,12 @@ def stream_chat_responses(conversation, message_text, chat_history_for_ai):
             chat_history=chat_history_for_ai,
             mode="react",
             stream_mode=["messages", "updates"],
+            config={"callbacks": [CancellationCallbackHandler(token), usage]},
         )
 
         for mode, chunk in stream:
+            token.raise_if_cancelled()
+
             # 1. 메시지 스트리밍 (토큰 단위)
             if mode == "messages":
                 message, metadata = chunk
@@ -604,8 +741,10 @@ def stream_chat_responses(conversation, message_text, chat_history_for_ai):
                     if not content_str:
                         continue
 
-                    data = {"type": "delta", "content": content_str}
-                    yield f"data: {json.dumps(data)}\n\n"
+                    generated_tokens += 1
+                    pending = coalescer.push(content_str)
+                    if pending:
+                        publish_delta(pending)
 
             # 2. 상태 업데이트 (툴 호출 등 확인)
             elif mode == "updates":
@@ -625,30 +764,156 @@ def stream_chat_responses(conversation, message_text, chat_history_for_ai):
                                 call["name"] for call in last_ai_message.tool_calls
                             ]
                             status_message = f"Tool: {', '.join(tool_names)}"
-                            data = {"type": "status", "content": status_message}
-                            yield f"data: {json.dumps(data)}\n\n"
+                            # 상태 메시지보다 먼저 생성된 텍스트가 늦게 도착하지 않도록 버퍼를 비움
+                            flush_pending()
+                            run.publish({"type": "status", "content": status_message})
 
                         # [중요] DB 저장을 위해 최종 답변 업데이트 (마지막 메시지 기준)
                         if last_ai_message.content:
                             full_response_content = last_ai_message.content
 
+        # 버퍼에 남은 마지막 delta 전송
+        flush_pending()
+        if renderer:
+            for block in renderer.finish():
+                run.publish(block)
+
+        # 전체 응답 DB 저장
+        if full_response_content:
+            save_answer(full_response_content)
+
+            logger.info(
+                f"Streamed response saved to DB for conversation {conversation.id}"
+            )
+
+        metrics.inc("chat_runs_completed_total")
+        metrics.observe_avg("chat_completion_tokens", generated_tokens)
+        tracing.set_attribute("chat.generated_chunks", generated_tokens)
+
+    except RunCancelled:
+        outcome = "cancelled"
+        flush_pending()
+
+        # 평소 답변 길이(이동 평균) 대비 생성하지 않은 토큰 수를 절약량으로 추정
+        expected = metrics.get("chat_completion_tokens")
+        metrics.inc("chat_runs_cancelled_total")
+        metrics.inc("chat_tokens_saved_total", max(expected - generated_tokens, 0))
+        tracing.set_attribute("chat.cancelled", True)
+        logger.info(
+            f"Chat run cancelled for conversation {conversation.id} "
+            f"({token.reason}, {generated_tokens} tokens generated)"
+        )
+
+        # 사용자에게 이미 전송된 부분 답변 저장
+        if run.text:
+            save_answer(run.text, cancelled=True, reason=token.reason)
+
+    except AdmissionRejected as e:
+        outcome = "rejected"
+        logger.warning(f"AI Stream rejected by LLM scheduler: {e.reason}")
+
+        flush_pending()
+        run.publish(
+            {
+                "type": "error",
+                "content": "현재 요청이 많아 답변이 지연되고 있습니다. 잠시 후 다시 시도해주세요.",
+            }
+        )
+
     except Exception as e:
+        outcome = "error"
         logger.error(f"AI Stream Error: {e}", exc_info=True)
 
-        data = {"type": "error", "content": "AI 서버에서 오류가 발생했습니다."}
+        flush_pending()
+        run.publish({"type": "error", "content": "AI 서버에서 오류가 발생했습니다."})
+
+    finally:
+        # 취소/에러로 중단된 경우 LangGraph 스트림(및 진행 중인 LLM 호출)을 정리
+        if stream is not None:
+            stream.close()
+
+        # 클라이언트가 정상 종료와 연결 끊김을 구분할 수 있도록 완료 이벤트 전송
+        run.publish({"type": "done"})
+        run.finish()
+        # 백그라운드 스레드에서 연 DB 커넥션 정리
+        close_old_connections()
+
+        metrics.add_gauge("chat_runs_active", -1)
+        metrics.observe(
+            "chat_turn_duration_seconds",
+            time.perf_counter() - started,
+            labels={"outcome": outcome},
+        )
 
-        yield f"data: {json.dumps(data)}\n\n"
 
-        return
+def _traced_chat_events(turn_id, run, conversation, *args):
+    """_publish_chat_events를 채팅 턴 트레이스(루트 span)로 감싸서 실행합니다."""
+    with tracing.start_trace(
+        "chat.turn",
+        baggage={"conversation.id": conversation.id},
+        **{"turn.id": turn_id, "session.id": conversation.session_id},
+    ):
+        _publish_chat_events(run, conversation, *args)
 
-    # 전체 응답 DB 저장
 
-    if full_response_content:
-        Message.objects.create(
-            conversation=conversation, role="assistant", content=full_response_content
-        )
+def stream_chat_responses(
+    conversation, message_text, chat_history_for_ai, turn_id, llm_user_key=None
+):
+    """
+    채팅 응답을 스트리밍하는 제너레이터
 
-        logger.info(f"Streamed response saved to DB for conversation {conversation.id}")
+    답변 생성은 백그라운드 스레드에서 실행되고, 이 제너레이터는 replay 버퍼의 이벤트를
+    SSE 프레임으로 전달합니다. 각 프레임에는 "{turn_id}-{seq}" 형태의 이벤트 ID가 붙습니다.
+    """
+
+    if not run_mentor_stream:
+        error_msg = "챗봇 백엔드가 연결되지 않았습니다. 관리자에게 문의하세요."
+
+        yield format_sse({"type": "error", "content": error_msg})
+
+        return
+
+    run = _replay_registry.create(
+        turn_id,
+        owner={
+            "conversation_id": conversation.id,
+            "user_id": conversation.user_id,
+            "session_id": conversation.session_id,
+        },
+    )
+
+    # 요청 컨텍스트(contextvars)를 그대로 이어받아 백그라운드에서 실행
+    ctx = contextvars.copy_context()
+    threading.Thread(
+        target=ctx.run,
+        args=(
+            _traced_chat_events,
+            turn_id,
+            run,
+            conversation,
+            message_text,
+            chat_history_for_ai,
+            llm_user_key,
+        ),
+        name=f"chat-stream-{turn_id}",
+        daemon=True,
+    ).start()
+
+    yield from _counted_stream(
+        iter_run_frames(run, keepalive=settings.CHAT_STREAM_KEEPALIVE)
+    )
+
+
+def _counted_stream(frames):
+    """
+    SSE 프레임을 그대로 전달하면서 열려 있는 스트림 수(sse_streams_active 게이지)를 기록합니다.
+    클라이언트 연결이 끊겨 응답이 close()되면 finally에서 감소합니다.
+    """
+    metrics.add_gauge("sse_streams_active", 1)
+    try:
+        yield from frames
+    finally:
+        metrics.add_gauge("sse_streams_active", -1)
 
 
 def chat_api(request):
@@ -684,6 +949,14 @@ def chat_api(request):
         if not message_text:
             return JsonResponse({"error": "Empty message"}, status=400)
 
+        # LLM 대기열이 가득 찼으면 스트림을 시작하기 전에 바로 거절 (429)
+        llm_user_key = _llm_user_key(request, session_id)
+        if get_scheduler:
+            try:
+                get_scheduler().check_admission(PRIORITY_CHAT, llm_user_key)
+            except AdmissionRejected as e:
+                return _too_many_requests(e)
+
         # 1. 대화 세션 찾기 또는 생성
         conversation = None
         if request.user.is_authenticated:
@@ -711,8 +984,8 @@ def chat_api(request):
                 session_id=session_id, defaults={"title": message_text[:20]}
             )
 
-        # 2. 사용자 메시지 DB 저장
-        Message.objects.create(
+        # 2. 사용자 메시지 DB 저장 (메시지 ID를 스트림 재연결용 turn ID로 사용)
+        user_message = Message.objects.create(
             conversation=conversation, role="user", content=message_text
         )
 
@@ -724,13 +997,20 @@ def chat_api(request):
 
         # 4. 스트리밍 응답 생성 및 반환
         response = StreamingHttpResponse(
-            stream_chat_responses(conversation, message_text, chat_history_for_ai),
+            stream_chat_responses(
+                conversation,
+                message_text,
+                chat_history_for_ai,
+                user_message.id,
+                llm_user_key,
+            ),
             content_type="text/event-stream",
         )
         response["Cache-Control"] = "no-cache"
 
         # conversation_id를 헤더로 전달 (클라이언트가 첫 메시지 후 ID를 알 수 있도록)
         response["X-Conversation-Id"] = conversation.id
+        response["X-Turn-Id"] = user_message.id
         if not request.user.is_authenticated:
             response["X-Session-Id"] = conversation.session_id
 
@@ -741,6 +1021,135 @@ def chat_api(request):
         return JsonResponse({"error": str(e)}, status=500)
 
 
+def chat_resume(request):
+    """
+    끊긴 채팅 스트림 재연결 API (Last-Event-ID 기반 replay)
+
+    클라이언트가 마지막으로 받은 이벤트 ID("{turn_id}-{seq}")를 `Last-Event-ID` 헤더로 보내면,
+    백그라운드에서 계속 실행 중인(또는 완료된) 답변 스트림을 그 이후부터 이어서 전송합니다.
+    버퍼가 만료되었더라도 답변이 이미 DB에 저장되어 있으면 전체 답변을 한 번에 반환합니다.
+
+    Args:
+        request (HttpRequest): GET 요청
+            - Last-Event-ID 헤더 (또는 last_event_id 쿼리 파라미터)
+            - session_id (str): 비로그인 사용자 식별용
+
+    Returns:
+        StreamingHttpResponse | JsonResponse: SSE 스트림 또는 에러 (404: 스트림 없음, 503: 백엔드 미연결)
+    """
+    if request.method != "GET":
+        return JsonResponse({"error": "Method not allowed"}, status=405)
+
+    # 백엔드 임포트 실패 시 metrics 등이 정의되지 않으므로 chat_api와 같이 먼저 거절
+    if not run_mentor_stream:
+        return JsonResponse({"error": "Backend not available"}, status=503)
+
+    last_event_id = request.headers.get("Last-Event-ID") or request.GET.get(
+        "last_event_id", ""
+    )
+    turn_id, after_seq = parse_event_id(last_event_id)
+    if turn_id is None:
+        return JsonResponse({"error": "Invalid Last-Event-ID"}, status=400)
+
+    session_id = request.GET.get("session_id")
+    user_id = request.user.id if request.user.is_authenticated else None
+
+    def is_owner(owner_user_id, owner_session_id):
+        if owner_user_id is not None:
+            return owner_user_id == user_id
+        return bool(session_id) and session_id == owner_session_id
+
+    run = _replay_registry.get(turn_id)
+    metrics.cache_access("sse_replay", hit=run is not None)
+    if run is not None:
+        if not is_owner(run.owner["user_id"], run.owner["session_id"]):
+            return JsonResponse({"error": "Stream not found"}, status=404)
+        frames = _counted_stream(
+            iter_run_frames(
+                run, after_seq=after_seq, keepalive=settings.CHAT_STREAM_KEEPALIVE
+            )
+        )
+    else:
+        # 버퍼가 만료되었거나 다른 워커에서 실행된 경우: 저장된 답변으로 대체
+        user_message = (
+            Message.objects.filter(id=turn_id, role="user")
+            .select_related("conversation")
+            .first()
+        )
+        if user_message is None or not is_owner(
+            user_message.conversation.user_id, user_message.conversation.session_id
+        ):
+            return JsonResponse({"error": "Stream not found"}, status=404)
+
+        answer = (
+            user_message.conversation.messages.filter(
+                role="assistant", id__gt=user_message.id
+            )
+            .order_by("id")
+            .first()
+        )
+        if answer is None:
+            return JsonResponse({"error": "Stream not found"}, status=404)
+
+        frames = [
+            format_sse({"type": "content", "content": answer.content}),
+            format_sse({"type": "done"}),
+        ]
+
+    response = StreamingHttpResponse(frames, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    return response
+
+
+def prometheus_metrics(request):
+    """
+    워커 프로세스의 운영 지표를 Prometheus 텍스트 형식으로 반환하는 API (/metrics)
+
+    METRICS_TOKEN이 설정되어 있으면 `Authorization: Bearer <token>` 헤더가 일치해야 합니다.
+    지표는 워커 프로세스 단위이므로 워커가 여러 개면 스크랩할 때마다 다른 워커의 값이 보일 수 있습니다.
+
+    Returns:
+        HttpResponse | JsonResponse: 지표 텍스트 또는 에러 (403: 토큰 불일치, 404: 비활성화)
+    """
+    if request.method != "GET":
+        return JsonResponse({"error": "Method not allowed"}, status=405)
+
+    if not settings.METRICS_ENABLED or not run_mentor_stream:
+        return JsonResponse({"error": "Not found"}, status=404)
+
+    if settings.METRICS_TOKEN:
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        if request.headers.get("Authorization", "") != expected:
+            return JsonResponse({"error": "Forbidden"}, status=403)
+
+    return HttpResponse(
+        metrics.render_prometheus(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+def readiness(request):
+    """
+    워커 준비 상태 API (/readyz)
+
+    gunicorn post_worker_init 훅의 워밍업(backend/warmup.py)이 끝난 워커만 200을 반환합니다.
+    워커 프로세스 단위 상태이므로 워커가 여러 개면 요청을 받은 워커의 상태입니다.
+    워밍업이 실패한 워커는 재시도 시각이 지났으면 실패한 단계를 백그라운드에서 다시 실행합니다.
+
+    Returns:
+        JsonResponse: {"status": cold|warming|ready|failed|disabled, "duration_ms", "steps"} (200: 준비됨, 503: 그 외)
+    """
+    if request.method != "GET":
+        return JsonResponse({"error": "Method not allowed"}, status=405)
+
+    if not warmup:
+        return JsonResponse({"status": "unavailable", "error": "Backend not available"}, status=503)
+
+    warmup.retry_failed_steps()
+    status = warmup.get_status()
+    return JsonResponse(status, status=200 if status["status"] in warmup.READY_STATUSES else 503)
+
+
 @login_required
 def chat_history(request):
     """
@@ -972,7 +1381,10 @@ def onboarding_api(request):
         if not run_major_recommendation:
             return JsonResponse({"error": "Backend not available"}, status=503)
 
-        result = run_major_recommendation(onboarding_answers=answers)
+        with scheduling_context(
+            PRIORITY_ONBOARDING, _llm_user_key(request, session_id)
+        ):
+            result = run_major_recommendation(onboarding_answers=answers)
 
         # 1. Conversation 생성 또는 검색
         user = request.user if request.user.is_authenticated else None
@@ -1063,6 +1475,9 @@ def onboarding_api(request):
 
         return JsonResponse(result)
 
+    except AdmissionRejected as e:
+        return _too_many_requests(e)
+
     except Exception as e:
         logger.error(f"Error in onboarding_api: {e}", exc_info=True)
         return JsonResponse({"error": str(e)}, status=500)
@@ -1090,9 +1505,13 @@ def summarize_conversation(request):
         if not summarize_conversation_history:
             return JsonResponse({"error": "Backend not available"}, status=503)
 
-        summary = summarize_conversation_history(chat_history)
+        with scheduling_context(PRIORITY_SUMMARY, _llm_user_key(request)):
+            summary = summarize_conversation_history(chat_history)
         return JsonResponse({"summary": summary})
 
+    except AdmissionRejected as e:
+        return _too_many_requests(e)
+
     except Exception as e:
         logger.error(f"Error in summarize_chat: {e}", exc_info=True)
         return JsonResponse({"error": str(e)}, status=500)